@@ -28,19 +28,80 @@ short_description: Use sonic cliconf to run command on Dell OS10 platform
 description:
   - This sonic plugin provides low level abstraction apis for
     sending and receiving CLI commands from Dell OS10 network devices.
+options:
+  sonic_config_batch_size:
+    description:
+      - Specifies the maximum number of configuration commands written to the device
+        in a single round trip by C(edit_config).
+      - The output of each batch is checked for errors after the whole batch is processed
+        by the device, so the commands following a failing command in the same batch are
+        still applied. The failing command is reported in the error message.
+      - Commands that expect a prompt/answer exchange are always sent individually.
+      - If set to 0 or 1, each command is sent individually and waits for the prompt.
+    type: int
+    default: 0
+    version_added: 2.3.0
+    env:
+      - name: ANSIBLE_SONIC_CONFIG_BATCH_SIZE
+    vars:
+      - name: ansible_sonic_config_batch_size
+  sonic_config_section_retrieval:
+    description:
+      - Specifies whether the block of the running configuration under a C(parents)
+        context is retrieved with the section-filtered form of C(show running-config)
+        (for example C(show running-config bgp) for C(router bgp)) instead of the
+        complete running configuration.
+      - The complete running configuration is retrieved when no section-filtered
+        form applies to the C(parents) context or when the device rejects it.
+      - Section-filtered forms are used for C(router bgp), C(route-map), C(ip access-list),
+        C(ipv6 access-list), C(mac access-list) and the Ethernet and Vlan C(interface) blocks.
+    type: bool
+    default: false
+    version_added: 2.3.0
+    env:
+      - name: ANSIBLE_SONIC_CONFIG_SECTION_RETRIEVAL
+    vars:
+      - name: ansible_sonic_config_section_retrieval
 """
 
 import json
+import re
 
 from ansible.errors import AnsibleConnectionFailure
 from ansible.module_utils._text import to_bytes, to_text
 from ansible.module_utils.common._collections_compat import Mapping
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_list
 from ansible.plugins.cliconf import CliconfBase, enable_mode
+from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import NetworkConfig
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import get_sublevel_config_from_obj
+from ansible_collections.dellemc.enterprise_sonic.plugins.terminal.sonic import TerminalModule
+
+# Regex that never matches, used to suspend the error check of the
+# connection while the output of a batch of commands is collected.
+NO_MATCH_RE = [{'pattern': '(?!)'}]
+
+# Section-filtered 'show running-config' forms, by the top level
+# parents line of the configuration blocks they contain.
+CONFIG_SECTIONS = (
+    (re.compile(r'^router bgp\b'), 'bgp'),
+    (re.compile(r'^interface (?:Eth|Vlan)'), 'interface'),
+    (re.compile(r'^route-map (\S+)'), 'route-map {0}'),
+    (re.compile(r'^(ip|ipv6|mac) access-list\b'), '{0} access-list'),
+)
 
 
 class Cliconf(CliconfBase):
 
+    def __init__(self, *args, **kwargs):
+        super(Cliconf, self).__init__(*args, **kwargs)
+        # Running configuration cache, kept for the life of the
+        # persistent connection: parsed configuration by 'show'
+        # command flags, and configuration blocks by flags and
+        # parents path. (The command output itself is cached by
+        # network_cli in single user mode.)
+        self._running_config_objs = {}
+        self._config_section_index = {}
+
     def get_device_info(self):
         device_info = {}
         device_info['network_os'] = 'sonic'
@@ -49,16 +110,126 @@ class Cliconf(CliconfBase):
     @enable_mode
     def edit_config(self, command):
         response = []
+        self.invalidate_config_cache()
+        batch_size = self.get_option('sonic_config_batch_size') or 0
+        batch = []
         self.send_command("configure terminal")
         for cmd in to_list(command):
             if isinstance(cmd, dict):
+                if batch:
+                    response.extend(self.send_config_batch(batch))
+                    batch = []
                 resp = self.get(command=cmd["command"], prompt=cmd["prompt"], answer=cmd["answer"])
                 response.append(resp)
+            elif batch_size > 1:
+                batch.append(to_bytes(cmd))
+                if len(batch) >= batch_size:
+                    response.extend(self.send_config_batch(batch))
+                    batch = []
             else:
                 response.append(self.send_command(to_bytes(cmd)))
+        if batch:
+            response.extend(self.send_config_batch(batch))
         self.send_command("end")
         return response
 
+    def send_config_batch(self, commands):
+        """Writes a batch of configuration commands to the device in a
+        single round trip and returns the output of each command.
+        The aggregated output is split at the echo of each command and
+        checked for errors, and the first failing command is reported.
+        """
+        if len(commands) == 1:
+            return [self.send_command(commands[0])]
+
+        stderr_re = self.get_terminal_stderr_re()
+        orig_stderr_re = self._connection.get_option('terminal_stderr_re')
+        self._connection.set_option('terminal_stderr_re', NO_MATCH_RE)
+        try:
+            self._connection.send(b'\r'.join(commands), sendonly=True)
+            # Each receive ends at a prompt, and the next one starts
+            # with the echo of the command entered at that prompt, so
+            # every echo is received after at most one receive per command.
+            output = b'\n'
+            outputs = None
+            for dummy in range(len(commands)):
+                output += to_bytes(self._connection.receive(strip_prompt=False))
+                outputs = self.split_batch_output(output, commands)
+                if outputs is not None:
+                    break
+        finally:
+            self._connection.set_option('terminal_stderr_re', orig_stderr_re)
+
+        if outputs is None:
+            idx = len(self.find_batch_echoes(output, commands))
+            raise AnsibleConnectionFailure(
+                "echo of command '%s' (line %d of batch) not found in the device output: %s"
+                % (to_text(commands[idx]), idx + 1, to_text(output.strip(), errors='surrogate_then_replace'))
+            )
+
+        response = []
+        for idx, (cmd, out) in enumerate(zip(commands, outputs)):
+            for regex in stderr_re:
+                if regex.search(out):
+                    raise AnsibleConnectionFailure(
+                        "command '%s' (line %d of batch) failed: %s" % (to_text(cmd), idx + 1, to_text(out.strip()))
+                    )
+            response.append(to_text(out.strip(), errors='surrogate_then_replace'))
+
+        return response
+
+    @staticmethod
+    def find_batch_echoes(output, commands):
+        """Returns the start and end offsets of the echo of each command of
+        a batch in its aggregated output, up to the first echo not found.
+        """
+        echoes = []
+        pos = 0
+        for idx, cmd in enumerate(commands):
+            # The prompt preceding the first command was already
+            # received along with the output of the previous command.
+            prompt_re = br'(?:[^\r\n]*# *)?' if idx == 0 else br'[^\r\n]*# *'
+            match = re.compile(br'[\r\n]' + prompt_re + re.escape(cmd.strip()) + br' *(?=[\r\n]|$)').search(output, pos)
+            if not match:
+                break
+            echoes.append((match.start(), match.end()))
+            pos = match.end()
+
+        return echoes
+
+    @staticmethod
+    def split_batch_output(output, commands):
+        """Splits the aggregated output of a batch of commands at the
+        echo of each command, following the command prompt.
+        Returns None until the echo of every command has been received.
+        """
+        echoes = Cliconf.find_batch_echoes(output, commands)
+        if len(echoes) < len(commands):
+            return None
+
+        outputs = []
+        for idx, (start, end) in enumerate(echoes):
+            next_start = echoes[idx + 1][0] if idx + 1 < len(echoes) else len(output)
+            out_lines = output[end:next_start].splitlines()
+            # Remove the prompt returned after the last command
+            if idx + 1 == len(echoes) and out_lines and out_lines[-1].rstrip().endswith(b'#'):
+                out_lines.pop()
+            outputs.append(b'\n'.join(out_lines))
+
+        return outputs
+
+    def get_terminal_stderr_re(self):
+        """Returns the error regexes configured for the connection,
+        or the ones of the sonic terminal plugin"""
+        stderr_re = []
+        for item in self._connection.get_option('terminal_stderr_re') or []:
+            flags = item.get('flags', 0)
+            if flags:
+                flags = getattr(re, flags.split('.')[1])
+            stderr_re.append(re.compile(to_bytes(item['pattern']), flags))
+
+        return stderr_re or TerminalModule.terminal_stderr_re
+
     @enable_mode
     def get_config(self, source="running", flags=None, format=None):
         if source not in ("running", "startup"):
@@ -76,11 +247,80 @@ class Cliconf(CliconfBase):
         cmd = cmd.strip()
         return self.send_command(cmd)
 
+    def get_config_section(self, parents, flags=None):
+        """Returns the block of the running configuration under 'parents'.
+        Unless 'flags' are given, the block is taken from the section of
+        the running configuration that contains it, when the device
+        provides a section-filtered form for it.
+        When the running configuration cache is enabled, the running
+        configuration is fetched and parsed only once, and the blocks
+        are indexed by their parents path.
+        """
+        flags = to_list(flags)
+        key = (" ".join(flags), tuple(parents))
+        if key in self._config_section_index:
+            return self._config_section_index[key]
+
+        config_key = key[0]
+        running_config = self._running_config_objs.get(config_key)
+        if running_config is None and not flags and self.get_option('sonic_config_section_retrieval'):
+            section = self.get_config_section_flags(parents)
+            if section:
+                config_key = section
+                running_config = self._running_config_objs.get(config_key)
+                if running_config is None:
+                    try:
+                        running_config = NetworkConfig(contents=self.get_config(flags=[section]), indent=1)
+                    except AnsibleConnectionFailure:
+                        # Section-filtered form not supported by the device
+                        config_key = key[0]
+
+        if running_config is None:
+            running_config = NetworkConfig(contents=self.get_config(flags=flags), indent=1)
+        block = get_sublevel_config_from_obj(running_config, parents)
+
+        if self.is_config_cache_enabled():
+            self._running_config_objs[config_key] = running_config
+            self._config_section_index[key] = block
+        return block
+
+    @staticmethod
+    def get_config_section_flags(parents):
+        """Returns the section-filtered 'show running-config' argument
+        for the block under 'parents', or None if there is none"""
+        if not parents:
+            return None
+        for section_re, section in CONFIG_SECTIONS:
+            match = section_re.match(parents[0].strip())
+            if match:
+                return section.format(*match.groups())
+        return None
+
+    def is_config_cache_enabled(self):
+        """The running configuration is cached only in single user mode,
+        as changes made to the device by other means are not detected"""
+        try:
+            return bool(self._connection.get_option('single_user_mode'))
+        except KeyError:
+            return False
+
+    def invalidate_config_cache(self):
+        self._running_config_objs.clear()
+        self._config_section_index.clear()
+
+    def invalidate_config_cache_on_write(self, command):
+        """Invalidates the running configuration cache, unless the
+        command is known not to modify the running configuration"""
+        if not to_text(command).strip().startswith('show '):
+            self.invalidate_config_cache()
+
     def get(self, command, prompt=None, answer=None, sendonly=False, newline=True, check_all=False):
+        self.invalidate_config_cache_on_write(command)
         return self.send_command(command=command, prompt=prompt, answer=answer, sendonly=sendonly, newline=newline, check_all=check_all)
 
     def get_capabilities(self):
         result = super(Cliconf, self).get_capabilities()
+        result['rpc'] += ['get_config_section']
         return json.dumps(result)
 
     def run_commands(self, commands=None, check_rc=True):
@@ -96,6 +336,7 @@ class Cliconf(CliconfBase):
             if output:
                 raise ValueError("'output' value %s is not supported for run_commands" % output)
 
+            self.invalidate_config_cache_on_write(cmd['command'])
             try:
                 out = self.send_command(**cmd)
             except AnsibleConnectionFailure as e:
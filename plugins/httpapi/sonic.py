@@ -46,9 +46,15 @@ from ansible.plugins.httpapi import HttpApiBase
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import to_list
 
 CONTENT_TYPE = 'application/yang-data+json'
+DEVICE_METADATA_PATH = 'data/sonic-device-metadata:sonic-device-metadata/DEVICE_METADATA'
+INTF_NAMING_MODE_PATH = DEVICE_METADATA_PATH + '/DEVICE_METADATA_LIST=localhost'
 
 
 class HttpApi(HttpApiBase):
+    def __init__(self, connection):
+        super(HttpApi, self).__init__(connection)
+        self._intf_naming_mode = None
+
     def send_request(self, data, **message_kwargs):
         if data:
             data = json.dumps(data)
@@ -74,6 +80,11 @@ class HttpApi(HttpApiBase):
 
         responses = list()
         for req in to_list(requests):
+            # Invalidate the cached interface naming mode when the device
+            # metadata is modified
+            if (req.get('method', '').lower() != 'get' and
+                    DEVICE_METADATA_PATH in req.get('path', '')):
+                self._intf_naming_mode = None
             try:
                 response = self.send_request(**req)
             except ConnectionError as exc:
@@ -81,6 +92,26 @@ class HttpApi(HttpApiBase):
             responses.append(response)
         return responses
 
+    def get_intf_naming_mode(self):
+        """Return the interface naming mode of the device. The naming mode is
+        retrieved once and cached for the lifetime of the persistent
+        connection.
+        """
+        if self._intf_naming_mode is None:
+            intf_naming_mode = ""
+            try:
+                response = self.send_request(path=INTF_NAMING_MODE_PATH, data=None, method='get')
+            except ConnectionError as exc:
+                raise ConnectionError(to_text(exc, errors='surrogate_then_replace'))
+
+            if 'sonic-device-metadata:DEVICE_METADATA_LIST' in response[1]:
+                device_meta_data = response[1].get('sonic-device-metadata:DEVICE_METADATA_LIST', [])
+                if device_meta_data:
+                    intf_naming_mode = device_meta_data[0].get('intf_naming_mode', 'native')
+            self._intf_naming_mode = intf_naming_mode
+
+        return self._intf_naming_mode
+
     def get_capabilities(self):
         result = {}
         result['rpc'] = []
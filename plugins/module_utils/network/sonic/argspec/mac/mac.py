@@ -62,5 +62,6 @@ class MacArgs(object):  # pylint: disable=R0903
             },
             'type': 'list'
         },
+        'configured_entries_only': {'default': False, 'type': 'bool'},
         'state': {'choices': ['merged', 'deleted', 'replaced', 'overridden'], 'default': 'merged', 'type': 'str'}
     }  # pylint: disable=C0301
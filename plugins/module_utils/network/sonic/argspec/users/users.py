@@ -55,6 +55,7 @@ class UsersArgs(object):  # pylint: disable=R0903
             },
             'type': 'list'
         },
+        'password_fingerprint_cache': {'type': 'path'},
         'state': {
             'choices': ['merged', 'deleted', 'overridden', 'replaced'],
             'default': 'merged'
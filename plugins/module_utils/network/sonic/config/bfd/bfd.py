@@ -43,6 +43,8 @@ TEST_KEYS = [
     {'single_hops': {'remote_address': '', 'vrf': '', 'interface': '', 'local_address': ''}},
     {'multi_hops': {'remote_address': '', 'vrf': '', 'local_address': ''}}
 ]
+SHOP_KEYS = ('remote_address', 'interface', 'vrf', 'local_address')
+MHOP_KEYS = ('remote_address', 'vrf', 'local_address')
 
 
 class Bfd(ConfigBase):
@@ -152,7 +154,7 @@ class Bfd(ConfigBase):
             self.sort_lists_in_config(replaced_config)
             self.sort_lists_in_config(have)
             is_delete_all = (replaced_config == have)
-            requests = self.get_delete_bfd_requests(replaced_config, have, is_delete_all)
+            requests = self.get_delete_bfd_requests(replaced_config, have, is_delete_all, True)
             send_requests(self._module, requests)
 
             commands = want
@@ -408,7 +410,7 @@ class Bfd(ConfigBase):
 
         return request
 
-    def get_delete_bfd_requests(self, commands, have, is_delete_all):
+    def get_delete_bfd_requests(self, commands, have, is_delete_all, is_replaced=False):
         requests = []
 
         if not commands:
@@ -418,8 +420,8 @@ class Bfd(ConfigBase):
             requests.extend(self.get_delete_all_bfd_cfg_requests(commands))
         else:
             requests.extend(self.get_delete_bfd_profile_requests(commands, have))
-            requests.extend(self.get_delete_bfd_shop_requests(commands, have))
-            requests.extend(self.get_delete_bfd_mhop_requests(commands, have))
+            requests.extend(self.get_delete_bfd_shop_requests(commands, have, is_replaced))
+            requests.extend(self.get_delete_bfd_mhop_requests(commands, have, is_replaced))
 
         return requests
 
@@ -427,9 +429,18 @@ class Bfd(ConfigBase):
         requests = []
 
         profiles = commands.get('profiles', None)
-        if profiles:
+        cfg_profiles = have.get('profiles', None)
+        if profiles and cfg_profiles:
+            cfg_profile_dict = {}
+            for cfg_profile in cfg_profiles:
+                cfg_profile_dict.setdefault(cfg_profile.get('profile_name', None), cfg_profile)
+
             for profile in profiles:
                 profile_name = profile.get('profile_name', None)
+                cfg_profile = cfg_profile_dict.get(profile_name)
+                if not cfg_profile:
+                    continue
+
                 enabled = profile.get('enabled', None)
                 transmit_interval = profile.get('transmit_interval', None)
                 receive_interval = profile.get('receive_interval', None)
@@ -439,154 +450,166 @@ class Bfd(ConfigBase):
                 echo_interval = profile.get('echo_interval', None)
                 echo_mode = profile.get('echo_mode', None)
 
-                cfg_profiles = have.get('profiles', None)
-                if cfg_profiles:
-                    for cfg_profile in cfg_profiles:
-                        cfg_profile_name = cfg_profile.get('profile_name', None)
-                        cfg_enabled = cfg_profile.get('enabled', None)
-                        cfg_transmit_interval = cfg_profile.get('transmit_interval', None)
-                        cfg_receive_interval = cfg_profile.get('receive_interval', None)
-                        cfg_detect_multiplier = cfg_profile.get('detect_multiplier', None)
-                        cfg_passive_mode = cfg_profile.get('passive_mode', None)
-                        cfg_min_ttl = cfg_profile.get('min_ttl', None)
-                        cfg_echo_interval = cfg_profile.get('echo_interval', None)
-                        cfg_echo_mode = cfg_profile.get('echo_mode', None)
-
-                        if profile_name == cfg_profile_name:
-                            if enabled is not None and enabled == cfg_enabled:
-                                requests.append(self.get_delete_profile_attr_request(profile_name, 'enabled'))
-                            if transmit_interval and transmit_interval == cfg_transmit_interval:
-                                requests.append(self.get_delete_profile_attr_request(profile_name, 'desired-minimum-tx-interval'))
-                            if receive_interval and receive_interval == cfg_receive_interval:
-                                requests.append(self.get_delete_profile_attr_request(profile_name, 'required-minimum-receive'))
-                            if detect_multiplier and detect_multiplier == cfg_detect_multiplier:
-                                requests.append(self.get_delete_profile_attr_request(profile_name, 'detection-multiplier'))
-                            if passive_mode is not None and passive_mode == cfg_passive_mode:
-                                requests.append(self.get_delete_profile_attr_request(profile_name, 'passive-mode'))
-                            if min_ttl and min_ttl == cfg_min_ttl:
-                                requests.append(self.get_delete_profile_attr_request(profile_name, 'minimum-ttl'))
-                            if echo_interval and echo_interval == cfg_echo_interval:
-                                requests.append(self.get_delete_profile_attr_request(profile_name, 'desired-minimum-echo-receive'))
-                            if echo_mode is not None and echo_mode == cfg_echo_mode:
-                                requests.append(self.get_delete_profile_attr_request(profile_name, 'echo-active'))
-                            if (enabled is None and not transmit_interval and not receive_interval and not detect_multiplier and passive_mode is None
-                                    and not min_ttl and not echo_interval and echo_mode is None):
-                                requests.append(self.get_delete_profile_request(profile_name))
+                if enabled is not None and enabled == cfg_profile.get('enabled', None):
+                    requests.append(self.get_delete_profile_attr_request(profile_name, 'enabled'))
+                if transmit_interval and transmit_interval == cfg_profile.get('transmit_interval', None):
+                    requests.append(self.get_delete_profile_attr_request(profile_name, 'desired-minimum-tx-interval'))
+                if receive_interval and receive_interval == cfg_profile.get('receive_interval', None):
+                    requests.append(self.get_delete_profile_attr_request(profile_name, 'required-minimum-receive'))
+                if detect_multiplier and detect_multiplier == cfg_profile.get('detect_multiplier', None):
+                    requests.append(self.get_delete_profile_attr_request(profile_name, 'detection-multiplier'))
+                if passive_mode is not None and passive_mode == cfg_profile.get('passive_mode', None):
+                    requests.append(self.get_delete_profile_attr_request(profile_name, 'passive-mode'))
+                if min_ttl and min_ttl == cfg_profile.get('min_ttl', None):
+                    requests.append(self.get_delete_profile_attr_request(profile_name, 'minimum-ttl'))
+                if echo_interval and echo_interval == cfg_profile.get('echo_interval', None):
+                    requests.append(self.get_delete_profile_attr_request(profile_name, 'desired-minimum-echo-receive'))
+                if echo_mode is not None and echo_mode == cfg_profile.get('echo_mode', None):
+                    requests.append(self.get_delete_profile_attr_request(profile_name, 'echo-active'))
+                if (enabled is None and not transmit_interval and not receive_interval and not detect_multiplier and passive_mode is None
+                        and not min_ttl and not echo_interval and echo_mode is None):
+                    requests.append(self.get_delete_profile_request(profile_name))
 
         return requests
 
-    def get_delete_bfd_shop_requests(self, commands, have):
+    def get_delete_bfd_shop_requests(self, commands, have, is_replaced=False):
+        """Returns the requests to delete the specified single-hop peers
+        or peer attributes.
+        When all the configured peers are deleted, a single request deletes
+        the single-hop peer list, except when 'is_replaced' is True.
+        """
         requests = []
 
         single_hops = commands.get('single_hops', None)
-        if single_hops:
-            for hop in single_hops:
-                remote_address = hop.get('remote_address', None)
-                vrf = hop.get('vrf', None)
-                interface = hop.get('interface', None)
-                local_address = hop.get('local_address', None)
-                enabled = hop.get('enabled', None)
-                transmit_interval = hop.get('transmit_interval', None)
-                receive_interval = hop.get('receive_interval', None)
-                detect_multiplier = hop.get('detect_multiplier', None)
-                passive_mode = hop.get('passive_mode', None)
-                echo_interval = hop.get('echo_interval', None)
-                echo_mode = hop.get('echo_mode', None)
-                profile_name = hop.get('profile_name', None)
+        cfg_single_hops = have.get('single_hops', None)
+        if not single_hops or not cfg_single_hops:
+            return requests
 
-                cfg_single_hops = have.get('single_hops', None)
-                if cfg_single_hops:
-                    for cfg_hop in cfg_single_hops:
-                        cfg_remote_address = cfg_hop.get('remote_address', None)
-                        cfg_vrf = cfg_hop.get('vrf', None)
-                        cfg_interface = cfg_hop.get('interface', None)
-                        cfg_local_address = cfg_hop.get('local_address', None)
-                        cfg_enabled = cfg_hop.get('enabled', None)
-                        cfg_transmit_interval = cfg_hop.get('transmit_interval', None)
-                        cfg_receive_interval = cfg_hop.get('receive_interval', None)
-                        cfg_detect_multiplier = cfg_hop.get('detect_multiplier', None)
-                        cfg_passive_mode = cfg_hop.get('passive_mode', None)
-                        cfg_echo_interval = cfg_hop.get('echo_interval', None)
-                        cfg_echo_mode = cfg_hop.get('echo_mode', None)
-                        cfg_profile_name = cfg_hop.get('profile_name', None)
-
-                        if remote_address == cfg_remote_address and vrf == cfg_vrf and interface == cfg_interface and local_address == cfg_local_address:
-                            if enabled is not None and enabled == cfg_enabled:
-                                requests.append(self.get_delete_shop_attr_request(remote_address, interface, vrf, local_address, 'enabled'))
-                            if transmit_interval and transmit_interval == cfg_transmit_interval:
-                                requests.append(self.get_delete_shop_attr_request(remote_address, interface, vrf, local_address,
-                                                                                  'desired-minimum-tx-interval'))
-                            if receive_interval and receive_interval == cfg_receive_interval:
-                                requests.append(self.get_delete_shop_attr_request(remote_address, interface, vrf, local_address, 'required-minimum-receive'))
-                            if detect_multiplier and detect_multiplier == cfg_detect_multiplier:
-                                requests.append(self.get_delete_shop_attr_request(remote_address, interface, vrf, local_address, 'detection-multiplier'))
-                            if passive_mode is not None and passive_mode == cfg_passive_mode:
-                                requests.append(self.get_delete_shop_attr_request(remote_address, interface, vrf, local_address, 'passive-mode'))
-                            if echo_interval and echo_interval == cfg_echo_interval:
-                                requests.append(self.get_delete_shop_attr_request(remote_address, interface, vrf, local_address,
-                                                                                  'desired-minimum-echo-receive'))
-                            if echo_mode is not None and echo_mode == cfg_echo_mode:
-                                requests.append(self.get_delete_shop_attr_request(remote_address, interface, vrf, local_address, 'echo-active'))
-                            if profile_name and profile_name == cfg_profile_name:
-                                requests.append(self.get_delete_shop_attr_request(remote_address, interface, vrf, local_address, 'profile-name'))
-                            if (enabled is None and not transmit_interval and not receive_interval and not detect_multiplier and passive_mode is None
-                                    and not echo_interval and echo_mode is None and not profile_name):
-                                requests.append(self.get_delete_shop_request(remote_address, interface, vrf, local_address))
+        cfg_hop_dict = self.get_hops_dict(cfg_single_hops, SHOP_KEYS)
+        del_hop_keys = set()
+        for hop in single_hops:
+            key = self.get_hop_key(hop, SHOP_KEYS)
+            cfg_hop = cfg_hop_dict.get(key)
+            if not cfg_hop:
+                continue
+
+            remote_address, interface, vrf, local_address = key
+            enabled = hop.get('enabled', None)
+            transmit_interval = hop.get('transmit_interval', None)
+            receive_interval = hop.get('receive_interval', None)
+            detect_multiplier = hop.get('detect_multiplier', None)
+            passive_mode = hop.get('passive_mode', None)
+            echo_interval = hop.get('echo_interval', None)
+            echo_mode = hop.get('echo_mode', None)
+            profile_name = hop.get('profile_name', None)
+
+            if (enabled is None and not transmit_interval and not receive_interval and not detect_multiplier and passive_mode is None
+                    and not echo_interval and echo_mode is None and not profile_name):
+                if key not in del_hop_keys:
+                    del_hop_keys.add(key)
+                    requests.append(self.get_delete_shop_request(remote_address, interface, vrf, local_address))
+                continue
+
+            attrs = []
+            if enabled is not None and enabled == cfg_hop.get('enabled', None):
+                attrs.append('enabled')
+            if transmit_interval and transmit_interval == cfg_hop.get('transmit_interval', None):
+                attrs.append('desired-minimum-tx-interval')
+            if receive_interval and receive_interval == cfg_hop.get('receive_interval', None):
+                attrs.append('required-minimum-receive')
+            if detect_multiplier and detect_multiplier == cfg_hop.get('detect_multiplier', None):
+                attrs.append('detection-multiplier')
+            if passive_mode is not None and passive_mode == cfg_hop.get('passive_mode', None):
+                attrs.append('passive-mode')
+            if echo_interval and echo_interval == cfg_hop.get('echo_interval', None):
+                attrs.append('desired-minimum-echo-receive')
+            if echo_mode is not None and echo_mode == cfg_hop.get('echo_mode', None):
+                attrs.append('echo-active')
+            if profile_name and profile_name == cfg_hop.get('profile_name', None):
+                attrs.append('profile-name')
+            for attr in attrs:
+                requests.append(self.get_delete_shop_attr_request(remote_address, interface, vrf, local_address, attr))
+
+        if not is_replaced and del_hop_keys and len(del_hop_keys) == len(cfg_hop_dict):
+            url = '%s/openconfig-bfd-ext:bfd-shop-sessions/single-hop' % (BFD_PATH)
+            requests = [{'path': url, 'method': DELETE}]
 
         return requests
 
-    def get_delete_bfd_mhop_requests(self, commands, have):
+    def get_delete_bfd_mhop_requests(self, commands, have, is_replaced=False):
+        """Returns the requests to delete the specified multi-hop peers
+        or peer attributes.
+        When all the configured peers are deleted, a single request deletes
+        the multi-hop peer list, except when 'is_replaced' is True.
+        """
         requests = []
 
         multi_hops = commands.get('multi_hops', None)
-        if multi_hops:
-            for hop in multi_hops:
-                remote_address = hop.get('remote_address', None)
-                vrf = hop.get('vrf', None)
-                local_address = hop.get('local_address', None)
-                enabled = hop.get('enabled', None)
-                transmit_interval = hop.get('transmit_interval', None)
-                receive_interval = hop.get('receive_interval', None)
-                detect_multiplier = hop.get('detect_multiplier', None)
-                passive_mode = hop.get('passive_mode', None)
-                min_ttl = hop.get('min_ttl', None)
-                profile_name = hop.get('profile_name', None)
+        cfg_multi_hops = have.get('multi_hops', None)
+        if not multi_hops or not cfg_multi_hops:
+            return requests
 
-                cfg_multi_hops = have.get('multi_hops', None)
-                if cfg_multi_hops:
-                    for cfg_hop in cfg_multi_hops:
-                        cfg_remote_address = cfg_hop.get('remote_address', None)
-                        cfg_vrf = cfg_hop.get('vrf', None)
-                        cfg_local_address = cfg_hop.get('local_address', None)
-                        cfg_enabled = cfg_hop.get('enabled', None)
-                        cfg_transmit_interval = cfg_hop.get('transmit_interval', None)
-                        cfg_receive_interval = cfg_hop.get('receive_interval', None)
-                        cfg_detect_multiplier = cfg_hop.get('detect_multiplier', None)
-                        cfg_passive_mode = cfg_hop.get('passive_mode', None)
-                        cfg_min_ttl = cfg_hop.get('min_ttl', None)
-                        cfg_profile_name = cfg_hop.get('profile_name', None)
-
-                        if remote_address == cfg_remote_address and vrf == cfg_vrf and local_address == cfg_local_address:
-                            if enabled is not None and enabled == cfg_enabled:
-                                requests.append(self.get_delete_mhop_attr_request(remote_address, vrf, local_address, 'enabled'))
-                            if transmit_interval and transmit_interval == cfg_transmit_interval:
-                                requests.append(self.get_delete_mhop_attr_request(remote_address, vrf, local_address, 'desired-minimum-tx-interval'))
-                            if receive_interval and receive_interval == cfg_receive_interval:
-                                requests.append(self.get_delete_mhop_attr_request(remote_address, vrf, local_address, 'required-minimum-receive'))
-                            if detect_multiplier and detect_multiplier == cfg_detect_multiplier:
-                                requests.append(self.get_delete_mhop_attr_request(remote_address, vrf, local_address, 'detection-multiplier'))
-                            if passive_mode is not None and passive_mode == cfg_passive_mode:
-                                requests.append(self.get_delete_mhop_attr_request(remote_address, vrf, local_address, 'passive-mode'))
-                            if min_ttl and min_ttl == cfg_min_ttl:
-                                requests.append(self.get_delete_mhop_attr_request(remote_address, vrf, local_address, 'minimum-ttl'))
-                            if profile_name and profile_name == cfg_profile_name:
-                                requests.append(self.get_delete_mhop_attr_request(remote_address, vrf, local_address, 'profile-name'))
-                            if (enabled is None and not transmit_interval and not receive_interval and not detect_multiplier and passive_mode is None
-                                    and not min_ttl and not profile_name):
-                                requests.append(self.get_delete_mhop_request(remote_address, vrf, local_address))
+        cfg_hop_dict = self.get_hops_dict(cfg_multi_hops, MHOP_KEYS)
+        del_hop_keys = set()
+        for hop in multi_hops:
+            key = self.get_hop_key(hop, MHOP_KEYS)
+            cfg_hop = cfg_hop_dict.get(key)
+            if not cfg_hop:
+                continue
+
+            remote_address, vrf, local_address = key
+            enabled = hop.get('enabled', None)
+            transmit_interval = hop.get('transmit_interval', None)
+            receive_interval = hop.get('receive_interval', None)
+            detect_multiplier = hop.get('detect_multiplier', None)
+            passive_mode = hop.get('passive_mode', None)
+            min_ttl = hop.get('min_ttl', None)
+            profile_name = hop.get('profile_name', None)
+
+            if (enabled is None and not transmit_interval and not receive_interval and not detect_multiplier and passive_mode is None
+                    and not min_ttl and not profile_name):
+                if key not in del_hop_keys:
+                    del_hop_keys.add(key)
+                    requests.append(self.get_delete_mhop_request(remote_address, vrf, local_address))
+                continue
+
+            attrs = []
+            if enabled is not None and enabled == cfg_hop.get('enabled', None):
+                attrs.append('enabled')
+            if transmit_interval and transmit_interval == cfg_hop.get('transmit_interval', None):
+                attrs.append('desired-minimum-tx-interval')
+            if receive_interval and receive_interval == cfg_hop.get('receive_interval', None):
+                attrs.append('required-minimum-receive')
+            if detect_multiplier and detect_multiplier == cfg_hop.get('detect_multiplier', None):
+                attrs.append('detection-multiplier')
+            if passive_mode is not None and passive_mode == cfg_hop.get('passive_mode', None):
+                attrs.append('passive-mode')
+            if min_ttl and min_ttl == cfg_hop.get('min_ttl', None):
+                attrs.append('minimum-ttl')
+            if profile_name and profile_name == cfg_hop.get('profile_name', None):
+                attrs.append('profile-name')
+            for attr in attrs:
+                requests.append(self.get_delete_mhop_attr_request(remote_address, vrf, local_address, attr))
+
+        if not is_replaced and del_hop_keys and len(del_hop_keys) == len(cfg_hop_dict):
+            url = '%s/openconfig-bfd-ext:bfd-mhop-sessions/multi-hop' % (BFD_PATH)
+            requests = [{'path': url, 'method': DELETE}]
 
         return requests
 
+    @staticmethod
+    def get_hop_key(hop, key_names):
+        """Returns the key tuple identifying a BFD peer"""
+        return tuple(hop.get(key_name, None) for key_name in key_names)
+
+    @staticmethod
+    def get_hops_dict(hops, key_names):
+        """Returns a dict of BFD peers indexed by their key tuple"""
+        hops_dict = {}
+        for hop in hops:
+            hops_dict.setdefault(Bfd.get_hop_key(hop, key_names), hop)
+        return hops_dict
+
     def get_delete_all_bfd_cfg_requests(self, commands):
         requests = []
         profiles = commands.get('profiles', None)
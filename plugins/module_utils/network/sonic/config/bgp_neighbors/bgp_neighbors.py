@@ -33,7 +33,11 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     validate_bgps,
     normalize_neighbors_interface_name,
     get_ip_afi_cfg_payload,
-    get_prefix_limit_payload
+    get_prefix_limit_payload,
+    get_bgp_nbr_pg_payload,
+    bgp_pg_attr_map,
+    bgp_nbr_attr_map,
+    bgp_nbr_pg_common_attr_map
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import to_request
 from ansible.module_utils.connection import ConnectionError
@@ -43,6 +47,10 @@ from copy import deepcopy
 PATCH = 'patch'
 DELETE = 'delete'
 
+# Peer group and neighbor containers that are deleted as a whole when all
+# of their configured attributes are deleted
+COLLAPSIBLE_CONTAINERS = ('timers', 'enable-bfd', 'auth-password', 'ebgp-multihop')
+
 TEST_KEYS = [
     {'config': {'vrf_name': '', 'bgp_as': ''}},
     {'neighbors': {'neighbor': ''}},
@@ -160,6 +168,7 @@ class Bgp_neighbors(ConfigBase):
 
     def __init__(self, module):
         super(Bgp_neighbors, self).__init__(module)
+        self._have_index = None
 
     def get_bgp_neighbors_facts(self):
         """ Get the 'facts' (the current configuration)
@@ -291,80 +300,9 @@ class Bgp_neighbors(ConfigBase):
         bgp_peer_group_list = []
         for peer_group in cmd:
             if peer_group:
-                bgp_peer_group = {}
-                peer_group_cfg = {}
-                tmp_bfd = {}
-                tmp_ebgp = {}
-                tmp_timers = {}
-                tmp_capability = {}
+                bgp_peer_group = get_bgp_nbr_pg_payload(bgp_pg_attr_map, peer_group)
                 tmp_remote = {}
-                tmp_transport = {}
                 afi = []
-                if peer_group.get('name', None) is not None:
-                    peer_group_cfg.update({'peer-group-name': peer_group['name']})
-                    bgp_peer_group.update({'peer-group-name': peer_group['name']})
-                if peer_group.get('bfd', None) is not None:
-                    if peer_group['bfd'].get('enabled', None) is not None:
-                        tmp_bfd.update({'enabled': peer_group['bfd']['enabled']})
-                    if peer_group['bfd'].get('check_failure', None) is not None:
-                        tmp_bfd.update({'check-control-plane-failure': peer_group['bfd']['check_failure']})
-                    if peer_group['bfd'].get('profile', None) is not None:
-                        tmp_bfd.update({'bfd-profile': peer_group['bfd']['profile']})
-                if peer_group.get('auth_pwd', None) is not None:
-                    if (peer_group['auth_pwd'].get('pwd', None) is not None and
-                            peer_group['auth_pwd'].get('encrypted', None) is not None):
-                        bgp_peer_group.update({'auth-password': {'config': {'password': peer_group['auth_pwd']['pwd'],
-                                                                            'encrypted': peer_group['auth_pwd']['encrypted']}}})
-                if peer_group.get('ebgp_multihop', None) is not None:
-                    if peer_group['ebgp_multihop'].get('enabled', None) is not None:
-                        tmp_ebgp.update({'enabled': peer_group['ebgp_multihop']['enabled']})
-                    if peer_group['ebgp_multihop'].get('multihop_ttl', None) is not None:
-                        tmp_ebgp.update({'multihop-ttl': peer_group['ebgp_multihop']['multihop_ttl']})
-                if peer_group.get('timers', None) is not None:
-                    if peer_group['timers'].get('holdtime', None) is not None:
-                        tmp_timers.update({'hold-time': peer_group['timers']['holdtime']})
-                    if peer_group['timers'].get('keepalive', None) is not None:
-                        tmp_timers.update({'keepalive-interval': peer_group['timers']['keepalive']})
-                    if peer_group['timers'].get('connect_retry', None) is not None:
-                        tmp_timers.update({'connect-retry': peer_group['timers']['connect_retry']})
-                if peer_group.get('capability', None) is not None:
-                    if peer_group['capability'].get('dynamic', None) is not None:
-                        tmp_capability.update({'capability-dynamic': peer_group['capability']['dynamic']})
-                    if peer_group['capability'].get('extended_nexthop', None) is not None:
-                        tmp_capability.update({'capability-extended-nexthop': peer_group['capability']['extended_nexthop']})
-                if peer_group.get('pg_description', None) is not None:
-                    peer_group_cfg.update({'description': peer_group['pg_description']})
-                if peer_group.get('disable_connected_check', None) is not None:
-                    peer_group_cfg.update({'disable-ebgp-connected-route-check': peer_group['disable_connected_check']})
-                if peer_group.get('dont_negotiate_capability', None) is not None:
-                    peer_group_cfg.update({'dont-negotiate-capability': peer_group['dont_negotiate_capability']})
-                if peer_group.get('enforce_first_as', None) is not None:
-                    peer_group_cfg.update({'enforce-first-as': peer_group['enforce_first_as']})
-                if peer_group.get('enforce_multihop', None) is not None:
-                    peer_group_cfg.update({'enforce-multihop': peer_group['enforce_multihop']})
-                if peer_group.get('override_capability', None) is not None:
-                    peer_group_cfg.update({'override-capability': peer_group['override_capability']})
-                if peer_group.get('shutdown_msg', None) is not None:
-                    peer_group_cfg.update({'shutdown-message': peer_group['shutdown_msg']})
-                if peer_group.get('solo', None) is not None:
-                    peer_group_cfg.update({'solo-peer': peer_group['solo']})
-                if peer_group.get('strict_capability_match', None) is not None:
-                    peer_group_cfg.update({'strict-capability-match': peer_group['strict_capability_match']})
-                if peer_group.get('ttl_security', None) is not None:
-                    peer_group_cfg.update({'ttl-security-hops': peer_group['ttl_security']})
-                if peer_group.get('local_as', None) is not None:
-                    if peer_group['local_as'].get('as', None) is not None:
-                        peer_group_cfg.update({'local-as': peer_group['local_as']['as']})
-                    if peer_group['local_as'].get('no_prepend', None) is not None:
-                        peer_group_cfg.update({'local-as-no-prepend': peer_group['local_as']['no_prepend']})
-                    if peer_group['local_as'].get('replace_as', None) is not None:
-                        peer_group_cfg.update({'local-as-replace-as': peer_group['local_as']['replace_as']})
-                if peer_group.get('local_address', None) is not None:
-                    tmp_transport.update({'local-address': peer_group['local_address']})
-                if peer_group.get('passive', None) is not None:
-                    tmp_transport.update({'passive-mode': peer_group['passive']})
-                if peer_group.get('advertisement_interval', None) is not None:
-                    tmp_timers.update({'minimum-advertisement-interval': peer_group['advertisement_interval']})
                 if peer_group.get('remote_as', None) is not None:
                     have_nei = self.find_pg(have, bgp_as, vrf_name, peer_group)
                     if peer_group['remote_as'].get('peer_as', None) is not None:
@@ -461,129 +399,63 @@ class Bgp_neighbors(ConfigBase):
                                 samp.update({'prefix-list': {'config': pfx_lst_cfg}})
                             if samp:
                                 afi.append(samp)
-                if tmp_bfd:
-                    bgp_peer_group.update({'enable-bfd': {'config': tmp_bfd}})
-                if tmp_ebgp:
-                    bgp_peer_group.update({'ebgp-multihop': {'config': tmp_ebgp}})
-                if tmp_timers:
-                    bgp_peer_group.update({'timers': {'config': tmp_timers}})
-                if tmp_transport:
-                    bgp_peer_group.update({'transport': {'config': tmp_transport}})
                 if afi and len(afi) > 0:
                     bgp_peer_group.update({'afi-safis': {'afi-safi': afi}})
-                if tmp_capability:
-                    peer_group_cfg.update(tmp_capability)
                 if tmp_remote:
-                    peer_group_cfg.update(tmp_remote)
-                if peer_group_cfg:
-                    bgp_peer_group.update({'config': peer_group_cfg})
+                    bgp_peer_group.setdefault('config', {}).update(tmp_remote)
                 if bgp_peer_group:
                     bgp_peer_group_list.append(bgp_peer_group)
         payload = {'openconfig-network-instance:peer-groups': {'peer-group': bgp_peer_group_list}}
         return payload, requests
 
+    def get_have_index(self, have):
+        """Return the index of the peer groups, their address families and
+        the neighbors in 'have', by BGP AS and VRF name"""
+        if self._have_index is None or self._have_index[0] is not have or self._have_index[1] != len(have):
+            index = {}
+            for conf in have:
+                key = (conf['bgp_as'], conf['vrf_name'])
+                if key in index:
+                    continue
+                pg_index = {}
+                af_index = {}
+                for pg in conf.get('peer_group') or []:
+                    if pg['name'] not in pg_index:
+                        pg_index[pg['name']] = pg
+                        pg_afs = af_index[pg['name']] = {}
+                        if pg.get('address_family') and pg['address_family'].get('afis'):
+                            for af in pg['address_family']['afis']:
+                                pg_afs.setdefault((af['afi'], af['safi']), af)
+                nei_index = {}
+                for nei in conf.get('neighbors') or []:
+                    nei_index.setdefault(nei['neighbor'], nei)
+                index[key] = (pg_index, af_index, nei_index)
+            self._have_index = (have, len(have), index)
+
+        return self._have_index[2]
+
     def find_pg(self, have, bgp_as, vrf_name, peergroup):
-        mat_dict = next((m_peer for m_peer in have if m_peer['bgp_as'] == bgp_as and m_peer['vrf_name'] == vrf_name), None)
-        if mat_dict and mat_dict.get("peer_group", None) is not None:
-            mat_pg = next((m for m in mat_dict['peer_group'] if m["name"] == peergroup['name']), None)
-            return mat_pg
+        conf_index = self.get_have_index(have).get((bgp_as, vrf_name))
+        if conf_index:
+            return conf_index[0].get(peergroup['name'])
 
     def find_af(self, have, bgp_as, vrf_name, peergroup, afi, safi):
-        mat_pg = self.find_pg(have, bgp_as, vrf_name, peergroup)
-        if mat_pg and mat_pg['address_family'].get('afis', None) is not None:
-            mat_af = next((af for af in mat_pg['address_family']['afis'] if af['afi'] == afi and af['safi'] == safi), None)
-            return mat_af
+        conf_index = self.get_have_index(have).get((bgp_as, vrf_name))
+        if conf_index and peergroup['name'] in conf_index[1]:
+            return conf_index[1][peergroup['name']].get((afi, safi))
 
     def find_nei(self, have, bgp_as, vrf_name, neighbor):
-        mat_dict = next((m_neighbor for m_neighbor in have if m_neighbor['bgp_as'] == bgp_as and m_neighbor['vrf_name'] == vrf_name), None)
-        if mat_dict and mat_dict.get("neighbors", None) is not None:
-            mat_neighbor = next((m for m in mat_dict['neighbors'] if m["neighbor"] == neighbor['neighbor']), None)
-            return mat_neighbor
+        conf_index = self.get_have_index(have).get((bgp_as, vrf_name))
+        if conf_index:
+            return conf_index[2].get(neighbor['neighbor'])
 
     def build_bgp_neighbors_payload(self, cmd, have, bgp_as, vrf_name):
         bgp_neighbor_list = []
         requests = []
         for neighbor in cmd:
             if neighbor:
-                bgp_neighbor = {}
-                neighbor_cfg = {}
-                tmp_bfd = {}
-                tmp_ebgp = {}
-                tmp_timers = {}
-                tmp_capability = {}
+                bgp_neighbor = get_bgp_nbr_pg_payload(bgp_nbr_attr_map, neighbor)
                 tmp_remote = {}
-                tmp_transport = {}
-                if neighbor.get('bfd', None) is not None:
-                    if neighbor['bfd'].get('enabled', None) is not None:
-                        tmp_bfd.update({'enabled': neighbor['bfd']['enabled']})
-                    if neighbor['bfd'].get('check_failure', None) is not None:
-                        tmp_bfd.update({'check-control-plane-failure': neighbor['bfd']['check_failure']})
-                    if neighbor['bfd'].get('profile', None) is not None:
-                        tmp_bfd.update({'bfd-profile': neighbor['bfd']['profile']})
-                if neighbor.get('auth_pwd', None) is not None:
-                    if (neighbor['auth_pwd'].get('pwd', None) is not None and
-                            neighbor['auth_pwd'].get('encrypted', None) is not None):
-                        bgp_neighbor.update({'auth-password': {'config': {'password': neighbor['auth_pwd']['pwd'],
-                                                                          'encrypted': neighbor['auth_pwd']['encrypted']}}})
-                if neighbor.get('ebgp_multihop', None) is not None:
-                    if neighbor['ebgp_multihop'].get('enabled', None) is not None:
-                        tmp_ebgp.update({'enabled': neighbor['ebgp_multihop']['enabled']})
-                    if neighbor['ebgp_multihop'].get('multihop_ttl', None) is not None:
-                        tmp_ebgp.update({'multihop-ttl': neighbor['ebgp_multihop']['multihop_ttl']})
-                if neighbor.get('timers', None) is not None:
-                    if neighbor['timers'].get('holdtime', None) is not None:
-                        tmp_timers.update({'hold-time': neighbor['timers']['holdtime']})
-                    if neighbor['timers'].get('keepalive', None) is not None:
-                        tmp_timers.update({'keepalive-interval': neighbor['timers']['keepalive']})
-                    if neighbor['timers'].get('connect_retry', None) is not None:
-                        tmp_timers.update({'connect-retry': neighbor['timers']['connect_retry']})
-                if neighbor.get('capability', None) is not None:
-                    if neighbor['capability'].get('dynamic', None) is not None:
-                        tmp_capability.update({'capability-dynamic': neighbor['capability']['dynamic']})
-                    if neighbor['capability'].get('extended_nexthop', None) is not None:
-                        tmp_capability.update({'capability-extended-nexthop': neighbor['capability']['extended_nexthop']})
-                if neighbor.get('advertisement_interval', None) is not None:
-                    tmp_timers.update({'minimum-advertisement-interval': neighbor['advertisement_interval']})
-                if neighbor.get('neighbor', None) is not None:
-                    bgp_neighbor.update({'neighbor-address': neighbor['neighbor']})
-                    neighbor_cfg.update({'neighbor-address': neighbor['neighbor']})
-                if neighbor.get('peer_group', None) is not None:
-                    neighbor_cfg.update({'peer-group': neighbor['peer_group']})
-                if neighbor.get('nbr_description', None) is not None:
-                    neighbor_cfg.update({'description': neighbor['nbr_description']})
-                if neighbor.get('disable_connected_check', None) is not None:
-                    neighbor_cfg.update({'disable-ebgp-connected-route-check': neighbor['disable_connected_check']})
-                if neighbor.get('dont_negotiate_capability', None) is not None:
-                    neighbor_cfg.update({'dont-negotiate-capability': neighbor['dont_negotiate_capability']})
-                if neighbor.get('enforce_first_as', None) is not None:
-                    neighbor_cfg.update({'enforce-first-as': neighbor['enforce_first_as']})
-                if neighbor.get('enforce_multihop', None) is not None:
-                    neighbor_cfg.update({'enforce-multihop': neighbor['enforce_multihop']})
-                if neighbor.get('override_capability', None) is not None:
-                    neighbor_cfg.update({'override-capability': neighbor['override_capability']})
-                if neighbor.get('port', None) is not None:
-                    neighbor_cfg.update({'peer-port': neighbor['port']})
-                if neighbor.get('shutdown_msg', None) is not None:
-                    neighbor_cfg.update({'shutdown-message': neighbor['shutdown_msg']})
-                if neighbor.get('solo', None) is not None:
-                    neighbor_cfg.update({'solo-peer': neighbor['solo']})
-                if neighbor.get('strict_capability_match', None) is not None:
-                    neighbor_cfg.update({'strict-capability-match': neighbor['strict_capability_match']})
-                if neighbor.get('ttl_security', None) is not None:
-                    neighbor_cfg.update({'ttl-security-hops': neighbor['ttl_security']})
-                if neighbor.get('v6only', None) is not None:
-                    neighbor_cfg.update({'openconfig-bgp-ext:v6only': neighbor['v6only']})
-                if neighbor.get('local_as', None) is not None:
-                    if neighbor['local_as'].get('as', None) is not None:
-                        neighbor_cfg.update({'local-as': neighbor['local_as']['as']})
-                    if neighbor['local_as'].get('no_prepend', None) is not None:
-                        neighbor_cfg.update({'local-as-no-prepend': neighbor['local_as']['no_prepend']})
-                    if neighbor['local_as'].get('replace_as', None) is not None:
-                        neighbor_cfg.update({'local-as-replace-as': neighbor['local_as']['replace_as']})
-                if neighbor.get('local_address', None) is not None:
-                    tmp_transport.update({'local-address': neighbor['local_address']})
-                if neighbor.get('passive', None) is not None:
-                    tmp_transport.update({'passive-mode': neighbor['passive']})
                 if neighbor.get('remote_as', None) is not None:
                     have_nei = self.find_nei(have, bgp_as, vrf_name, neighbor)
                     if neighbor['remote_as'].get('peer_as', None) is not None:
@@ -604,20 +476,8 @@ class Bgp_neighbors(ConfigBase):
                                     del_nei.update({'remote_as': have_nei['remote_as']})
                                     requests.extend(self.delete_specific_param_request(vrf_name, del_nei))
                         tmp_remote.update({'peer-type': neighbor['remote_as']['peer_type'].upper()})
-                if tmp_bfd:
-                    bgp_neighbor.update({'enable-bfd': {'config': tmp_bfd}})
-                if tmp_ebgp:
-                    bgp_neighbor.update({'ebgp-multihop': {'config': tmp_ebgp}})
-                if tmp_timers:
-                    bgp_neighbor.update({'timers': {'config': tmp_timers}})
-                if tmp_transport:
-                    bgp_neighbor.update({'transport': {'config': tmp_transport}})
-                if tmp_capability:
-                    neighbor_cfg.update(tmp_capability)
                 if tmp_remote:
-                    neighbor_cfg.update(tmp_remote)
-                if neighbor_cfg:
-                    bgp_neighbor.update({'config': neighbor_cfg})
+                    bgp_neighbor.setdefault('config', {}).update(tmp_remote)
                 if bgp_neighbor:
                     bgp_neighbor_list.append(bgp_neighbor)
         payload = {'openconfig-network-instance:neighbors': {'neighbor': bgp_neighbor_list}}
@@ -628,25 +488,66 @@ class Bgp_neighbors(ConfigBase):
         if not commands:
             return requests
 
+        # Send a single peer groups and a single neighbors request per VRF
+        vrf_payloads = {}
         for cmd in commands:
-            edit_path = '%s=%s/%s' % (self.network_instance_path, cmd['vrf_name'], self.protocol_bgp_path)
+            vrf_name = cmd['vrf_name']
+            pg_list, nbr_list = vrf_payloads.setdefault(vrf_name, ([], []))
             if 'peer_group' in cmd and cmd['peer_group']:
-                edit_peer_groups_payload, edit_requests = self.build_bgp_peer_groups_payload(cmd['peer_group'], have, cmd['bgp_as'], cmd['vrf_name'])
-                edit_peer_groups_path = edit_path + '/peer-groups'
+                edit_peer_groups_payload, edit_requests = self.build_bgp_peer_groups_payload(cmd['peer_group'], have, cmd['bgp_as'], vrf_name)
                 if edit_requests:
                     requests.extend(edit_requests)
-                requests.append({'path': edit_peer_groups_path, 'method': PATCH, 'data': edit_peer_groups_payload})
+                pg_list.extend(edit_peer_groups_payload['openconfig-network-instance:peer-groups']['peer-group'])
             if 'neighbors' in cmd and cmd['neighbors']:
-                edit_neighbors_payload, edit_requests = self.build_bgp_neighbors_payload(cmd['neighbors'], have, cmd['bgp_as'], cmd['vrf_name'])
-                edit_neighbors_path = edit_path + '/neighbors'
+                edit_neighbors_payload, edit_requests = self.build_bgp_neighbors_payload(cmd['neighbors'], have, cmd['bgp_as'], vrf_name)
                 if edit_requests:
                     requests.extend(edit_requests)
-                requests.append({'path': edit_neighbors_path, 'method': PATCH, 'data': edit_neighbors_payload})
+                nbr_list.extend(edit_neighbors_payload['openconfig-network-instance:neighbors']['neighbor'])
+
+        for vrf_name, (pg_list, nbr_list) in vrf_payloads.items():
+            edit_path = '%s=%s/%s' % (self.network_instance_path, vrf_name, self.protocol_bgp_path)
+            if pg_list:
+                edit_peer_groups_payload = {'openconfig-network-instance:peer-groups': {'peer-group': pg_list}}
+                requests.append({'path': edit_path + '/peer-groups', 'method': PATCH, 'data': edit_peer_groups_payload})
+            if nbr_list:
+                edit_neighbors_payload = {'openconfig-network-instance:neighbors': {'neighbor': nbr_list}}
+                requests.append({'path': edit_path + '/neighbors', 'method': PATCH, 'data': edit_neighbors_payload})
         return requests
 
-    def get_delete_specific_bgp_peergroup_param_request(self, vrf_name, cmd, want_match):
+    def get_collapsed_containers(self, cmd, have_conf):
+        """Return the containers of the peer group or neighbor for which all
+        the configured attributes are deleted by the command, along with the
+        command without the attributes of those containers"""
+        collapsed = []
+        if not have_conf:
+            return collapsed, cmd
+
+        cmd = dict(cmd)
+        for container in COLLAPSIBLE_CONTAINERS:
+            attr_paths = [attr_path for attr_path, oc_path in bgp_nbr_pg_common_attr_map if oc_path[0] == container]
+            deleted = set(attr_path for attr_path in attr_paths if self.get_attr_value(cmd, attr_path) is not None)
+            configured = set(attr_path for attr_path in attr_paths if self.get_attr_value(have_conf, attr_path) is not None)
+            if len(deleted) > 1 and deleted == configured:
+                collapsed.append(container)
+                for attr_path in attr_paths:
+                    cmd.pop(attr_path[0], None)
+
+        return collapsed, cmd
+
+    @staticmethod
+    def get_attr_value(conf, attr_path):
+        val = conf
+        for attr in attr_path:
+            val = val.get(attr) if val else None
+        return val
+
+    def get_delete_specific_bgp_peergroup_param_request(self, vrf_name, cmd, want_match, have=None):
         requests = []
         want_peer_group = want_match.get('peer_group', None)
+        want_pg_index = {}
+        if want_peer_group:
+            for cfg in want_peer_group:
+                want_pg_index.setdefault(cfg['name'], cfg)
         for each in cmd['peer_group']:
             if each:
                 name = each.get('name', None)
@@ -676,9 +577,7 @@ class Bgp_neighbors(ConfigBase):
                         enforce_first_as is None and enforce_multihop is None and not local_address and not local_as and override_capability
                         is None and passive is None and not shutdown_msg and solo is None and strict_capability_match is None and not ttl_security and
                         not address_family):
-                    want_pg_match = None
-                    if want_peer_group:
-                        want_pg_match = next((cfg for cfg in want_peer_group if cfg['name'] == name), None)
+                    want_pg_match = want_pg_index.get(name)
                     if want_pg_match:
                         keys = ['remote_as', 'timers', 'advertisement_interval', 'bfd', 'capability', 'auth_pwd', 'pg_description',
                                 'disable_connected_check', 'dont_negotiate_capability', 'ebgp_multihop', 'enforce_first_as', 'enforce_multihop',
@@ -687,13 +586,19 @@ class Bgp_neighbors(ConfigBase):
                         if not any(want_pg_match.get(key, None) for key in keys):
                             requests.append(self.get_delete_vrf_specific_peergroup_request(vrf_name, name))
                 else:
-                    requests.extend(self.delete_specific_peergroup_param_request(vrf_name, each))
+                    have_pg = None
+                    if have:
+                        have_pg = self.find_pg(have, cmd['bgp_as'], vrf_name, each)
+                    requests.extend(self.delete_specific_peergroup_param_request(vrf_name, each, have_pg))
         return requests
 
-    def delete_specific_peergroup_param_request(self, vrf_name, cmd):
+    def delete_specific_peergroup_param_request(self, vrf_name, cmd, have_pg=None):
         requests = []
         delete_static_path = '%s=%s/%s' % (self.network_instance_path, vrf_name, self.protocol_bgp_path)
         delete_static_path = delete_static_path + '/peer-groups/peer-group=%s' % (cmd['name'])
+        collapsed, cmd = self.get_collapsed_containers(cmd, have_pg)
+        for container in collapsed:
+            requests.append({'path': delete_static_path + '/' + container, 'method': DELETE})
         if cmd.get('remote_as', None) is not None:
             if cmd['remote_as'].get('peer_as', None) is not None:
                 delete_path = delete_static_path + '/config/peer-as'
@@ -875,9 +780,13 @@ class Bgp_neighbors(ConfigBase):
 
         return requests
 
-    def get_delete_specific_bgp_param_request(self, vrf_name, cmd, want_match):
+    def get_delete_specific_bgp_param_request(self, vrf_name, cmd, want_match, have=None):
         requests = []
         want_neighbors = want_match.get('neighbors', None)
+        want_nei_index = {}
+        if want_neighbors:
+            for cfg in want_neighbors:
+                want_nei_index.setdefault(cfg['neighbor'], cfg)
         for each in cmd['neighbors']:
             if each:
                 neighbor = each.get('neighbor', None)
@@ -909,9 +818,7 @@ class Bgp_neighbors(ConfigBase):
                         ebgp_multihop and enforce_first_as is None and enforce_multihop is None and not local_address and not local_as and
                         override_capability is None and passive is None and not port and not shutdown_msg and solo is None and strict_capability_match
                         is None and not ttl_security and v6only is None):
-                    want_nei_match = None
-                    if want_neighbors:
-                        want_nei_match = next(cfg for cfg in want_neighbors if cfg['neighbor'] == neighbor)
+                    want_nei_match = want_nei_index.get(neighbor)
                     if want_nei_match:
                         keys = ['remote_as', 'peer_group', 'timers', 'advertisement_interval', 'bfd', 'capability', 'auth_pwd', 'nbr_description',
                                 'disable_connected_check', 'dont_negotiate_capability', 'ebgp_multihop', 'enforce_first_as', 'enforce_multihop',
@@ -920,7 +827,10 @@ class Bgp_neighbors(ConfigBase):
                         if not any(want_nei_match.get(key, None) for key in keys):
                             requests.append(self.delete_neighbor_whole_request(vrf_name, neighbor))
                 else:
-                    requests.extend(self.delete_specific_param_request(vrf_name, each))
+                    have_nei = None
+                    if have:
+                        have_nei = self.find_nei(have, cmd['bgp_as'], vrf_name, each)
+                    requests.extend(self.delete_specific_param_request(vrf_name, each, have_nei))
         return requests
 
     def delete_neighbor_whole_request(self, vrf_name, neighbor):
@@ -928,10 +838,13 @@ class Bgp_neighbors(ConfigBase):
         url = '%s=%s/%s/%s=%s/' % (self.network_instance_path, vrf_name, self.protocol_bgp_path, self.neighbor_path, neighbor)
         return ({'path': url, 'method': DELETE})
 
-    def delete_specific_param_request(self, vrf_name, cmd):
+    def delete_specific_param_request(self, vrf_name, cmd, have_nei=None):
         requests = []
         delete_static_path = '%s=%s/%s' % (self.network_instance_path, vrf_name, self.protocol_bgp_path)
         delete_static_path = delete_static_path + '/neighbors/neighbor=%s' % (cmd['neighbor'])
+        collapsed, cmd = self.get_collapsed_containers(cmd, have_nei)
+        for container in collapsed:
+            requests.append({'path': delete_static_path + '/' + container, 'method': DELETE})
         if cmd.get('remote_as', None) is not None:
             if cmd['remote_as'].get('peer_as', None) is not None:
                 delete_path = delete_static_path + '/config/peer-as'
@@ -1096,7 +1009,7 @@ class Bgp_neighbors(ConfigBase):
                             break
                 else:
                     if neighbors:
-                        requests.extend(self.get_delete_specific_bgp_param_request(vrf_name, cmd, want_match))
+                        requests.extend(self.get_delete_specific_bgp_param_request(vrf_name, cmd, want_match, have))
                     if peer_group:
-                        requests.extend(self.get_delete_specific_bgp_peergroup_param_request(vrf_name, cmd, want_match))
+                        requests.extend(self.get_delete_specific_bgp_peergroup_param_request(vrf_name, cmd, want_match, have))
         return requests
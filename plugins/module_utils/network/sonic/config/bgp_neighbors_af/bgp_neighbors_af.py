@@ -81,6 +81,7 @@ class Bgp_neighbors_af(ConfigBase):
 
     def __init__(self, module):
         super(Bgp_neighbors_af, self).__init__(module)
+        self._have_index = None
 
     def get_bgp_neighbors_af_facts(self):
         """ Get the 'facts' (the current configuration)
@@ -206,33 +207,62 @@ class Bgp_neighbors_af(ConfigBase):
 
         return commands, requests
 
+    def get_have_index(self, have):
+        """Return the index of the existing configuration. The VRF
+        configuration is indexed by (vrf_name, bgp_as), the neighbors by
+        (vrf_name, neighbor) and the neighbor address families by
+        (vrf_name, neighbor, afi, safi)."""
+        if self._have_index is None or self._have_index[0] is not have or self._have_index[1] != len(have):
+            vrf_index = {}
+            nei_index = {}
+            af_index = {}
+            vrfs = set()
+            for cfg in have:
+                vrf_index.setdefault((cfg['vrf_name'], cfg['bgp_as']), cfg)
+                if cfg['vrf_name'] in vrfs:
+                    continue
+                vrfs.add(cfg['vrf_name'])
+                for nei in cfg.get('neighbors') or []:
+                    nei_key = (cfg['vrf_name'], nei['neighbor'])
+                    if nei_key in nei_index:
+                        continue
+                    nei_index[nei_key] = nei
+                    for af in nei.get('address_family') or []:
+                        af_index.setdefault(nei_key + (af['afi'], af['safi']), af)
+            self._have_index = (have, len(have), (vrf_index, nei_index, af_index))
+
+        return self._have_index[2]
+
+    def find_vrf(self, have, vrf_name, as_val):
+        return self.get_have_index(have)[0].get((vrf_name, as_val))
+
+    def find_neighbor(self, have, vrf_name, neighbor):
+        return self.get_have_index(have)[1].get((vrf_name, neighbor))
+
+    def find_neighbor_af(self, have, vrf_name, neighbor, afi, safi):
+        return self.get_have_index(have)[2].get((vrf_name, neighbor, afi, safi))
+
     def set_val(self, cfg, var, src_key, des_key):
         value = var.get(src_key, None)
         if value is not None:
             cfg[des_key] = value
 
-    def get_allowas_in(self, match, conf_neighbor_val, conf_afi, conf_safi):
+    def get_allowas_in(self, have, vrf_name, conf_neighbor_val, conf_afi, conf_safi):
         mat_allowas_in = None
-        if match:
-            mat_neighbors = match.get('neighbors', None)
-            if mat_neighbors:
-                mat_neighbor = next((nei for nei in mat_neighbors if nei['neighbor'] == conf_neighbor_val), None)
-                if mat_neighbor:
-                    mat_nei_addr_fams = mat_neighbor.get('address_family', [])
-                    if mat_nei_addr_fams:
-                        mat_nei_addr_fam = next((af for af in mat_nei_addr_fams if (af['afi'] == conf_afi and af['safi'] == conf_safi)), None)
-                        if mat_nei_addr_fam:
-                            mat_allowas_in = mat_nei_addr_fam.get('allowas_in', None)
+        mat_nei_addr_fam = self.find_neighbor_af(have, vrf_name, conf_neighbor_val, conf_afi, conf_safi)
+        if mat_nei_addr_fam:
+            mat_allowas_in = mat_nei_addr_fam.get('allowas_in', None)
         return mat_allowas_in
 
-    def get_single_neighbors_af_modify_request(self, match, vrf_name, conf_neighbor_val, conf_neighbor):
+    def get_single_neighbors_af_modify_request(self, have, vrf_name, conf_neighbor_val, conf_neighbor):
+        """Return the requests to be sent before the address families of the
+        neighbor are modified, along with the neighbor address families
+        payload"""
         requests = []
         conf_nei_addr_fams = conf_neighbor.get('address_family', [])
-        url = '%s=%s/%s/%s=%s/afi-safis' % (self.network_instance_path, vrf_name, self.protocol_bgp_path, self.neighbor_path, conf_neighbor_val)
-        payload = {}
         afi_safis = []
         if not conf_nei_addr_fams:
-            return requests
+            return requests, afi_safis
 
         for conf_nei_addr_fam in conf_nei_addr_fams:
             afi_safi = {}
@@ -299,7 +329,7 @@ class Bgp_neighbors_af(ConfigBase):
                 allowas_in_cfg = {}
                 conf_allowas_in = conf_nei_addr_fam.get('allowas_in', None)
                 if conf_allowas_in:
-                    mat_allowas_in = self.get_allowas_in(match, conf_neighbor_val, conf_afi, conf_safi)
+                    mat_allowas_in = self.get_allowas_in(have, vrf_name, conf_neighbor_val, conf_afi, conf_safi)
                     origin = conf_allowas_in.get('origin', None)
                     if origin is not None:
                         if mat_allowas_in:
@@ -322,11 +352,7 @@ class Bgp_neighbors_af(ConfigBase):
             if afi_safi:
                 afi_safis.append(afi_safi)
 
-        if afi_safis:
-            payload = {"openconfig-network-instance:afi-safis": {"afi-safi": afi_safis}}
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
-
-        return requests
+        return requests, afi_safis
 
     def get_delete_neighbor_af_routemaps_requests(self, vrf_name, conf_neighbor_val, afi, safi, routes):
         requests = []
@@ -338,20 +364,24 @@ class Bgp_neighbors_af(ConfigBase):
             requests.append({'path': url, 'method': DELETE})
         return requests
 
-    def get_all_neighbors_af_modify_requests(self, match, conf_neighbors, vrf_name):
+    def get_all_neighbors_af_modify_requests(self, have, conf_neighbors, vrf_name):
+        """Return the requests to be sent before the address families of the
+        neighbors are modified, along with the neighbors payload"""
         requests = []
+        neighbors = []
         for conf_neighbor in conf_neighbors:
             conf_neighbor_val = conf_neighbor.get('neighbor', None)
             if conf_neighbor_val:
-                requests.extend(self.get_single_neighbors_af_modify_request(match, vrf_name, conf_neighbor_val, conf_neighbor))
-        return requests
+                nei_requests, afi_safis = self.get_single_neighbors_af_modify_request(have, vrf_name, conf_neighbor_val, conf_neighbor)
+                requests.extend(nei_requests)
+                if afi_safis:
+                    neighbors.append({'neighbor-address': conf_neighbor_val, 'afi-safis': {'afi-safi': afi_safis}})
+        return requests, neighbors
 
-    def get_modify_requests(self, conf, match, vrf_name):
+    def get_modify_requests(self, conf, have, vrf_name):
         requests = []
+        neighbors = []
         conf_neighbors = conf.get('neighbors', [])
-        mat_neighbors = []
-        if match and match.get('neighbors', None):
-            mat_neighbors = match.get('neighbors')
 
         if conf_neighbors:
             for conf_neighbor in conf_neighbors:
@@ -359,13 +389,8 @@ class Bgp_neighbors_af(ConfigBase):
                 if conf_neighbor_val is None:
                     continue
 
-                mat_neighbor = next((e_neighbor for e_neighbor in mat_neighbors if e_neighbor['neighbor'] == conf_neighbor_val), None)
-                if mat_neighbor is None:
-                    continue
-
                 conf_nei_addr_fams = conf_neighbor.get('address_family', None)
-                mat_nei_addr_fams = mat_neighbor.get('address_family', None)
-                if conf_nei_addr_fams is None or mat_nei_addr_fams is None:
+                if conf_nei_addr_fams is None:
                     continue
 
                 for conf_nei_addr_fam in conf_nei_addr_fams:
@@ -374,7 +399,7 @@ class Bgp_neighbors_af(ConfigBase):
                     if afi is None or safi is None:
                         continue
 
-                    mat_nei_addr_fam = next((addr_fam for addr_fam in mat_nei_addr_fams if (addr_fam['afi'] == afi and addr_fam['safi'] == safi)), None)
+                    mat_nei_addr_fam = self.find_neighbor_af(have, vrf_name, conf_neighbor_val, afi, safi)
                     if mat_nei_addr_fam is None:
                         continue
 
@@ -391,23 +416,35 @@ class Bgp_neighbors_af(ConfigBase):
                     if del_routes:
                         requests.extend(self.get_delete_neighbor_af_routemaps_requests(vrf_name, conf_neighbor_val, afi, safi, del_routes))
 
-            requests.extend(self.get_all_neighbors_af_modify_requests(match, conf_neighbors, vrf_name))
-        return requests
+            nei_requests, neighbors = self.get_all_neighbors_af_modify_requests(have, conf_neighbors, vrf_name)
+            requests.extend(nei_requests)
+        return requests, neighbors
 
     def get_modify_bgp_neighbors_af_requests(self, commands, have):
         requests = []
         if not commands:
             return requests
 
-        # Create URL and payload
+        # The address families of all the neighbors in a VRF are modified
+        # with a single request
+        vrf_neighbors = {}
         for conf in commands:
             vrf_name = conf['vrf_name']
             as_val = conf['bgp_as']
 
-            match = next((cfg for cfg in have if (cfg['vrf_name'] == vrf_name and (cfg['bgp_as'] == as_val))), None)
-            modify_reqs = self.get_modify_requests(conf, match, vrf_name)
+            vrf_have = []
+            if self.find_vrf(have, vrf_name, as_val):
+                vrf_have = have
+            modify_reqs, neighbors = self.get_modify_requests(conf, vrf_have, vrf_name)
             if modify_reqs:
                 requests.extend(modify_reqs)
+            if neighbors:
+                vrf_neighbors.setdefault(vrf_name, []).extend(neighbors)
+
+        for vrf_name, neighbors in vrf_neighbors.items():
+            url = '%s=%s/%s/neighbors' % (self.network_instance_path, vrf_name, self.protocol_bgp_path)
+            payload = {'openconfig-network-instance:neighbors': {'neighbor': neighbors}}
+            requests.append({'path': url, 'method': PATCH, 'data': payload})
 
         return requests
 
@@ -447,13 +484,11 @@ class Bgp_neighbors_af(ConfigBase):
 
         return requests
 
-    def process_delete_specific_params(self, vrf_name, conf_neighbor_val, conf_nei_addr_fam, conf_afi, conf_safi, matched_nei_addr_fams, url):
+    def process_delete_specific_params(self, vrf_name, conf_neighbor_val, conf_nei_addr_fam, conf_afi, conf_safi, have, url):
         requests = []
         conf_afi_safi_val = ("%s-%s" % (conf_afi, conf_safi))
 
-        mat_nei_addr_fam = None
-        if matched_nei_addr_fams:
-            mat_nei_addr_fam = next((e_af for e_af in matched_nei_addr_fams if (e_af['afi'] == conf_afi and e_af['safi'] == conf_safi)), None)
+        mat_nei_addr_fam = self.find_neighbor_af(have, vrf_name, conf_neighbor_val, conf_afi, conf_safi)
 
         if mat_nei_addr_fam:
             conf_alllowas_in = conf_nei_addr_fam.get('allowas_in', None)
@@ -507,7 +542,7 @@ class Bgp_neighbors_af(ConfigBase):
 
         return requests
 
-    def process_neighbor_delete_address_families(self, vrf_name, conf_nei_addr_fams, matched_nei_addr_fams, neighbor_val, is_delete_all):
+    def process_neighbor_delete_address_families(self, vrf_name, conf_nei_addr_fams, have, neighbor_val, is_delete_all):
         requests = []
 
         for conf_nei_addr_fam in conf_nei_addr_fams:
@@ -521,11 +556,11 @@ class Bgp_neighbors_af(ConfigBase):
             if is_delete_all:
                 requests.append({'path': url, 'method': DELETE})
             else:
-                requests.extend(self.process_delete_specific_params(vrf_name, neighbor_val, conf_nei_addr_fam, conf_afi, conf_safi, matched_nei_addr_fams, url))
+                requests.extend(self.process_delete_specific_params(vrf_name, neighbor_val, conf_nei_addr_fam, conf_afi, conf_safi, have, url))
 
         return requests
 
-    def get_delete_single_bgp_neighbors_af_request(self, conf, is_delete_all, match=None):
+    def get_delete_single_bgp_neighbors_af_request(self, conf, is_delete_all, match=None, have=None):
         requests = []
         vrf_name = conf['vrf_name']
         conf_neighbors = conf.get('neighbors', [])
@@ -537,9 +572,8 @@ class Bgp_neighbors_af(ConfigBase):
 
         if not conf_neighbors:
             return requests
-        mat_neighbors = None
-        if match:
-            mat_neighbors = match.get('neighbors', [])
+        if not match:
+            have = []
 
         for conf_neighbor in conf_neighbors:
             conf_neighbor_val = conf_neighbor.get('neighbor', None)
@@ -547,8 +581,8 @@ class Bgp_neighbors_af(ConfigBase):
                 continue
 
             mat_neighbor = None
-            if mat_neighbors:
-                mat_neighbor = next((e_nei for e_nei in mat_neighbors if e_nei['neighbor'] == conf_neighbor_val), None)
+            if have:
+                mat_neighbor = self.find_neighbor(have, vrf_name, conf_neighbor_val)
 
             conf_nei_addr_fams = conf_neighbor.get('address_family', None)
             if mat_neighbor and not conf_nei_addr_fams:
@@ -559,11 +593,7 @@ class Bgp_neighbors_af(ConfigBase):
             if not conf_nei_addr_fams:
                 continue
 
-            mat_nei_addr_fams = None
-            if mat_neighbor:
-                mat_nei_addr_fams = mat_neighbor.get('address_family', None)
-
-            requests.extend(self.process_neighbor_delete_address_families(vrf_name, conf_nei_addr_fams, mat_nei_addr_fams, conf_neighbor_val, is_delete_all))
+            requests.extend(self.process_neighbor_delete_address_families(vrf_name, conf_nei_addr_fams, have, conf_neighbor_val, is_delete_all))
 
         return requests
 
@@ -574,6 +604,6 @@ class Bgp_neighbors_af(ConfigBase):
             as_val = cmd['bgp_as']
             match = None
             if not is_delete_all:
-                match = next((have_cfg for have_cfg in have if have_cfg['vrf_name'] == vrf_name and have_cfg['bgp_as'] == as_val), None)
-            requests.extend(self.get_delete_single_bgp_neighbors_af_request(cmd, is_delete_all, match))
+                match = self.find_vrf(have, vrf_name, as_val)
+            requests.extend(self.get_delete_single_bgp_neighbors_af_request(cmd, is_delete_all, match, have))
         return requests
@@ -61,7 +61,8 @@ class Dhcp_relay(ConfigBase):
         'dhcp_relay',
     ]
 
-    dhcp_relay_intf_path = 'data/openconfig-relay-agent:relay-agent/dhcp/interfaces/interface={intf_name}'
+    dhcp_relay_intfs_path = 'data/openconfig-relay-agent:relay-agent/dhcp/interfaces'
+    dhcp_relay_intf_path = dhcp_relay_intfs_path + '/interface={intf_name}'
     dhcp_relay_intf_config_path = {
         'circuit_id': dhcp_relay_intf_path + '/agent-information-option/config/circuit-id',
         'link_select': dhcp_relay_intf_path + '/agent-information-option/config/openconfig-relay-agent-ext:link-select',
@@ -74,7 +75,8 @@ class Dhcp_relay(ConfigBase):
         'vrf_select': dhcp_relay_intf_path + '/agent-information-option/config/openconfig-relay-agent-ext:vrf-select'
     }
 
-    dhcpv6_relay_intf_path = 'data/openconfig-relay-agent:relay-agent/dhcpv6/interfaces/interface={intf_name}'
+    dhcpv6_relay_intfs_path = 'data/openconfig-relay-agent:relay-agent/dhcpv6/interfaces'
+    dhcpv6_relay_intf_path = dhcpv6_relay_intfs_path + '/interface={intf_name}'
     dhcpv6_relay_intf_config_path = {
         'max_hop_count': dhcpv6_relay_intf_path + '/config/openconfig-relay-agent-ext:max-hop-count',
         'server_address': dhcpv6_relay_intf_path + '/config/helper-address={server_address}',
@@ -207,6 +209,7 @@ class Dhcp_relay(ConfigBase):
         else:
             commands = want
             requests.extend(self.get_delete_dhcp_dhcpv6_relay_requests(commands, have))
+        requests = self.get_collapsed_delete_all_requests(requests, have)
 
         if len(requests) == 0:
             commands = []
@@ -227,6 +230,7 @@ class Dhcp_relay(ConfigBase):
         requests = []
 
         del_commands, del_requests = self.get_delete_commands_requests_for_replaced_overridden(want, have, 'replaced')
+        del_requests = self.get_collapsed_delete_all_requests(del_requests, have)
         if del_commands:
             new_have = get_diff(have, del_commands)
             commands = update_states(del_commands, 'deleted')
@@ -252,6 +256,7 @@ class Dhcp_relay(ConfigBase):
         requests = []
 
         del_commands, del_requests = self.get_delete_commands_requests_for_replaced_overridden(want, have, 'overridden')
+        del_requests = self.get_collapsed_delete_all_requests(del_requests, have)
         if del_commands:
             new_have = get_diff(have, del_commands)
             commands = update_states(del_commands, 'deleted')
@@ -271,112 +276,114 @@ class Dhcp_relay(ConfigBase):
         for all interfaces specified by the commands
         """
         requests = []
+        dhcp_relay_intfs = []
+        dhcpv6_relay_intfs = []
 
         for command in commands:
             if command.get('ipv4'):
-                requests.extend(self.get_modify_specific_dhcp_relay_param_requests(command))
+                intf_payload = self.get_modify_specific_dhcp_relay_param_payload(command)
+                if intf_payload:
+                    dhcp_relay_intfs.append(intf_payload)
             if command.get('ipv6'):
-                requests.extend(self.get_modify_specific_dhcpv6_relay_param_requests(command))
+                intf_payload = self.get_modify_specific_dhcpv6_relay_param_payload(command)
+                if intf_payload:
+                    dhcpv6_relay_intfs.append(intf_payload)
+
+        # The relay configurations of all the interfaces are modified
+        # with a single request for each address family
+        if dhcp_relay_intfs:
+            payload = {'openconfig-relay-agent:interfaces': {'interface': dhcp_relay_intfs}}
+            requests.append({'path': self.dhcp_relay_intfs_path, 'method': PATCH, 'data': payload})
+        if dhcpv6_relay_intfs:
+            payload = {'openconfig-relay-agent:interfaces': {'interface': dhcpv6_relay_intfs}}
+            requests.append({'path': self.dhcpv6_relay_intfs_path, 'method': PATCH, 'data': payload})
 
         return requests
 
-    def get_modify_specific_dhcp_relay_param_requests(self, command):
-        """Get requests to modify specific DHCP relay configurations
-        based on the command specified for the interface
+    def get_modify_specific_dhcp_relay_param_payload(self, command):
+        """Get the DHCP relay interface list entry to modify specific
+        DHCP relay configurations based on the command specified for the
+        interface
         """
-        requests = []
-
         name = command['name']
         ipv4 = command.get('ipv4')
         if not ipv4:
-            return requests
+            return {}
 
-        # Specifying appropriate order for merge to succeed
+        config = {}
+        agent_info_config = {}
         server_addresses = self.get_server_addresses(ipv4.get('server_addresses'))
         if server_addresses:
-            payload = {'openconfig-relay-agent:helper-address': list(server_addresses)}
-            url = self.dhcp_relay_intf_config_path['server_addresses_all'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            config['helper-address'] = list(server_addresses)
 
         if ipv4.get('vrf_name'):
-            payload = {'openconfig-relay-agent-ext:vrf': ipv4['vrf_name']}
-            url = self.dhcp_relay_intf_config_path['vrf_name'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            config['openconfig-relay-agent-ext:vrf'] = ipv4['vrf_name']
 
         if ipv4.get('source_interface'):
-            payload = {'openconfig-relay-agent-ext:src-intf': ipv4['source_interface']}
-            url = self.dhcp_relay_intf_config_path['source_interface'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            config['openconfig-relay-agent-ext:src-intf'] = ipv4['source_interface']
 
         if ipv4.get('link_select') is not None:
-            link_select = BOOL_TO_SELECT_VALUE[ipv4['link_select']]
-            payload = {'openconfig-relay-agent-ext:link-select': link_select}
-            url = self.dhcp_relay_intf_config_path['link_select'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            agent_info_config['openconfig-relay-agent-ext:link-select'] = BOOL_TO_SELECT_VALUE[ipv4['link_select']]
 
         if ipv4.get('max_hop_count'):
-            payload = {'openconfig-relay-agent-ext:max-hop-count': ipv4['max_hop_count']}
-            url = self.dhcp_relay_intf_config_path['max_hop_count'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            config['openconfig-relay-agent-ext:max-hop-count'] = ipv4['max_hop_count']
 
         if ipv4.get('vrf_select') is not None:
-            vrf_select = BOOL_TO_SELECT_VALUE[ipv4['vrf_select']]
-            payload = {'openconfig-relay-agent-ext:vrf-select': vrf_select}
-            url = self.dhcp_relay_intf_config_path['vrf_select'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            agent_info_config['openconfig-relay-agent-ext:vrf-select'] = BOOL_TO_SELECT_VALUE[ipv4['vrf_select']]
 
         if ipv4.get('policy_action'):
-            payload = {'openconfig-relay-agent-ext:policy-action': ipv4['policy_action'].upper()}
-            url = self.dhcp_relay_intf_config_path['policy_action'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            config['openconfig-relay-agent-ext:policy-action'] = ipv4['policy_action'].upper()
 
         if ipv4.get('circuit_id'):
-            payload = {'openconfig-relay-agent:circuit-id': ipv4['circuit_id']}
-            url = self.dhcp_relay_intf_config_path['circuit_id'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            agent_info_config['circuit-id'] = ipv4['circuit_id']
 
-        return requests
+        if not config and not agent_info_config:
+            return {}
 
-    def get_modify_specific_dhcpv6_relay_param_requests(self, command):
-        """Get requests to modify specific DHCPv6 relay configurations
-        based on the command specified for the interface
-        """
-        requests = []
+        config['id'] = name
+        intf_payload = {'id': name, 'config': config}
+        if agent_info_config:
+            intf_payload['agent-information-option'] = {'config': agent_info_config}
 
+        return intf_payload
+
+    def get_modify_specific_dhcpv6_relay_param_payload(self, command):
+        """Get the DHCPv6 relay interface list entry to modify specific
+        DHCPv6 relay configurations based on the command specified for the
+        interface
+        """
         name = command['name']
         ipv6 = command.get('ipv6')
         if not ipv6:
-            return requests
+            return {}
 
-        # Specifying appropriate order for merge to succeed
+        config = {}
+        options_config = {}
         server_addresses = self.get_server_addresses(ipv6.get('server_addresses'))
         if server_addresses:
-            payload = {'openconfig-relay-agent:helper-address': list(server_addresses)}
-            url = self.dhcpv6_relay_intf_config_path['server_addresses_all'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            config['helper-address'] = list(server_addresses)
 
         if ipv6.get('vrf_name'):
-            payload = {'openconfig-relay-agent-ext:vrf': ipv6['vrf_name']}
-            url = self.dhcpv6_relay_intf_config_path['vrf_name'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            config['openconfig-relay-agent-ext:vrf'] = ipv6['vrf_name']
 
         if ipv6.get('source_interface'):
-            payload = {'openconfig-relay-agent-ext:src-intf': ipv6['source_interface']}
-            url = self.dhcpv6_relay_intf_config_path['source_interface'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            config['openconfig-relay-agent-ext:src-intf'] = ipv6['source_interface']
 
         if ipv6.get('max_hop_count'):
-            payload = {'openconfig-relay-agent-ext:max-hop-count': ipv6['max_hop_count']}
-            url = self.dhcpv6_relay_intf_config_path['max_hop_count'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            config['openconfig-relay-agent-ext:max-hop-count'] = ipv6['max_hop_count']
 
         if ipv6.get('vrf_select') is not None:
-            vrf_select = BOOL_TO_SELECT_VALUE[ipv6['vrf_select']]
-            payload = {'openconfig-relay-agent-ext:vrf-select': vrf_select}
-            url = self.dhcpv6_relay_intf_config_path['vrf_select'].format(intf_name=name)
-            requests.append({'path': url, 'method': PATCH, 'data': payload})
+            options_config['openconfig-relay-agent-ext:vrf-select'] = BOOL_TO_SELECT_VALUE[ipv6['vrf_select']]
 
-        return requests
+        if not config and not options_config:
+            return {}
+
+        config['id'] = name
+        intf_payload = {'id': name, 'config': config}
+        if options_config:
+            intf_payload['options'] = {'config': options_config}
+
+        return intf_payload
 
     def get_delete_dhcp_dhcpv6_relay_completely_requests(self, have):
         """Get requests to delete all existing DHCP and DHCPv6 relay
@@ -567,6 +574,35 @@ class Dhcp_relay(ConfigBase):
         """
         return {'path': self.dhcpv6_relay_intf_config_path['server_addresses_all'].format(intf_name=intf_name), 'method': DELETE}
 
+    def get_collapsed_delete_all_requests(self, requests, have):
+        """Replace the requests to delete all DHCP (or DHCPv6) relay
+        configurations in each interface with a single request to delete
+        the relay interfaces list, when all the relay configurations of
+        more than one interface in the address family are deleted
+        """
+        for afi, intfs_path, intf_config_path in (('ipv4', self.dhcp_relay_intfs_path, self.dhcp_relay_intf_config_path),
+                                                  ('ipv6', self.dhcpv6_relay_intfs_path, self.dhcpv6_relay_intf_config_path)):
+            have_intf_names = set(cfg['name'] for cfg in have if cfg.get(afi))
+            if len(have_intf_names) < 2:
+                continue
+
+            del_all_paths = set(intf_config_path['server_addresses_all'].format(intf_name=intf_name) for intf_name in have_intf_names)
+            if not del_all_paths.issubset(request['path'] for request in requests if request['method'] == DELETE):
+                continue
+
+            collapsed_requests = []
+            is_collapsed = False
+            for request in requests:
+                if request['method'] == DELETE and request['path'] in del_all_paths:
+                    if not is_collapsed:
+                        collapsed_requests.append({'path': intfs_path, 'method': DELETE})
+                        is_collapsed = True
+                else:
+                    collapsed_requests.append(request)
+            requests = collapsed_requests
+
+        return requests
+
     def get_delete_commands_requests_for_replaced_overridden(self, want, have, state):
         """Returns the commands and requests necessary to remove applicable
         current configurations when state is replaced or overridden
@@ -93,6 +93,9 @@ class Dhcp_snooping(ConfigBase):
         result = {'changed': False}
         warnings = list()
 
+        # The source bindings are fetched from the device only when the
+        # task can modify them
+        self._module._sonic_dhcp_snooping_binding = self.is_source_bindings_needed()
         existing_dhcp_snooping_facts = self.get_dhcp_snooping_facts()
         commands, requests = self.set_config(existing_dhcp_snooping_facts)
         if commands:
@@ -209,6 +212,7 @@ class Dhcp_snooping(ConfigBase):
         else:
             # some mix of settings specified in both
             commands, requests = self.get_delete_specific_requests(afis)
+        requests = self.get_collapsed_source_bindings_delete_requests(requests, afis)
 
         if commands and len(requests) > 0:
             commands = update_states(commands, "deleted")
@@ -260,6 +264,7 @@ class Dhcp_snooping(ConfigBase):
                 afi_commands["afi"] = diff_unwanted_afi["afi"]
                 used_commands_per_afi.append(afi_commands)
             requests.extend(afi_requests)
+        requests = self.get_collapsed_source_bindings_delete_requests(requests, afis)
         if len(used_commands_per_afi):
             commands = {"afis": used_commands_per_afi}
         if commands and len(requests) > 0:
@@ -287,6 +292,7 @@ class Dhcp_snooping(ConfigBase):
 
         # do needed deletes
         commands, requests = self.get_delete_replaced_groupings(afis)
+        requests = self.get_collapsed_source_bindings_delete_requests(requests, afis)
         if commands and len(requests) > 0:
             commands = update_states(commands, "deleted")
         # getting what needs to be added/changed after deletes
@@ -302,6 +308,25 @@ class Dhcp_snooping(ConfigBase):
             commands.extend(merged_commands)
         return commands, requests
 
+    def is_source_bindings_needed(self):
+        '''returns whether the source bindings on the device are needed to handle the task'''
+        state = self._module.params['state']
+        if state == 'overridden':
+            return True
+
+        want = self._module.params['config']
+        if not want or not want.get('afis'):
+            # deleted with no afis specified deletes all config, including the bindings
+            return state == 'deleted'
+
+        for want_afi in want['afis']:
+            if want_afi.get('source_bindings') is not None:
+                return True
+            if state == 'deleted' and all(value is None for key, value in want_afi.items() if key != 'afi'):
+                # just afi key supplied, deletes all config for that afi
+                return True
+        return False
+
     def validate_config(self, config):
         '''validate passed in config is argspec compliant. Also does checks on values in ranges that ansible might not do'''
         validated_config = validate_config(self._module.argument_spec, config)
@@ -495,7 +520,7 @@ class Dhcp_snooping(ConfigBase):
             if len(want_afi["source_bindings"]) > 0:
                 to_delete_bindings = want_afi["source_bindings"]
                 # removing bindings that don't exist on device
-                existing_keys = [binding["mac_addr"] for binding in have_afi["source_bindings"]]
+                existing_keys = set(binding["mac_addr"] for binding in have_afi["source_bindings"])
                 for binding in list(to_delete_bindings):
                     if binding["mac_addr"] not in existing_keys:
                         # need to check by the key since can have two different versions of same binding
@@ -564,6 +589,36 @@ class Dhcp_snooping(ConfigBase):
         by afi'''
         return [{'path': self.binding_uri + '={mac},{ipv}'.format(mac=entry.get('mac_addr'), ipv=afi.get('afi')), 'method': self.delete_method_value}]
 
+    def get_collapsed_source_bindings_delete_requests(self, requests, afis):
+        '''replaces the requests deleting individual source bindings with a single request deleting the
+        source bindings list, when all the source bindings of both families on the device are deleted'''
+        have_keys = set()
+        for afi in (self.ipv4_key, self.ipv6_key):
+            have_afi = afis.get('have_' + afi)
+            if have_afi:
+                for binding in have_afi.get('source_bindings') or []:
+                    have_keys.add((binding['mac_addr'], afi))
+        if not have_keys:
+            return requests
+
+        entry_uri = self.binding_uri + '='
+        del_keys = set()
+        for request in requests:
+            if request['method'] == self.delete_method_value and request['path'].startswith(entry_uri):
+                del_keys.add(tuple(request['path'][len(entry_uri):].rsplit(',', 1)))
+        if not have_keys.issubset(del_keys):
+            return requests
+
+        collapsed_requests = []
+        for request in requests:
+            if request['method'] == self.delete_method_value and request['path'].startswith(entry_uri):
+                if del_keys:
+                    collapsed_requests.extend(self.get_delete_all_source_bindings_request())
+                    del_keys = None
+            else:
+                collapsed_requests.append(request)
+        return collapsed_requests
+
     def get_delete_replaced_groupings(self, afis):
         '''builds list of requests to handle replaced state for both address families'''
         modified_afi_commands = []
@@ -629,17 +684,22 @@ class Dhcp_snooping(ConfigBase):
         are different in each source binding when all data for it is needed instead. Fills in each source binding in diff with what is found for it in afis'''
         if not diff or not diff.get("afis"):
             return {}
+        bindings_index = {}
         for diff_afi in diff["afis"]:
             if "source_bindings" in diff_afi:
+                afi = diff_afi["afi"]
+                if afi not in bindings_index:
+                    bindings_index[afi] = self.get_bindings_index(afi, afis["want_" + afi]["source_bindings"])
                 for binding in diff_afi["source_bindings"]:
-                    binding.update(self.match_binding(binding["mac_addr"], afis["want_" + diff_afi["afi"]]["source_bindings"]))
+                    binding.update(bindings_index[afi].get((binding["mac_addr"], afi), {}))
 
     @staticmethod
-    def match_binding(mac_addr, bindings):
+    def get_bindings_index(afi, bindings):
+        '''returns the given source bindings of an afi family indexed by (mac_addr, afi)'''
+        bindings_index = {}
         for binding in bindings:
-            if binding["mac_addr"] == mac_addr:
-                return binding
-        return {}
+            bindings_index.setdefault((binding["mac_addr"], afi), binding)
+        return bindings_index
 
     @staticmethod
     def afi_to_vnum(afi):
@@ -115,6 +115,8 @@ class Interfaces(ConfigBase):
 
     def __init__(self, module):
         super(Interfaces, self).__init__(module)
+        self._default_intf_speeds = None
+        self._have_index = None
 
     def get_interfaces_facts(self):
         """ Get the 'facts' (the current configuration)
@@ -333,7 +335,7 @@ class Interfaces(ConfigBase):
         # Create URL and payload
         for cmd in commands:
             name = cmd['name']
-            have_conf = next((cfg for cfg in have if cfg['name'] == name), None)
+            have_conf = self.get_have_conf(name, have)
             if have_conf:
                 lp_key_set = set(cmd.keys())
                 if name.startswith('Loopback'):
@@ -589,7 +591,7 @@ class Interfaces(ConfigBase):
             else:
                 # Create Loopback in case not availble in have
                 if name.startswith('Loopback'):
-                    have_conf = next((cfg for cfg in have if cfg['name'] == name), None)
+                    have_conf = self.get_have_conf(name, have)
                     if not have_conf:
                         loopback_create_request = build_interfaces_create_request(name)
                         requests.append(loopback_create_request)
@@ -606,7 +608,7 @@ class Interfaces(ConfigBase):
                 if speed_request:
                     requests.append(speed_request)
 
-                have_conf = next((cfg for cfg in have if cfg['name'] == name), None)
+                have_conf = self.get_have_conf(name, have)
                 autoneg_request = self.build_create_autoneg_request(conf, have_conf)
                 if autoneg_request:
                     requests.append(autoneg_request)
@@ -614,34 +616,59 @@ class Interfaces(ConfigBase):
         return requests
 
     def retrieve_default_intf_speed(self, intf_name):
+        return self.get_default_intf_speeds().get(intf_name, 'SPEED_DEFAULT')
+
+    def get_default_intf_speeds(self):
+        """Return a dict mapping port names to their default speeds. The
+        valid speeds of all ports are read in a single request on first use
+        and the result is reused for the rest of the module run."""
+        if self._default_intf_speeds is not None:
+            return self._default_intf_speeds
 
         # Read the valid_speeds
-        dft_intf_speed = 'SPEED_DEFAULT'
+        self._default_intf_speeds = {}
         method = GET
-        sonic_port_url = 'data/sonic-port:sonic-port/PORT/PORT_LIST=%s'
-        sonic_port_vs_url = (sonic_port_url + '/valid_speeds') % quote(intf_name, safe='')
-        request = {"path": sonic_port_vs_url, "method": method}
+        sonic_port_url = 'data/sonic-port:sonic-port/PORT/PORT_LIST'
+        request = {"path": sonic_port_url, "method": method}
         try:
             response = edit_config(self._module, to_request(self._module, request))
-            if 'sonic-port:valid_speeds' in response[0][1]:
-                v_speeds = response[0][1].get('sonic-port:valid_speeds', '')
-                v_speeds_list = v_speeds.split(",")
-                v_speeds_int_list = []
-                for vs in v_speeds_list:
-                    v_speeds_int_list.append(int(vs))
-
-                dft_speed_int = 0
-                if v_speeds_int_list:
-                    dft_speed_int = max(v_speeds_int_list)
-                dft_intf_speed = intf_speed_map.get(dft_speed_int, 'SPEED_DEFAULT')
+            if 'sonic-port:PORT_LIST' in response[0][1]:
+                for port in response[0][1].get('sonic-port:PORT_LIST', []):
+                    intf_name = port.get('ifname', None)
+                    v_speeds = port.get('valid_speeds', None)
+                    if not intf_name or not v_speeds:
+                        continue
+
+                    try:
+                        v_speeds_int_list = [int(vs) for vs in v_speeds.split(",")]
+                    except ValueError:
+                        continue
+
+                    dft_speed_int = 0
+                    if v_speeds_int_list:
+                        dft_speed_int = max(v_speeds_int_list)
+                    self._default_intf_speeds[intf_name] = intf_speed_map.get(dft_speed_int, 'SPEED_DEFAULT')
 
         except Exception as exc:
             pass
 
-        return dft_intf_speed
+        return self._default_intf_speeds
+
+    def get_have_conf(self, name, have):
+        """Return the configuration of the specified interface in "have". The
+        name-indexed map of "have" is rebuilt only when a different list is
+        passed in."""
+        if (self._have_index is None or self._have_index['list'] is not have or
+                self._have_index['size'] != len(have)):
+            intfs = {}
+            for cfg in have:
+                intfs.setdefault(cfg['name'], cfg)
+            self._have_index = {'list': have, 'size': len(have), 'intfs': intfs}
+
+        return self._have_index['intfs'].get(name)
 
     def is_this_delete_required(self, conf, have):
-        intf = next((e_intf for e_intf in have if conf['name'] == e_intf['name']), None)
+        intf = self.get_have_conf(conf['name'], have)
         if intf:
             if (intf['name'].startswith('Loopback') or
                 not ((intf.get('description') is None or intf.get('description') == '') and
@@ -657,7 +684,7 @@ class Interfaces(ConfigBase):
 
     def is_this_change_required(self, conf, have):
         ret_flag = False
-        intf = next((e_intf for e_intf in have if conf['name'] == e_intf['name']), None)
+        intf = self.get_have_conf(conf['name'], have)
         if intf:
             # Check all parameter if any one is differen from existing
             for param in self.params:
@@ -38,6 +38,7 @@ TEST_KEYS = [
 
 DELETE = "DELETE"
 PATCH = "PATCH"
+L3_INTERFACES_URL = 'data/openconfig-interfaces:interfaces'
 
 
 class L3_interfaces(ConfigBase):
@@ -294,11 +295,16 @@ class L3_interfaces(ConfigBase):
 
         if not want:
             return requests
+
+        have_dict = {}
+        for e_cfg in have:
+            have_dict.setdefault(e_cfg['name'], e_cfg)
+
         for each_l3 in want:
             l3 = each_l3.copy()
             name = l3.pop('name')
             sub_intf = self.get_sub_interface_name(name)
-            have_obj = next((e_cfg for e_cfg in have if e_cfg['name'] == name), None)
+            have_obj = have_dict.get(name)
             if not have_obj:
                 continue
             have_ipv4_addrs = list()
@@ -352,20 +358,28 @@ class L3_interfaces(ConfigBase):
 
                 # Store the primary ip at end of the list. So primary ip will be deleted after the secondary ips
                 ipv4_del_reqs = []
-                if ipv4_addrs:
+                if ipv4_addrs and have_ipv4_addrs:
+                    have_ipv4_addr_dict = {}
+                    for addr in have_ipv4_addrs:
+                        have_ipv4_addr_dict.setdefault(addr['address'], addr)
+
+                    matched_addrs = set()
                     for ip in ipv4_addrs:
-                        if have_ipv4_addrs:
-                            match_ip = next((addr for addr in have_ipv4_addrs if addr['address'] == ip['address']), None)
-                            if match_ip:
-                                addr = ip['address'].split('/')[0]
-                                del_url = ipv4_addr_url.format(intf_name=name, sub_intf_name=sub_intf, address=addr)
-                                if match_ip['secondary']:
-                                    del_url += '/config/secondary'
-                                    ipv4_del_reqs.insert(0, {"path": del_url, "method": DELETE})
-                                else:
-                                    ipv4_del_reqs.append({"path": del_url, "method": DELETE})
-                            if ipv4_del_reqs:
-                                requests.extend(ipv4_del_reqs)
+                        match_ip = have_ipv4_addr_dict.get(ip['address'])
+                        if match_ip and ip['address'] not in matched_addrs:
+                            matched_addrs.add(ip['address'])
+                            addr = ip['address'].split('/')[0]
+                            del_url = ipv4_addr_url.format(intf_name=name, sub_intf_name=sub_intf, address=addr)
+                            if match_ip['secondary']:
+                                del_url += '/config/secondary'
+                                ipv4_del_reqs.insert(0, {"path": del_url, "method": DELETE})
+                            else:
+                                ipv4_del_reqs.append({"path": del_url, "method": DELETE})
+
+                    # Delete the addresses container when all the configured addresses are to be deleted
+                    if len(ipv4_del_reqs) > 1 and len(matched_addrs) == len(have_ipv4_addr_dict):
+                        ipv4_del_reqs = [{"path": ipv4_addrs_url_all.format(intf_name=name, sub_intf_name=sub_intf), "method": DELETE}]
+                    requests.extend(ipv4_del_reqs)
 
                 if ipv4_anycast_addrs:
                     for ip in ipv4_anycast_addrs:
@@ -390,12 +404,21 @@ class L3_interfaces(ConfigBase):
                         ipv6_addrs = l3['ipv6']['addresses']
                     if 'enabled' in l3['ipv6']:
                         ipv6_enabled = l3['ipv6']['enabled']
-                if ipv6_addrs:
+                if ipv6_addrs and have_ipv6_addrs:
+                    have_ipv6_addr_set = set(have_ipv6_addrs)
+                    matched_addrs = set()
+                    ipv6_del_reqs = []
                     for ip in ipv6_addrs:
-                        if have_ipv6_addrs and ip['address'] in have_ipv6_addrs:
+                        if ip['address'] in have_ipv6_addr_set and ip['address'] not in matched_addrs:
+                            matched_addrs.add(ip['address'])
                             addr = ip['address'].split('/')[0]
                             request = {"path": ipv6_addr_url.format(intf_name=name, sub_intf_name=sub_intf, address=addr), "method": DELETE}
-                            requests.append(request)
+                            ipv6_del_reqs.append(request)
+
+                    # Delete the addresses container when all the configured addresses are to be deleted
+                    if len(ipv6_del_reqs) > 1 and len(matched_addrs) == len(have_ipv6_addr_set):
+                        ipv6_del_reqs = [{"path": ipv6_addrs_url_all.format(intf_name=name, sub_intf_name=sub_intf), "method": DELETE}]
+                    requests.extend(ipv6_del_reqs)
 
                 if have_ipv6_enabled and ipv6_enabled is not None:
                     request = {"path": ipv6_enabled_url.format(intf_name=name, sub_intf_name=sub_intf), "method": DELETE}
@@ -456,23 +479,22 @@ class L3_interfaces(ConfigBase):
         return requests
 
     def get_create_l3_interfaces_requests(self, configs, have, want):
+        """Return the requests to configure the L3 interface attributes
+        specified in "configs". The attributes of all the interfaces are
+        merged into a single interfaces list PATCH, followed by a second PATCH
+        for the secondary IPv4 addresses so that primary addresses are always
+        configured first."""
         requests = []
         if not configs:
             return requests
 
-        ipv4_addrs_url = 'data/openconfig-interfaces:interfaces/interface={intf_name}/{sub_intf_name}/openconfig-if-ip:ipv4/addresses'
-        ipv4_anycast_url = 'data/openconfig-interfaces:interfaces/interface={intf_name}/{sub_intf_name}/openconfig-if-ip:ipv4/'
-        ipv4_anycast_url += 'openconfig-interfaces-ext:sag-ipv4/config/static-anycast-gateway'
-        ipv6_addrs_url = 'data/openconfig-interfaces:interfaces/interface={intf_name}/{sub_intf_name}/openconfig-if-ip:ipv6/addresses'
-        ipv6_enabled_url = 'data/openconfig-interfaces:interfaces/interface={intf_name}/{sub_intf_name}/openconfig-if-ip:ipv6/config'
-
+        intf_payloads = []
+        sec_intf_payloads = []
         for l3 in configs:
             l3_interface_name = l3.get('name')
             if l3_interface_name == "eth0":
                 continue
 
-            sub_intf = self.get_sub_interface_name(l3_interface_name)
-
             ipv4_addrs = []
             ipv4_anycast = []
             if l3.get('ipv4'):
@@ -489,6 +511,8 @@ class L3_interfaces(ConfigBase):
                 if 'enabled' in l3['ipv6']:
                     ipv6_enabled = l3['ipv6']['enabled']
 
+            ipv4_cfg = {}
+            sec_ipv4_cfg = {}
             if ipv4_addrs:
                 ipv4_addrs_pri_payload = []
                 ipv4_addrs_sec_payload = []
@@ -502,19 +526,14 @@ class L3_interfaces(ConfigBase):
                     else:
                         ipv4_addrs_pri_payload.append(self.build_create_addr_payload(ipv4, ipv4_mask, ipv4_secondary))
                 if ipv4_addrs_pri_payload:
-                    payload = self.build_create_payload(ipv4_addrs_pri_payload)
-                    ipv4_addrs_req = {"path": ipv4_addrs_url.format(intf_name=l3_interface_name, sub_intf_name=sub_intf), "method": PATCH, "data": payload}
-                    requests.append(ipv4_addrs_req)
+                    ipv4_cfg.update(self.build_create_payload(ipv4_addrs_pri_payload))
                 if ipv4_addrs_sec_payload:
-                    payload = self.build_create_payload(ipv4_addrs_sec_payload)
-                    ipv4_addrs_req = {"path": ipv4_addrs_url.format(intf_name=l3_interface_name, sub_intf_name=sub_intf), "method": PATCH, "data": payload}
-                    requests.append(ipv4_addrs_req)
+                    sec_ipv4_cfg.update(self.build_create_payload(ipv4_addrs_sec_payload))
 
             if ipv4_anycast:
-                anycast_payload = {'openconfig-interfaces-ext:static-anycast-gateway': ipv4_anycast}
-                anycast_url = ipv4_anycast_url.format(intf_name=l3_interface_name, sub_intf_name=sub_intf)
-                requests.append({'path': anycast_url, 'method': PATCH, 'data': anycast_payload})
+                ipv4_cfg['openconfig-interfaces-ext:sag-ipv4'] = {'config': {'static-anycast-gateway': ipv4_anycast}}
 
+            ipv6_cfg = {}
             if ipv6_addrs:
                 ipv6_addrs_payload = []
                 for item in ipv6_addrs:
@@ -523,14 +542,25 @@ class L3_interfaces(ConfigBase):
                     ipv6_mask = ipv6_addr_mask[1]
                     ipv6_addrs_payload.append(self.build_create_addr_payload(ipv6, ipv6_mask))
                 if ipv6_addrs_payload:
-                    payload = self.build_create_payload(ipv6_addrs_payload)
-                    ipv6_addrs_req = {"path": ipv6_addrs_url.format(intf_name=l3_interface_name, sub_intf_name=sub_intf), "method": PATCH, "data": payload}
-                    requests.append(ipv6_addrs_req)
+                    ipv6_cfg.update(self.build_create_payload(ipv6_addrs_payload))
 
             if ipv6_enabled is not None:
-                payload = self.build_update_ipv6_enabled(ipv6_enabled)
-                ipv6_enabled_req = {"path": ipv6_enabled_url.format(intf_name=l3_interface_name, sub_intf_name=sub_intf), "method": PATCH, "data": payload}
-                requests.append(ipv6_enabled_req)
+                ipv6_cfg.update(self.build_update_ipv6_enabled(ipv6_enabled))
+
+            ip_cfg = {}
+            if ipv4_cfg:
+                ip_cfg['openconfig-if-ip:ipv4'] = ipv4_cfg
+            if ipv6_cfg:
+                ip_cfg['openconfig-if-ip:ipv6'] = ipv6_cfg
+            if ip_cfg:
+                intf_payloads.append(self.build_create_intf_payload(l3_interface_name, ip_cfg))
+            if sec_ipv4_cfg:
+                sec_intf_payloads.append(self.build_create_intf_payload(l3_interface_name, {'openconfig-if-ip:ipv4': sec_ipv4_cfg}))
+
+        for payloads in (intf_payloads, sec_intf_payloads):
+            if payloads:
+                payload = {'openconfig-interfaces:interfaces': {'interface': payloads}}
+                requests.append({"path": L3_INTERFACES_URL, "method": PATCH, "data": payload})
 
         return requests
 
@@ -563,6 +593,15 @@ class L3_interfaces(ConfigBase):
         addr_payload = {'ip': ip, 'openconfig-if-ip:config': cfg}
         return addr_payload
 
+    def build_create_intf_payload(self, name, ip_cfg):
+        if name.startswith("Vlan"):
+            intf_payload = {'name': name, 'openconfig-vlan:routed-vlan': ip_cfg}
+        else:
+            sub_intf_payload = {'index': 0}
+            sub_intf_payload.update(ip_cfg)
+            intf_payload = {'name': name, 'subinterfaces': {'subinterface': [sub_intf_payload]}}
+        return intf_payload
+
     def get_sub_interface_name(self, name):
         sub_intf = "subinterfaces/subinterface=0"
         if name.startswith("Vlan"):
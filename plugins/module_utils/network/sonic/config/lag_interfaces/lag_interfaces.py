@@ -14,13 +14,6 @@ created
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
-try:
-    from urllib import quote
-except ImportError:
-    from urllib.parse import quote
-
-import json
-
 from copy import (
     deepcopy
 )
@@ -47,24 +40,13 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     get_new_config,
     get_formatted_config_diff
 )
-from ansible.module_utils._text import to_native
 from ansible.module_utils.connection import ConnectionError
-import traceback
-
-LIB_IMP_ERR = None
-ERR_MSG = None
-try:
-    import jinja2
-    HAS_LIB = True
-except Exception as e:
-    HAS_LIB = False
-    ERR_MSG = to_native(e)
-    LIB_IMP_ERR = traceback.format_exc()
-
 
 PUT = 'put'
 PATCH = 'patch'
 DELETE = 'delete'
+PORTCHANNEL_LIST_PATH = 'data/sonic-portchannel:sonic-portchannel/PORTCHANNEL/PORTCHANNEL_LIST'
+PORTCHANNEL_MEMBER_LIST_PATH = 'data/sonic-portchannel:sonic-portchannel/PORTCHANNEL_MEMBER/PORTCHANNEL_MEMBER_LIST'
 TEST_KEYS = [
     {'interfaces': {'member': ''}},
 ]
@@ -210,7 +192,7 @@ class Lag_interfaces(ConfigBase):
             list_obj = search_obj_in_list(i['name'], delete_members, "name")
             if list_obj:
                 replaced_list.append(list_obj)
-        requests = self.get_delete_lag_interfaces_requests(replaced_list)
+        requests = self.get_delete_lag_interfaces_requests(replaced_list, have)
         if requests:
             commands.extend(update_states(replaced_list, "deleted"))
         replaced_commands, replaced_requests = self.template_for_lag_creation(have, diff_members, diff_portchannels, "replaced")
@@ -239,7 +221,7 @@ class Lag_interfaces(ConfigBase):
             if list_obj:
                 replaced_list.append(list_obj)
 
-        requests = self.get_delete_lag_interfaces_requests(replaced_list)
+        requests = self.get_delete_lag_interfaces_requests(replaced_list, have)
         commands.extend(update_states(replaced_list, "deleted"))
 
         deleted_po_list = list()
@@ -298,10 +280,17 @@ class Lag_interfaces(ConfigBase):
         return diff_members, diff_portchannels
 
     def template_for_lag_creation(self, have, diff_members, diff_portchannels, state_name):
+        """Return the commands and requests to create the port channels and
+        add the members specified. All the new port channels are created using
+        a single PORTCHANNEL_LIST PATCH, followed by a single
+        PORTCHANNEL_MEMBER_LIST PATCH for all the members."""
         commands = list()
         requests = list()
+        new_portchannels = list()
+        member_requests = list()
         if diff_members:
-            commands_portchannels, requests = self.call_create_port_channel(diff_members, have)
+            commands_portchannels = self.get_new_port_channels(diff_members, have)
+            new_portchannels.extend(commands_portchannels)
             if commands_portchannels:
                 po_list = [{'name': x['name']} for x in commands_portchannels if x['name']]
             else:
@@ -310,16 +299,15 @@ class Lag_interfaces(ConfigBase):
                 commands.extend(update_states(po_list, state_name))
             diff_members_remove_none = [x for x in diff_members if x["members"]]
             if diff_members_remove_none:
-                request = self.create_lag_interfaces_requests(diff_members_remove_none)
-                if request:
-                    requests.extend(request)
-                else:
-                    requests = request
+                member_requests = self.create_lag_interfaces_requests(diff_members_remove_none)
             commands.extend(update_states(diff_members, state_name))
         if diff_portchannels:
-            portchannels, po_requests = self.call_create_port_channel(diff_portchannels, have)
-            requests.extend(po_requests)
+            portchannels = self.get_new_port_channels(diff_portchannels, have)
+            new_portchannels.extend(portchannels)
             commands.extend(update_states(portchannels, state_name))
+
+        requests.extend(self.create_port_channel(new_portchannels))
+        requests.extend(member_requests)
         return commands, requests
 
     def template_for_lag_deletion(self, have, delete_members, delete_portchannels, state_name):
@@ -328,7 +316,6 @@ class Lag_interfaces(ConfigBase):
         portchannel_requests = list()
         if delete_members:
             delete_members_remove_none = [x for x in delete_members if x["members"]]
-            requests = self.get_delete_lag_interfaces_requests(delete_members_remove_none)
             delete_all_members = [x for x in delete_members if "members" in x.keys() and not x["members"]]
             delete_all_list = list()
             if delete_all_members:
@@ -336,14 +323,7 @@ class Lag_interfaces(ConfigBase):
                     list_obj = search_obj_in_list(i['name'], have, "name")
                     if list_obj['members']:
                         delete_all_list.append(list_obj)
-            if delete_all_list:
-                deleteall_requests = self.get_delete_lag_interfaces_requests(delete_all_list)
-            else:
-                deleteall_requests = []
-            if requests and deleteall_requests:
-                requests.extend(deleteall_requests)
-            elif deleteall_requests:
-                requests = deleteall_requests
+            requests = self.get_delete_lag_interfaces_requests(delete_members_remove_none + delete_all_list, have)
             if requests:
                 commands.extend(update_states(delete_members, state_name))
         if delete_portchannels:
@@ -358,61 +338,53 @@ class Lag_interfaces(ConfigBase):
 
     def create_lag_interfaces_requests(self, commands):
         requests = []
+        members_payload = []
         for i in commands:
             if i.get('members') and i['members'].get('interfaces'):
                 interfaces = i['members']['interfaces']
             else:
                 continue
             for each in interfaces:
-                edit_payload = self.build_create_payload_member(i['name'])
-                template = 'data/openconfig-interfaces:interfaces/interface=%s/openconfig-if-ethernet:ethernet/config/openconfig-if-aggregate:aggregate-id'
-                edit_path = template % quote(each['member'], safe='')
-                request = {'path': edit_path, 'method': PATCH, 'data': edit_payload}
-                requests.append(request)
+                members_payload.append(self.build_create_payload_member(i['name'], each['member']))
+
+        if members_payload:
+            payload = {'sonic-portchannel:PORTCHANNEL_MEMBER_LIST': members_payload}
+            request = {'path': PORTCHANNEL_MEMBER_LIST_PATH, 'method': PATCH, 'data': payload}
+            requests.append(request)
         return requests
 
-    def build_create_payload_member(self, name):
-        payload_template = """{\n"openconfig-if-aggregate:aggregate-id": "{{name}}"\n}"""
-        input_data = {"name": name}
-        env = jinja2.Environment(autoescape=False)
-        t = env.from_string(payload_template)
-        intended_payload = t.render(input_data)
-        ret_payload = json.loads(intended_payload)
-        return ret_payload
+    def build_create_payload_member(self, name, member):
+        return {'name': name, 'ifname': member}
 
     def build_create_payload_portchannel(self, name, mode):
-        payload_template = """{\n"openconfig-interfaces:interfaces": {"interface": [{\n"name": "{{name}}",\n"config": {\n"name": "{{name}}"\n}"""
-        input_data = {"name": name}
+        payload = {'name': name}
         if mode == "static":
-            payload_template += """,\n "openconfig-if-aggregation:aggregation": {\n"config": {\n"lag-type": "{{mode}}"\n}\n}\n"""
-            input_data["mode"] = mode.upper()
-        payload_template += """}\n]\n}\n}"""
-        env = jinja2.Environment(autoescape=False)
-        t = env.from_string(payload_template)
-        intended_payload = t.render(input_data)
-        ret_payload = json.loads(intended_payload)
-        return ret_payload
+            payload['static'] = True
+        return payload
 
     def create_port_channel(self, cmd):
         requests = []
-        path = 'data/openconfig-interfaces:interfaces'
+        portchannels_payload = []
         for i in cmd:
-            payload = self.build_create_payload_portchannel(i['name'], i.get('mode', None))
-            request = {'path': path, 'method': PATCH, 'data': payload}
+            portchannels_payload.append(self.build_create_payload_portchannel(i['name'], i.get('mode', None)))
+
+        if portchannels_payload:
+            payload = {'sonic-portchannel:PORTCHANNEL_LIST': portchannels_payload}
+            request = {'path': PORTCHANNEL_LIST_PATH, 'method': PATCH, 'data': payload}
             requests.append(request)
         return requests
 
-    def call_create_port_channel(self, commands, have):
+    def get_new_port_channels(self, commands, have):
+        have_names = set(d['name'] for d in have)
         commands_list = list()
         for c in commands:
-            if not any(d['name'] == c['name'] for d in have):
+            if c['name'] not in have_names:
                 commands_list.append(c)
-        requests = self.create_port_channel(commands_list)
-        return commands_list, requests
+        return commands_list
 
     def get_delete_all_lag_interfaces_requests(self):
         requests = []
-        delete_all_lag_url = 'data/sonic-portchannel:sonic-portchannel/PORTCHANNEL_MEMBER/PORTCHANNEL_MEMBER_LIST'
+        delete_all_lag_url = PORTCHANNEL_MEMBER_LIST_PATH
         method = DELETE
         delete_all_lag_request = {"path": delete_all_lag_url, "method": method}
         requests.append(delete_all_lag_request)
@@ -420,17 +392,21 @@ class Lag_interfaces(ConfigBase):
 
     def get_delete_all_portchannel_requests(self):
         requests = []
-        delete_all_lag_url = 'data/sonic-portchannel:sonic-portchannel/PORTCHANNEL/PORTCHANNEL_LIST'
+        delete_all_lag_url = PORTCHANNEL_LIST_PATH
         method = DELETE
         delete_all_lag_request = {"path": delete_all_lag_url, "method": method}
         requests.append(delete_all_lag_request)
         return requests
 
-    def get_delete_lag_interfaces_requests(self, commands):
+    def get_delete_lag_interfaces_requests(self, commands, have=None):
+        """Return the requests to remove the specified port channel members.
+        When all the members configured in "have" are to be removed, a single
+        PORTCHANNEL_MEMBER_LIST DELETE is used instead of per-member requests."""
         requests = []
         # Create URL and payload
         url = 'data/openconfig-interfaces:interfaces/interface={}/openconfig-if-ethernet:ethernet/config/openconfig-if-aggregate:aggregate-id'
         method = DELETE
+        del_members = set()
         for c in commands:
             if c.get('members') and c['members'].get('interfaces'):
                 interfaces = c['members']['interfaces']
@@ -439,9 +415,21 @@ class Lag_interfaces(ConfigBase):
 
             for each in interfaces:
                 ifname = each["member"]
+                if (c['name'], ifname) in del_members:
+                    continue
+                del_members.add((c['name'], ifname))
                 request = {"path": url.format(ifname), "method": method}
                 requests.append(request)
 
+        if have and len(requests) > 1:
+            have_members = set()
+            for cfg in have:
+                if cfg.get('members') and cfg['members'].get('interfaces'):
+                    for each in cfg['members']['interfaces']:
+                        have_members.add((cfg['name'], each['member']))
+            if have_members and have_members.issubset(del_members):
+                requests = self.get_delete_all_lag_interfaces_requests()
+
         return requests
 
     def get_delete_portchannel_requests(self, commands):
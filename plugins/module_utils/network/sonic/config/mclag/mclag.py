@@ -28,7 +28,6 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     update_states,
     get_diff,
-    get_ranges_in_list,
     get_normalize_interface_name,
     normalize_interface_name
 )
@@ -240,9 +239,19 @@ class Mclag(ConfigBase):
                 diff_want['peer_gateway'] = {'vlans': del_peer_gateway_vlans}
 
             if diff_want:
-                requests = self.get_delete_mclag_attribute_requests(have['domain_id'], diff_want)
-                if len(requests) > 0:
-                    commands = update_states(diff_want, "deleted")
+                commands = update_states(diff_want, "deleted")
+                del_command = diff_want
+                # Delete the VLAN list with a single request, instead of
+                # one request per VLAN, when all configured VLANs are deleted
+                for option in ('unique_ip', 'peer_gateway'):
+                    if diff_want.get(option) and self.is_vlan_range_covered(diff_want[option]['vlans'], have[option]['vlans']):
+                        if del_command is diff_want:
+                            del_command = deepcopy(diff_want)
+                        del_command[option]['vlans'] = None
+
+                requests = self.get_delete_mclag_attribute_requests(have['domain_id'], del_command)
+                if not requests:
+                    commands = []
         return commands, requests
 
     def _state_replaced_overridden(self, want, have, state):
@@ -304,13 +313,13 @@ class Mclag(ConfigBase):
                                 delete_all_vlans[option] = True
                                 del_command[option] = have_cfg
                             else:
-                                have_vlans = set(self.get_vlan_id_list(have_cfg['vlans']))
-                                want_vlans = set(self.get_vlan_id_list(want_cfg['vlans']))
-                                if have_vlans.intersection(want_vlans):
-                                    del_command[option] = {'vlans': self.get_vlan_range_list(list(have_vlans - want_vlans))}
+                                have_vlans = self.get_vlan_interval_list(have_cfg['vlans'])
+                                want_vlans = self.get_vlan_interval_list(want_cfg['vlans'])
+                                if self.get_vlan_interval_common(have_vlans, want_vlans):
+                                    del_command[option] = {'vlans': self.get_vlan_range_list(self.get_vlan_interval_diff(have_vlans, want_vlans))}
                                     if not del_command[option]['vlans']:
                                         del_command.pop(option)
-                                    add_command[option] = {'vlans': self.get_vlan_range_list(list(want_vlans - have_vlans))}
+                                    add_command[option] = {'vlans': self.get_vlan_range_list(self.get_vlan_interval_diff(want_vlans, have_vlans))}
                                     if not add_command[option]['vlans']:
                                         add_command.pop(option)
                                 else:
@@ -566,9 +575,9 @@ class Mclag(ConfigBase):
         if not match_vlans:
             return []
 
-        config_vlans = self.get_vlan_id_list(config_vlans)
-        match_vlans = self.get_vlan_id_list(match_vlans)
-        return self.get_vlan_range_list(list(set(config_vlans).intersection(set(match_vlans))))
+        config_intervals = self.get_vlan_interval_list(config_vlans)
+        match_intervals = self.get_vlan_interval_list(match_vlans)
+        return self.get_vlan_range_list(self.get_vlan_interval_common(config_intervals, match_intervals))
 
     def get_vlan_range_diff(self, config_vlans, match_vlans):
         """Returns the vlan ranges present only in 'config_vlans'
@@ -580,38 +589,102 @@ class Mclag(ConfigBase):
         if not match_vlans:
             return config_vlans
 
-        config_vlans = self.get_vlan_id_list(config_vlans)
-        match_vlans = self.get_vlan_id_list(match_vlans)
-        return self.get_vlan_range_list(list(set(config_vlans) - set(match_vlans)))
+        config_intervals = self.get_vlan_interval_list(config_vlans)
+        match_intervals = self.get_vlan_interval_list(match_vlans)
+        return self.get_vlan_range_list(self.get_vlan_interval_diff(config_intervals, match_intervals))
+
+    def is_vlan_range_covered(self, config_vlans, match_vlans):
+        """Returns True if every VLAN in 'match_vlans' is also
+        present in 'config_vlans'
+        """
+        if not match_vlans:
+            return False
+
+        config_intervals = self.get_vlan_interval_list(config_vlans)
+        match_intervals = self.get_vlan_interval_list(match_vlans)
+        return not self.get_vlan_interval_diff(match_intervals, config_intervals)
+
+    @staticmethod
+    def get_vlan_interval_list(vlan_range_list):
+        """Returns a sorted list of non-overlapping (start, end) VLAN ID
+        intervals for the VLAN ranges specified in VLAN range list"""
+        intervals = []
+        if vlan_range_list:
+            for vlan_range in vlan_range_list:
+                match = re.match(r'Vlan(\d+)(?:-(\d+))?$', vlan_range['vlan'])
+                if match:
+                    start = int(match.group(1))
+                    end = int(match.group(2)) if match.group(2) else start
+                    if start <= end:
+                        intervals.append((start, end))
+
+        merged_intervals = []
+        for start, end in sorted(intervals):
+            if merged_intervals and start <= merged_intervals[-1][1] + 1:
+                if end > merged_intervals[-1][1]:
+                    merged_intervals[-1] = (merged_intervals[-1][0], end)
+            else:
+                merged_intervals.append((start, end))
+
+        return merged_intervals
+
+    @staticmethod
+    def get_vlan_interval_common(intervals, match_intervals):
+        """Returns the intersection of two sorted VLAN ID interval lists"""
+        common_intervals = []
+        idx = match_idx = 0
+        while idx < len(intervals) and match_idx < len(match_intervals):
+            start = max(intervals[idx][0], match_intervals[match_idx][0])
+            end = min(intervals[idx][1], match_intervals[match_idx][1])
+            if start <= end:
+                common_intervals.append((start, end))
+            if intervals[idx][1] < match_intervals[match_idx][1]:
+                idx += 1
+            else:
+                match_idx += 1
+
+        return common_intervals
+
+    @staticmethod
+    def get_vlan_interval_diff(intervals, match_intervals):
+        """Returns the VLAN ID intervals present only in 'intervals'
+        and not in 'match_intervals'"""
+        diff_intervals = []
+        match_idx = 0
+        for start, end in intervals:
+            while match_idx < len(match_intervals) and match_intervals[match_idx][1] < start:
+                match_idx += 1
+
+            idx = match_idx
+            while idx < len(match_intervals) and match_intervals[idx][0] <= end:
+                if match_intervals[idx][0] > start:
+                    diff_intervals.append((start, match_intervals[idx][0] - 1))
+                start = match_intervals[idx][1] + 1
+                idx += 1
+
+            if start <= end:
+                diff_intervals.append((start, end))
+
+        return diff_intervals
 
     @staticmethod
     def get_vlan_id_list(vlan_range_list):
         """Returns a list of all VLAN IDs specified in VLAN range list"""
         vlan_id_list = []
-        if vlan_range_list:
-            for vlan_range in vlan_range_list:
-                vlan_val = vlan_range['vlan']
-                if '-' in vlan_val:
-                    match = re.match(r'Vlan(\d+)-(\d+)', vlan_val)
-                    if match:
-                        vlan_id_list.extend(range(int(match.group(1)), int(match.group(2)) + 1))
-                else:
-                    # Single VLAN ID
-                    match = re.match(r'Vlan(\d+)', vlan_val)
-                    if match:
-                        vlan_id_list.append(int(match.group(1)))
+        for start, end in Mclag.get_vlan_interval_list(vlan_range_list):
+            vlan_id_list.extend(range(start, end + 1))
 
         return vlan_id_list
 
     @staticmethod
-    def get_vlan_range_list(vlan_id_list):
-        """Returns a list of VLAN ranges for given list of VLAN IDs
-        in vlans spec format"""
+    def get_vlan_range_list(vlan_interval_list):
+        """Returns a list of VLAN ranges for given list of VLAN ID
+        intervals in vlans spec format"""
         vlan_range_list = []
-
-        if vlan_id_list:
-            vlan_id_list.sort()
-            for vlan_range in get_ranges_in_list(vlan_id_list):
-                vlan_range_list.append({'vlan': 'Vlan{0}'.format('-'.join(map(str, (vlan_range[0], vlan_range[-1])[:len(vlan_range)])))})
+        for start, end in vlan_interval_list:
+            if start == end:
+                vlan_range_list.append({'vlan': 'Vlan{0}'.format(start)})
+            else:
+                vlan_range_list.append({'vlan': 'Vlan{0}-{1}'.format(start, end)})
 
         return vlan_range_list
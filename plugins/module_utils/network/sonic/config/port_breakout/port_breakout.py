@@ -29,7 +29,8 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     update_states,
     get_diff,
     get_speed_from_breakout_mode,
-    get_breakout_mode,
+    get_breakout_modes,
+    clear_breakout_modes_cache,
 )
 
 PATCH = 'patch'
@@ -81,6 +82,7 @@ class Port_breakout(ConfigBase):
                     edit_config(self._module, to_request(self._module, requests))
                 except ConnectionError as exc:
                     self._module.fail_json(msg=str(exc), code=exc.code)
+                clear_breakout_modes_cache(self._module)
             result['changed'] = True
         result['commands'] = commands
 
@@ -277,9 +279,10 @@ class Port_breakout(ConfigBase):
 
     def get_all_breakout_mode(self, have):
         new_have = []
+        breakout_modes = get_breakout_modes(self._module) if have else {}
         for cfg in have:
             name = cfg['name']
-            mode = get_breakout_mode(self._module, name)
+            mode = breakout_modes.get(name, None)
             if mode:
                 new_have.append({'name': name, 'mode': mode})
         return new_have
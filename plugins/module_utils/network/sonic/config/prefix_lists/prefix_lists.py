@@ -20,6 +20,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     to_list,
+    remove_empties,
 )
 
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts \
@@ -27,7 +28,6 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils \
     import (
-        get_diff,
         update_states,
     )
 
@@ -46,6 +46,9 @@ TEST_KEYS = [
 DELETE = "delete"
 PATCH = "patch"
 
+# Maximum number of prefixes carried by a single prefix set PATCH request
+PREFIX_CHUNK_SIZE = 5000
+
 
 class Prefix_lists(ConfigBase):
     """
@@ -76,6 +79,9 @@ openconfig-routing-policy-ext:extended-prefixes/extended-prefix={},{},{}'
 
     def __init__(self, module):
         super(Prefix_lists, self).__init__(module)
+        self._prefix_set_index = None
+        self._prefix_indexes = {}
+        self._prefix_net_cache = {}
 
     def get_prefix_lists_facts(self):
         """ Get the 'facts' (the current configuration)
@@ -144,7 +150,7 @@ openconfig-routing-policy-ext:extended-prefixes/extended-prefix={},{},{}'
         commands = []
         requests = []
         state = self._module.params['state']
-        diff = get_diff(want, have, TEST_KEYS)
+        diff = self.get_prefix_lists_diff(want, have)
         if state == 'deleted':
             commands, requests = self._state_deleted(want, have)
         elif state == 'merged':
@@ -247,16 +253,53 @@ openconfig-routing-policy-ext:extended-prefixes/extended-prefix={},{},{}'
         if not commands:
             return requests
 
-        # Create URL and payload
+        # Create URL and payload. The prefix sets are split across as many
+        # requests as needed to limit the number of prefixes in each request
+        # to PREFIX_CHUNK_SIZE.
         prefix_set_payload_list = []
+        chunk_prefix_count = 0
         for command in commands:
             prefix_set_payload = self.get_modify_single_prefix_set_request(command)
-            if prefix_set_payload:
-                prefix_set_payload_list.append(prefix_set_payload)
+            if not prefix_set_payload:
+                continue
+
+            for prefix_set_chunk in self.get_prefix_set_payload_chunks(prefix_set_payload):
+                prefix_count = len(prefix_set_chunk[self.ext_prefix_set_data_path]['extended-prefix'])
+                if prefix_set_payload_list and chunk_prefix_count + prefix_count > PREFIX_CHUNK_SIZE:
+                    requests.append(self.get_modify_prefix_sets_request(prefix_set_payload_list))
+                    prefix_set_payload_list = []
+                    chunk_prefix_count = 0
+                prefix_set_payload_list.append(prefix_set_chunk)
+                chunk_prefix_count += prefix_count
+
+        requests.append(self.get_modify_prefix_sets_request(prefix_set_payload_list))
+        return requests
+
+    def get_modify_prefix_sets_request(self, prefix_set_payload_list):
+        '''Create and return a REST API request to modify the prefix sets
+        specified by the input list of prefix set payloads.'''
+
         prefix_set_data = {self.prefix_set_data_path: prefix_set_payload_list}
         request = {'path': self.prefix_set_uri, 'method': PATCH, 'data': prefix_set_data}
-        requests.append(request)
-        return requests
+        return request
+
+    def get_prefix_set_payload_chunks(self, prefix_set_payload):
+        '''Generate the payloads needed to modify the prefix set specified by
+        the "prefix_set_payload" input parameter with no more than
+        PREFIX_CHUNK_SIZE prefixes in each payload.'''
+
+        pfx_conf_list = prefix_set_payload[self.ext_prefix_set_data_path]['extended-prefix']
+        if len(pfx_conf_list) <= PREFIX_CHUNK_SIZE:
+            yield prefix_set_payload
+            return
+
+        for chunk_start in range(0, len(pfx_conf_list), PREFIX_CHUNK_SIZE):
+            prefix_set_chunk = {'name': prefix_set_payload['name'],
+                                'config': prefix_set_payload['config']}
+            prefix_set_chunk[self.ext_prefix_set_data_path] = {
+                'extended-prefix': pfx_conf_list[chunk_start:chunk_start + PREFIX_CHUNK_SIZE]
+            }
+            yield prefix_set_chunk
 
     def get_modify_single_prefix_set_request(self, command):
         '''Create and return the appropriate set of REST API requests to modfy
@@ -436,60 +479,53 @@ openconfig-routing-policy-ext:extended-prefixes/extended-prefix={},{},{}'
         '''Determine if the prefix set specifid by "pfx_set_name" is present in
         the current switch configuration. If it is present, return the "found"
         prefix set. (Otherwise, return "None"'''
-        for cfg_prefix_set in have:
-            cfg_prefix_set_name = cfg_prefix_set.get('name', None)
-            if cfg_prefix_set_name and cfg_prefix_set_name == pfx_set_name:
-                return cfg_prefix_set
+        if not pfx_set_name or not have:
+            return None
 
-        return None
+        if self._prefix_set_index is None or self._prefix_set_index[0] is not have:
+            prefix_set_index = {}
+            for cfg_prefix_set in have:
+                cfg_prefix_set_name = cfg_prefix_set.get('name', None)
+                if cfg_prefix_set_name:
+                    prefix_set_index.setdefault(cfg_prefix_set_name, cfg_prefix_set)
+            self._prefix_set_index = (have, prefix_set_index)
+
+        return self._prefix_set_index[1].get(pfx_set_name)
+
+    @staticmethod
+    def get_prefix_key(prefix):
+        '''Return the key used to index the prefix specified by the "prefix"
+        input parameter. Unspecified (or zero) "ge" and "le" values are
+        treated as equivalent.'''
+        return (prefix.get('sequence') or None, prefix.get('prefix') or None,
+                prefix.get('ge') or None, prefix.get('le') or None)
+
+    def get_prefix_index(self, cfg_prefix_set):
+        '''Return an index, keyed by (sequence, prefix, ge, le), of the prefixes
+        in the prefix set specified by the "cfg_prefix_set" input parameter.
+        The index for a given prefix set is built only once per module run.'''
+        cfg_prefix_list = cfg_prefix_set.get('prefixes') or []
+        index_entry = self._prefix_indexes.get(id(cfg_prefix_set))
+        if (index_entry is None or index_entry[0] is not cfg_prefix_set or
+                index_entry[1] is not cfg_prefix_list or index_entry[2] != len(cfg_prefix_list)):
+            prefix_index = {}
+            for cfg_prefix in cfg_prefix_list:
+                prefix_index.setdefault(self.get_prefix_key(cfg_prefix), cfg_prefix)
+            index_entry = (cfg_prefix_set, cfg_prefix_list, len(cfg_prefix_list), prefix_index)
+            self._prefix_indexes[id(cfg_prefix_set)] = index_entry
+
+        return index_entry[3]
 
     def prefix_in_prefix_list_cfg(self, prefix, cfg_prefix_set):
         '''Determine, based on the keys, if the "target" prefix specified by the "prefix"
         input parameter is present in the currently configured prefix set specified
         ty the "cfg_prefix_set" input parameter. Return "True" if the prifix is found,
         or "False" if it isn't.'''
-        req_pfx = prefix.get("prefix", None)
-        req_seq = prefix.get("sequence", None)
-        req_ge = prefix.get("ge", None)
-        req_le = prefix.get("le", None)
-
-        cfg_prefix_list = cfg_prefix_set.get("prefixes", None)
-        if not cfg_prefix_list:     # The configured prefix set has no prefix list
+        prefix_key = self.get_prefix_key(prefix)
+        if not prefix_key[0] or not prefix_key[1]:
             return False
 
-        for cfg_prefix in cfg_prefix_list:
-            cfg_pfx = cfg_prefix.get("prefix", None)
-            cfg_seq = cfg_prefix.get("sequence", None)
-            cfg_ge = cfg_prefix.get("ge", None)
-            cfg_le = cfg_prefix.get("le", None)
-
-            # Check for matching key attributes
-            if not (req_pfx and cfg_pfx and req_pfx == cfg_pfx):
-                continue
-            if not (req_seq and cfg_seq and req_seq == cfg_seq):
-                continue
-
-            # Check for ge match
-            if not req_ge:
-                if cfg_ge:
-                    continue
-            else:
-                if not cfg_ge or req_ge != cfg_ge:
-                    continue
-
-            # Check for le match
-            if not req_le:
-                if cfg_le:
-                    continue
-            else:
-                if not cfg_le or req_le != cfg_le:
-                    continue
-
-            # All key attributes match for this cfg_prefix
-            return True
-
-        # No matching configured prefixes were found in the prefix set.
-        return False
+        return prefix_key in self.get_prefix_index(cfg_prefix_set)
 
     def set_ipaddress_net_attrs(self, prefix_val, conf_afi):
         '''Create and return a dictionary containing the values for any prefix-related
@@ -497,6 +533,10 @@ openconfig-routing-policy-ext:extended-prefixes/extended-prefix={},{},{}'
         method should be replaced with use of the Python "ipaddress" module after
         Ansible drops downward compatibility support for Python 2.7.'''
 
+        prefix_net = self._prefix_net_cache.get((prefix_val, conf_afi))
+        if prefix_net is not None:
+            return prefix_net
+
         prefix_net = dict()
         if conf_afi == 'ipv4':
             prefix_net['max_prefixlen'] = 32
@@ -504,8 +544,57 @@ openconfig-routing-policy-ext:extended-prefixes/extended-prefix={},{},{}'
             prefix_net['max_prefixlen'] = 128
 
         prefix_net['prefixlen'] = int(prefix_val.split("/")[1])
+        self._prefix_net_cache[(prefix_val, conf_afi)] = prefix_net
         return prefix_net
 
+    def get_prefix_lists_diff(self, want, have):
+        '''Return the prefix set configuration specified in "want" that is not
+        present in "have". The result is the same as that of "get_diff" using
+        TEST_KEYS, without the attributes that are not specified, but the
+        prefixes of each prefix set are compared using indexed lookups so
+        that the comparison time grows linearly with the number of prefixes.'''
+
+        if not want or not have:
+            return want or []
+
+        diff = []
+        have_sets = {}
+        for cfg_prefix_set in have:
+            have_sets.setdefault((cfg_prefix_set.get('afi'), cfg_prefix_set.get('name')), cfg_prefix_set)
+
+        for prefix_set in want:
+            cfg_prefix_set = have_sets.get((prefix_set.get('afi'), prefix_set.get('name')))
+            if cfg_prefix_set is None:
+                prefix_set_diff = remove_empties(prefix_set)
+                if prefix_set_diff is not None:
+                    diff.append(prefix_set_diff)
+                continue
+
+            prefixes = prefix_set.get('prefixes')
+            if not prefixes:
+                continue
+
+            if not cfg_prefix_set.get('prefixes'):
+                prefixes_diff = [remove_empties(prefix) for prefix in prefixes]
+            else:
+                prefix_index = self.get_prefix_index(cfg_prefix_set)
+                prefixes_diff = []
+                for prefix in prefixes:
+                    cfg_prefix = prefix_index.get(self.get_prefix_key(prefix))
+                    if cfg_prefix is None:
+                        prefixes_diff.append(remove_empties(prefix))
+                    elif prefix.get('action') is not None and prefix['action'] != cfg_prefix.get('action'):
+                        prefix_diff = {'action': prefix['action']}
+                        for test_key in ('ge', 'le', 'prefix', 'sequence'):
+                            prefix_diff[test_key] = prefix.get(test_key)
+                        prefixes_diff.append(remove_empties(prefix_diff))
+
+            if prefixes_diff:
+                diff.append({'afi': prefix_set.get('afi'), 'name': prefix_set.get('name'),
+                             'prefixes': prefixes_diff})
+
+        return diff
+
     def sort_lists_in_config(self, config):
         if config:
             config.sort(key=self.get_name)
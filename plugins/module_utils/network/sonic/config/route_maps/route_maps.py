@@ -69,6 +69,45 @@ class Route_maps(ConfigBase):
     route_map_stmt_base_uri = route_map_uri + '/statements/statement={1}/'
     route_maps_data_path = 'openconfig-routing-policy:policy-definitions'
 
+    match_top_level_keys = [
+        'as_path',
+        'community',
+        'ext_comm',
+        'interface',
+        'ipv6',
+        'local_preference',
+        'metric',
+        'origin',
+        'peer',
+        'source_protocol',
+        'source_vrf',
+        'tag'
+    ]
+
+    match_multi_level_keys = [
+        'evpn',
+        'ip',
+    ]
+
+    # Top level keys: Note: Although "metric" is defined as a dictionary, it
+    # is handled as a "top level" attribute because it can contain
+    # only one configured member (either an rtt_action or a "value").
+    set_top_level_keys = [
+        'as_path_prepend',
+        'comm_list_delete',
+        'ip_next_hop',
+        'local_preference',
+        'metric',
+        'origin',
+        'weight',
+    ]
+
+    set_multi_level_keys = [
+        'community',
+        'extcommunity',
+        'ipv6_next_hop'
+    ]
+
     set_community_rest_names = {
         'additive': 'openconfig-routing-policy-ext:ADDITIVE',
         'local_as': 'openconfig-bgp-types:NO_EXPORT_SUBCONFED',
@@ -85,6 +124,7 @@ class Route_maps(ConfigBase):
 
     def __init__(self, module):
         super(Route_maps, self).__init__(module)
+        self._route_map_indexes = {}
 
     def get_route_maps_facts(self):
         """ Get the 'facts' (the current configuration)
@@ -295,21 +335,30 @@ class Route_maps(ConfigBase):
         if not commands:
             return requests
 
-        # Create URL and payload
+        # Create URL and payload. The statements for each route map are
+        # consolidated into a single "policy-definition" entry so that all
+        # route maps in the command list are configured with one request.
         route_maps_payload_list = []
         route_maps_payload_dict = {'policy-definition': route_maps_payload_list}
+        route_map_payloads = {}
         for command in commands:
             if command.get('action') is None:
                 self.insert_route_map_cmd_action(command, want)
             route_map_payload = self.get_modify_single_route_map_request(command, have)
             if route_map_payload:
-                route_maps_payload_list.append(route_map_payload)
-
                 # Note: This is consistent with current CLI behavior, but should be
                 # revisited if and when the SONiC REST implementation is enhanced
                 # for the "match peer" attribute.
                 self.route_map_remove_configured_match_peer(route_map_payload, have, requests)
 
+                map_payload = route_map_payloads.get(route_map_payload['name'])
+                if map_payload:
+                    map_payload['statements']['statement'].extend(
+                        route_map_payload['statements']['statement'])
+                else:
+                    route_map_payloads[route_map_payload['name']] = route_map_payload
+                    route_maps_payload_list.append(route_map_payload)
+
         route_maps_data = {self.route_maps_data_path: route_maps_payload_dict}
         request = {'path': self.route_maps_uri, 'method': PATCH, 'data': route_maps_data}
         requests.append(request)
@@ -871,30 +920,56 @@ class Route_maps(ConfigBase):
 
         return
 
-    @staticmethod
-    def get_matching_map(conf_map_name, conf_seq_num, input_list):
+    def get_route_map_index(self, input_list):
+        '''Return the (map name, sequence number) index for the input list of
+        command or configuration dicts along with the set of route map names
+        present in the list. The index for a given list is built only once
+        during the current module run and is rebuilt only if the list changes
+        size.'''
+        index_entry = self._route_map_indexes.get(id(input_list))
+        if (index_entry is None or index_entry['list'] is not input_list or
+                index_entry['size'] != len(input_list)):
+            stmt_index = {}
+            map_names = set()
+            for cfg_route_map in input_list:
+                map_name = cfg_route_map.get('map_name')
+                if not map_name:
+                    continue
+                map_names.add(map_name)
+                seq_num = cfg_route_map.get('sequence_num')
+                if seq_num:
+                    # Keep the first matching statement, consistent with a
+                    # linear search of the list.
+                    stmt_index.setdefault((map_name, seq_num), cfg_route_map)
+
+            index_entry = {
+                'list': input_list,
+                'size': len(input_list),
+                'stmts': stmt_index,
+                'map_names': map_names
+            }
+            self._route_map_indexes[id(input_list)] = index_entry
+
+        return index_entry
+
+    def get_matching_map(self, conf_map_name, conf_seq_num, input_list):
         '''In the input list of command or configuration dicts, find the route map
         configuration "statement" (if it exists) for the specified map name
         and sequence number.'''
-        for cfg_route_map in input_list:
-            if cfg_route_map.get('map_name') and cfg_route_map.get('sequence_num'):
-                if (cfg_route_map['map_name'] == conf_map_name and
-                        cfg_route_map.get('sequence_num') == conf_seq_num):
-                    return cfg_route_map
+        if not input_list:
+            return {}
 
-        return {}
+        stmt_index = self.get_route_map_index(input_list)['stmts']
+        return stmt_index.get((conf_map_name, conf_seq_num), {})
 
-    @staticmethod
-    def any_rmap_inst_in_have(conf_map_name, have):
+    def any_rmap_inst_in_have(self, conf_map_name, have):
         '''In the current configuration on the target device, determine if there
         is at least one configuration "statement" for the specified route map name
         from the input playbook request.'''
-        for cfg_route_map in have:
-            if cfg_route_map.get('map_name'):
-                if cfg_route_map['map_name'] == conf_map_name:
-                    return True
+        if not have:
+            return False
 
-        return False
+        return conf_map_name in self.get_route_map_index(have)['map_names']
 
     def get_route_map_delete_match_attr(self, command, cmd_rmap_have, requests):
         '''Append to the input list of REST API requests the REST APIs needed
@@ -1610,10 +1685,20 @@ class Route_maps(ConfigBase):
             command = {}
             return command
 
-        self.get_delete_route_map_replaced_match_groupings(command, cmd_rmap_have, requests)
+        # When all of the configured attributes of a "match" or "set" grouping
+        # are to be deleted, delete the grouping's container with one request
+        # instead of deleting the attributes one at a time.
+        if self.is_replaced_match_grouping_removed(command, cmd_rmap_have):
+            self.get_delete_route_map_replaced_match_container(command, cmd_rmap_have, requests)
+        else:
+            self.get_delete_route_map_replaced_match_groupings(command, cmd_rmap_have, requests)
         replaced_set_group_requests = []
-        self.get_delete_route_map_replaced_set_groupings(command, cmd_rmap_have,
-                                                         replaced_set_group_requests)
+        if self.is_replaced_set_grouping_removed(command, cmd_rmap_have):
+            self.get_delete_route_map_replaced_set_container(command, cmd_rmap_have,
+                                                             replaced_set_group_requests)
+        else:
+            self.get_delete_route_map_replaced_set_groupings(command, cmd_rmap_have,
+                                                             replaced_set_group_requests)
         if replaced_set_group_requests:
             requests.extend(replaced_set_group_requests)
 
@@ -1623,6 +1708,74 @@ class Route_maps(ConfigBase):
 
         return command
 
+    @staticmethod
+    def is_replaced_grouping_removed(cmd_group, cfg_group, top_level_keys):
+        '''Determine if the "replaced" state deletion of a "match" or "set"
+        grouping removes all of its configured attributes. This is the case
+        when deletion of the grouping is triggered by a requested top level
+        attribute and none of the configured attributes is requested.'''
+        if not cmd_group or not cfg_group:
+            return False
+        if set(cmd_group).intersection(cfg_group):
+            return False
+        return bool(set(cmd_group).intersection(top_level_keys))
+
+    def is_replaced_match_grouping_removed(self, command, cmd_rmap_have):
+        '''Determine if all of the configured "match" attributes of the route
+        map statement are deleted for "replaced" state. The "call" attribute
+        shares the "conditions" container with the "match" attributes, so the
+        container is not deleted when "call" is configured.'''
+        if cmd_rmap_have.get('call'):
+            return False
+        return self.is_replaced_grouping_removed(command.get('match'), cmd_rmap_have.get('match'),
+                                                 self.match_top_level_keys)
+
+    def is_replaced_set_grouping_removed(self, command, cmd_rmap_have):
+        '''Determine if all of the configured "set" attributes of the route
+        map statement are deleted for "replaced" state. The deletion of the
+        configured list and dictionary attributes is skipped when a list or
+        dictionary attribute that is not configured is requested, so that case
+        is excluded.'''
+        cmd_set_top = command.get('set')
+        cfg_set_top = cmd_rmap_have.get('set')
+        if not self.is_replaced_grouping_removed(cmd_set_top, cfg_set_top, self.set_top_level_keys):
+            return False
+        return not (set(cmd_set_top).intersection(self.set_multi_level_keys) and
+                    set(cfg_set_top).intersection(self.set_multi_level_keys))
+
+    def get_delete_route_map_replaced_match_container(self, command, cmd_rmap_have, requests):
+        '''Append to the input list of REST API requests the request to delete
+        the "conditions" container of the route map statement specified by the
+        input "command", and replace the "match" attributes of the command with
+        the deleted attributes.'''
+        conf_map_name = command['map_name']
+        req_seq_num = str(command['sequence_num'])
+        requests.append({
+            'path': self.route_map_stmt_base_uri.format(conf_map_name, req_seq_num) + 'conditions',
+            'method': DELETE
+        })
+        command['match'] = deepcopy(cmd_rmap_have['match'])
+
+    def get_delete_route_map_replaced_set_container(self, command, cmd_rmap_have, requests):
+        '''Append to the input list of REST API requests the requests to delete
+        the BGP actions container and, if a metric is configured, the metric
+        action of the route map statement specified by the input "command", and
+        replace the "set" attributes of the command with the deleted attributes.
+        The "actions" container itself is not deleted because it holds the
+        permit/deny action of the statement.'''
+        conf_map_name = command['map_name']
+        req_seq_num = str(command['sequence_num'])
+        cfg_set_top = cmd_rmap_have['set']
+        set_delete_req_base = (self.route_map_stmt_base_uri.format(conf_map_name, req_seq_num) +
+                               'actions/')
+        if cfg_set_top.get('metric'):
+            requests.append({'path': set_delete_req_base + 'metric-action/config', 'method': DELETE})
+        # A metric "value" is also configured as the BGP MED action.
+        if set(cfg_set_top).difference(['metric']) or cfg_set_top.get('metric', {}).get('value'):
+            requests.append({'path': set_delete_req_base + 'openconfig-bgp-policy:bgp-actions',
+                             'method': DELETE})
+        command['set'] = deepcopy(cfg_set_top)
+
     def get_delete_route_map_replaced_match_groupings(self, command, cmd_rmap_have, requests):
         '''For the route map specified by the input "command", create requests
         to delete any existing route map "match" configuration groupings for which
@@ -1660,25 +1813,8 @@ class Route_maps(ConfigBase):
             peer_str = peer_dict[peer_key]
 
         bgp_match_delete_req_base = match_delete_req_base + 'openconfig-bgp-policy:bgp-conditions/'
-        match_top_level_keys = [
-            'as_path',
-            'community',
-            'ext_comm',
-            'interface',
-            'ipv6',
-            'local_preference',
-            'metric',
-            'origin',
-            'peer',
-            'source_protocol',
-            'source_vrf',
-            'tag'
-        ]
-
-        match_multi_level_keys = [
-            'evpn',
-            'ip',
-        ]
+        match_top_level_keys = self.match_top_level_keys
+        match_multi_level_keys = self.match_multi_level_keys
 
         match_uri_attr = {
             'as_path': bgp_match_delete_req_base + 'match-as-path-set',
@@ -1891,18 +2027,7 @@ class Route_maps(ConfigBase):
             elif cfg_set_top['metric'].get('value'):
                 metric_uri = [set_delete_req_base + 'metric-action/config',
                               bgp_set_delete_req_base + 'config/set-med']
-        # Top level keys: Note: Although "metric" is defined as a dictionary, it
-        # is handled as a "top level" attribute because it can contain
-        # only one configured member (either an rtt_action or a "value").
-        set_top_level_keys = [
-            'as_path_prepend',
-            'comm_list_delete',
-            'ip_next_hop',
-            'local_preference',
-            'metric',
-            'origin',
-            'weight',
-        ]
+        set_top_level_keys = self.set_top_level_keys
 
         set_uri_attr = {
             'as_path_prepend': bgp_set_delete_req_base + 'set-as-path-prepend',
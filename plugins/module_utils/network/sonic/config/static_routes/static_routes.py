@@ -19,6 +19,7 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.c
 )
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
     to_list,
+    remove_empties,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
@@ -27,7 +28,6 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     update_states,
-    get_diff,
     get_replaced_config,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.formatted_diff_utils import (
@@ -50,20 +50,16 @@ TEST_KEYS = [
 is_delete_all = False
 
 
-def __derive_static_route_next_hop_config_key_match_op(key_set, command, exist_conf):
-    bh = command['index'].get('blackhole', None)
-    itf = command['index'].get('interface', None)
-    nv = command['index'].get('nexthop_vrf', None)
-    nh = command['index'].get('next_hop', None)
-    conf_bh = exist_conf['index'].get('blackhole', None)
-    conf_itf = exist_conf['index'].get('interface', None)
-    conf_nv = exist_conf['index'].get('nexthop_vrf', None)
-    conf_nh = exist_conf['index'].get('next_hop', None)
+def get_next_hop_key(next_hop):
+    """Return the key, derived from the next hop index attributes, used to
+    match next hop configurations"""
+    index = next_hop.get('index', None) or {}
+    return (index.get('blackhole', None), index.get('interface', None),
+            index.get('nexthop_vrf', None), index.get('next_hop', None))
+
 
-    if bh == conf_bh and itf == conf_itf and nv == conf_nv and nh == conf_nh:
-        return True
-    else:
-        return False
+def __derive_static_route_next_hop_config_key_match_op(key_set, command, exist_conf):
+    return get_next_hop_key(command) == get_next_hop_key(exist_conf)
 
 
 def __derive_static_route_next_hop_config_delete_op(key_set, command, exist_conf):
@@ -202,7 +198,7 @@ class Static_routes(ConfigBase):
         requests = []
         state = self._module.params['state']
 
-        diff = get_diff(want, have, TEST_KEYS)
+        diff = self.get_static_routes_diff(want, have)
 
         if state == 'deleted':
             commands, requests = self._state_deleted(want, have, diff)
@@ -328,20 +324,47 @@ class Static_routes(ConfigBase):
         if not commands:
             return requests
 
+        # Consolidate all static routes for each VRF into a single request.
+        vrf_static_lists = {}
         for conf in commands:
             vrf_name = conf.get('vrf_name', None)
             static_list = conf.get('static_list', [])
-            for static in static_list:
-                prefix = static.get('prefix', None)
-                next_hops = static.get('next_hops', [])
-                if next_hops:
-                    for next_hop in next_hops:
-                        requests.append(self.get_modify_static_route_request(vrf_name, prefix, next_hop))
+            if static_list:
+                vrf_static_lists.setdefault(vrf_name, []).extend(static_list)
+
+        for vrf_name, static_list in vrf_static_lists.items():
+            request = self.get_modify_vrf_static_routes_request(vrf_name, static_list)
+            if request:
+                requests.append(request)
 
         return requests
 
-    def get_modify_static_route_request(self, vrf_name, prefix, next_hop):
+    def get_modify_vrf_static_routes_request(self, vrf_name, static_list):
         request = None
+        static_payload_list = []
+        static_payloads = {}
+        for static in static_list:
+            prefix = static.get('prefix', None)
+            next_hops = static.get('next_hops', [])
+            if not next_hops:
+                continue
+
+            static_payload = static_payloads.get(prefix)
+            if static_payload is None:
+                static_payload = {'prefix': prefix, 'config': {'prefix': prefix}, 'next-hops': {'next-hop': []}}
+                static_payloads[prefix] = static_payload
+                static_payload_list.append(static_payload)
+            for next_hop in next_hops:
+                static_payload['next-hops']['next-hop'].append(self.get_static_route_next_hop_payload(next_hop))
+
+        if static_payload_list:
+            url = '%s=%s/%s' % (network_instance_path, vrf_name, protocol_static_routes_path)
+            payload = {'openconfig-network-instance:static-routes': {'static': static_payload_list}}
+            request = {'path': url, 'method': PATCH, 'data': payload}
+
+        return request
+
+    def get_static_route_next_hop_payload(self, next_hop):
         next_hop_cfg = {}
         index = next_hop.get('index', {})
         blackhole = index.get('blackhole', None)
@@ -367,14 +390,11 @@ class Static_routes(ConfigBase):
             if tag:
                 next_hop_cfg['tag'] = tag
 
-        url = '%s=%s/%s' % (network_instance_path, vrf_name, protocol_static_routes_path)
-        next_hops_cfg = {'next-hop': [{'index': idx, 'config': next_hop_cfg}]}
+        next_hop_payload = {'index': idx, 'config': next_hop_cfg}
         if interface:
-            next_hops_cfg['next-hop'][0]['interface-ref'] = {'config': {'interface': interface}}
-        payload = {'openconfig-network-instance:static-routes': {'static': [{'prefix': prefix, 'config': {'prefix': prefix}, 'next-hops': next_hops_cfg}]}}
-        request = {'path': url, 'method': PATCH, 'data': payload}
+            next_hop_payload['interface-ref'] = {'config': {'interface': interface}}
 
-        return request
+        return next_hop_payload
 
     def generate_index(self, index):
         idx = None
@@ -411,55 +431,70 @@ class Static_routes(ConfigBase):
                 if vrf_name:
                     requests.append(self.get_delete_static_routes_for_vrf(vrf_name))
         else:
+            have_index = self.get_static_routes_index(have)
             for cmd in commands:
                 vrf_name = cmd.get('vrf_name', None)
                 static_list = cmd.get('static_list', [])
-                for cfg in have:
-                    cfg_vrf_name = cfg.get('vrf_name', None)
-                    if vrf_name == cfg_vrf_name:
-                        if not static_list:
-                            requests.append(self.get_delete_static_routes_for_vrf(vrf_name))
+                cfg_vrf = have_index.get(vrf_name)
+                if cfg_vrf is None:
+                    continue
+                if not static_list:
+                    requests.append(self.get_delete_static_routes_for_vrf(vrf_name))
+                    continue
+
+                for static in static_list:
+                    prefix = static.get('prefix', None)
+                    next_hops = static.get('next_hops', [])
+                    cfg_static = cfg_vrf['static'].get(prefix)
+                    if cfg_static is None:
+                        continue
+                    if prefix and not next_hops:
+                        requests.append(self.get_delete_static_routes_prefix_request(vrf_name, prefix))
+                        continue
+
+                    for next_hop in next_hops:
+                        index = next_hop.get('index', {})
+                        idx = self.generate_index(index)
+                        metric = next_hop.get('metric', None)
+                        track = next_hop.get('track', None)
+                        tag = next_hop.get('tag', None)
+
+                        cfg_next_hop = cfg_static['next_hops'].get(idx)
+                        if cfg_next_hop is None:
+                            continue
+
+                        cfg_metric = cfg_next_hop.get('metric', None)
+                        cfg_track = cfg_next_hop.get('track', None)
+                        cfg_tag = cfg_next_hop.get('tag', None)
+                        if not metric and not track and not tag:
+                            requests.append(self.get_delete_static_routes_next_hop_request(vrf_name, prefix, idx))
                         else:
-                            for static in static_list:
-                                prefix = static.get('prefix', None)
-                                next_hops = static.get('next_hops', [])
-                                cfg_static_list = cfg.get('static_list', [])
-                                for cfg_static in cfg_static_list:
-                                    cfg_prefix = cfg_static.get('prefix', None)
-                                    if prefix == cfg_prefix:
-                                        if prefix and not next_hops:
-                                            requests.append(self.get_delete_static_routes_prefix_request(vrf_name, prefix))
-                                        else:
-                                            for next_hop in next_hops:
-                                                index = next_hop.get('index', {})
-                                                idx = self.generate_index(index)
-                                                metric = next_hop.get('metric', None)
-                                                track = next_hop.get('track', None)
-                                                tag = next_hop.get('tag', None)
-
-                                                cfg_next_hops = cfg_static.get('next_hops', [])
-                                                if cfg_next_hops:
-                                                    for cfg_next_hop in cfg_next_hops:
-                                                        cfg_index = cfg_next_hop.get('index', {})
-                                                        cfg_idx = self.generate_index(cfg_index)
-                                                        if idx == cfg_idx:
-                                                            cfg_metric = cfg_next_hop.get('metric', None)
-                                                            cfg_track = cfg_next_hop.get('track', None)
-                                                            cfg_tag = cfg_next_hop.get('tag', None)
-                                                            if not metric and not track and not tag:
-                                                                requests.append(self.get_delete_static_routes_next_hop_request(vrf_name, prefix, idx))
-                                                            else:
-                                                                if metric == cfg_metric:
-                                                                    requests.append(self.get_delete_next_hop_config_attr_request(vrf_name, prefix, idx,
-                                                                                                                                 'metric'))
-                                                                if track == cfg_track:
-                                                                    requests.append(self.get_delete_next_hop_config_attr_request(vrf_name, prefix, idx,
-                                                                                                                                 'track'))
-                                                                if tag == cfg_tag:
-                                                                    requests.append(self.get_delete_next_hop_config_attr_request(vrf_name, prefix, idx, 'tag'))
+                            if metric == cfg_metric:
+                                requests.append(self.get_delete_next_hop_config_attr_request(vrf_name, prefix, idx, 'metric'))
+                            if track == cfg_track:
+                                requests.append(self.get_delete_next_hop_config_attr_request(vrf_name, prefix, idx, 'track'))
+                            if tag == cfg_tag:
+                                requests.append(self.get_delete_next_hop_config_attr_request(vrf_name, prefix, idx, 'tag'))
 
         return requests
 
+    def get_static_routes_index(self, config):
+        """Return an index of the static routes in the input configuration,
+        keyed by VRF name, then by prefix and then by generated next hop index.
+        The first occurrence of a VRF, prefix or next hop is indexed.
+        """
+        config_index = {}
+        for conf in config or []:
+            vrf_entry = config_index.setdefault(conf.get('vrf_name', None), {'conf': conf, 'static': {}})
+            for static in conf.get('static_list', None) or []:
+                static_entry = vrf_entry['static'].setdefault(static.get('prefix', None),
+                                                              {'conf': static, 'next_hops': {}})
+                for next_hop in static.get('next_hops', None) or []:
+                    idx = self.generate_index(next_hop.get('index', None) or {})
+                    static_entry['next_hops'].setdefault(idx, next_hop)
+
+        return config_index
+
     def get_delete_static_routes_for_vrf(self, vrf_name):
         url = '%s=%s/%s' % (network_instance_path, vrf_name, protocol_static_routes_path)
         request = {'path': url, 'method': DELETE}
@@ -489,6 +524,88 @@ class Static_routes(ConfigBase):
 
         return request
 
+    def get_static_routes_diff(self, want, have):
+        """Return the static route configuration in "want" that is not present
+        in "have". The result is the same as that of "get_diff" using
+        TEST_KEYS, but VRFs, prefixes and next hops are matched using indexed
+        lookups.
+        """
+        if not want or not have:
+            return want or []
+
+        have_vrfs = {}
+        for conf in have:
+            have_vrfs.setdefault(conf.get('vrf_name', None), conf)
+
+        diff = []
+        for conf in want:
+            vrf_name = conf.get('vrf_name', None)
+            cfg_conf = have_vrfs.get(vrf_name)
+            if cfg_conf is None:
+                conf_diff = remove_empties(conf)
+                if conf_diff is not None:
+                    diff.append(conf_diff)
+                continue
+
+            static_list = conf.get('static_list', None)
+            cfg_static_list = cfg_conf.get('static_list', None)
+            if not static_list:
+                continue
+            if not cfg_static_list:
+                diff.append({'static_list': static_list, 'vrf_name': vrf_name})
+                continue
+
+            cfg_statics = {}
+            for cfg_static in cfg_static_list:
+                cfg_statics.setdefault(cfg_static.get('prefix', None), cfg_static)
+
+            static_list_diff = []
+            for static in static_list:
+                prefix = static.get('prefix', None)
+                cfg_static = cfg_statics.get(prefix)
+                if cfg_static is None:
+                    static_diff = remove_empties(static)
+                    if static_diff is not None:
+                        static_list_diff.append(static_diff)
+                    continue
+
+                next_hops = static.get('next_hops', None)
+                cfg_next_hops = cfg_static.get('next_hops', None)
+                if not next_hops:
+                    continue
+                if not cfg_next_hops:
+                    static_list_diff.append({'next_hops': next_hops, 'prefix': prefix})
+                    continue
+
+                cfg_next_hop_index = {}
+                for cfg_next_hop in cfg_next_hops:
+                    cfg_next_hop_index.setdefault(get_next_hop_key(cfg_next_hop), cfg_next_hop)
+
+                next_hops_diff = []
+                for next_hop in next_hops:
+                    cfg_next_hop = cfg_next_hop_index.get(get_next_hop_key(next_hop))
+                    if cfg_next_hop is None:
+                        next_hop_diff = remove_empties(next_hop)
+                        if next_hop_diff is not None:
+                            next_hops_diff.append(next_hop_diff)
+                        continue
+
+                    next_hop_diff = {}
+                    for attr in ('metric', 'tag', 'track'):
+                        if next_hop.get(attr, None) is not None and next_hop[attr] != cfg_next_hop.get(attr, None):
+                            next_hop_diff[attr] = next_hop[attr]
+                    if next_hop_diff:
+                        next_hop_diff['index'] = next_hop['index']
+                        next_hops_diff.append(next_hop_diff)
+
+                if next_hops_diff:
+                    static_list_diff.append({'next_hops': next_hops_diff, 'prefix': prefix})
+
+            if static_list_diff:
+                diff.append({'static_list': static_list_diff, 'vrf_name': vrf_name})
+
+        return diff
+
     def sort_lists_in_config(self, config):
         if config:
             config.sort(key=self.get_vrf_name)
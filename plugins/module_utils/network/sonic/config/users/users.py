@@ -12,7 +12,12 @@ created
 """
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
+import binascii
+import fcntl
+import hashlib
 import json
+import os
+import tempfile
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.cfg.base import (
     ConfigBase,
@@ -23,7 +28,8 @@ from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.u
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.facts import Facts
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
     to_request,
-    edit_config
+    edit_config,
+    get_connection
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
     update_states,
@@ -35,9 +41,12 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     get_formatted_config_diff
 )
 from ansible.module_utils.connection import ConnectionError
+from ansible.module_utils._text import to_bytes, to_text
 
 PATCH = 'patch'
 DELETE = 'delete'
+USERS_PATH = 'data/openconfig-system:system/aaa/authentication/users'
+PASSWORD_FINGERPRINT_ITERATIONS = 600000
 TEST_KEYS_formatted_diff = [
     {'config': {'name': '', '__delete_op': __DELETE_CONFIG_IF_NO_SUBCONFIG}},
 ]
@@ -59,6 +68,10 @@ class Users(ConfigBase):
 
     def __init__(self, module):
         super(Users, self).__init__(module)
+        self._password_fingerprints = None
+        self._unchanged_passwords = {}
+        self._pushed_passwords = {}
+        self._deleted_users = set()
 
     def get_users_facts(self):
         """ Get the 'facts' (the current configuration)
@@ -97,6 +110,7 @@ class Users(ConfigBase):
                             self._module.fail_json(msg=str(exc), code=exc.code)
                     except Exception as err:
                         self._module.fail_json(msg=str(exc), code=exc.code)
+                self.update_password_fingerprints()
             result['changed'] = True
         result['commands'] = commands
 
@@ -160,11 +174,15 @@ class Users(ConfigBase):
             if match:
                 diff.append(match)
 
+        have_names = set(cfg['name'] for cfg in have)
+        diff_names = set(cfg['name'] for cfg in diff)
         for cfg in want:
-            if cfg['password'] and cfg['update_password'] == 'always':
-                d_match = next((d_cfg for d_cfg in diff if d_cfg['name'] == cfg['name']), None)
-                if d_match is None:
-                    diff.append(cfg)
+            if cfg['password'] and cfg['update_password'] == 'always' and cfg['name'] not in diff_names:
+                # Skip existing users whose password is known to be unchanged
+                if cfg['name'] in have_names and self.is_password_unchanged(cfg['name'], cfg['password']):
+                    continue
+                diff_names.add(cfg['name'])
+                diff.append(cfg)
 
         if state == 'overridden':
             commands, requests = self._state_overridden(want, have, diff)
@@ -293,8 +311,15 @@ class Users(ConfigBase):
         if not role and match:
             role = match['role']
 
+        # An existing user's password that is known to be unchanged
+        # is not sent again, to avoid rehashing it on the device.
+        if password and match and self.is_password_unchanged(name, password):
+            password = None
+        elif password:
+            self._pushed_passwords[name] = password
+
         if not password and match:
-            password = match['password']
+            password = match.get('password')
 
         if role:
             user_cfg['role'] = role
@@ -304,31 +329,29 @@ class Users(ConfigBase):
             user_cfg['password'] = clear_pwd
             user_cfg['password-hashed'] = hashed_pwd
 
-        pay_load = {'openconfig-system:user': [{'username': name, 'config': user_cfg}]}
-        return pay_load
-
-    def get_modify_single_user_request(self, conf, match):
-        request = None
-        name = conf.get('name', None)
-        role = conf.get('role', None)
-        password = conf.get('password', None)
-        update_pass = conf.get('update_password', None)
-        if role or (password and update_pass == 'always'):
-            url = 'data/openconfig-system:system/aaa/authentication/users/user=%s' % (name)
-            payload = self.get_single_user_payload(name, role, password, update_pass, match)
-            request = {'path': url, 'method': PATCH, 'data': payload}
-        return request
+        return {'username': name, 'config': user_cfg}
 
     def get_modify_users_requests(self, commands, have):
         requests = []
         if not commands:
             return requests
 
+        have_dict = {}
+        for cfg in have:
+            have_dict.setdefault(cfg['name'], cfg)
+
+        users = []
         for conf in commands:
-            match = next((cfg for cfg in have if cfg['name'] == conf['name']), None)
-            req = self.get_modify_single_user_request(conf, match)
-            if req:
-                requests.append(req)
+            name = conf.get('name', None)
+            role = conf.get('role', None)
+            password = conf.get('password', None)
+            update_pass = conf.get('update_password', None)
+            if role or (password and update_pass == 'always'):
+                users.append(self.get_single_user_payload(name, role, password, update_pass, have_dict.get(name)))
+
+        if users:
+            payload = {'openconfig-system:users': {'user': users}}
+            requests.append({'path': USERS_PATH, 'method': PATCH, 'data': payload})
         return requests
 
     def get_new_users(self, want, have):
@@ -360,21 +383,118 @@ class Users(ConfigBase):
 
         # Skip the admin user in 'deleted' state. we cannot delete all users
         admin_usr = None
+        have_names = set(cfg['name'] for cfg in have)
 
         for conf in commands:
             # Skip the asmin user in 'deleted' state. we cannot delete all users
             if conf['name'] == 'admin':
                 admin_usr = conf
                 continue
-            match = next((cfg for cfg in have if cfg['name'] == conf['name']), None)
-            if match:
-                url = 'data/openconfig-system:system/aaa/authentication/users/user=%s' % (conf['name'])
+            if conf['name'] in have_names:
+                url = '%s/user=%s' % (USERS_PATH, conf['name'])
                 requests.append({'path': url, 'method': DELETE})
+                self._deleted_users.add(conf['name'])
 
         if admin_usr:
             commands.remove(admin_usr)
         return requests
 
+    def get_password_cache_key(self):
+        """Returns the key identifying the device in the password
+        fingerprint cache, or None if the cache is not in use"""
+        if not self._module.params.get('password_fingerprint_cache'):
+            return None
+
+        try:
+            host = get_connection(self._module).get_option('host')
+        except ConnectionError as exc:
+            self._module.warn('Password fingerprint cache not used, unable to get the device host: %s' % to_text(exc))
+            host = None
+        return host
+
+    def get_password_fingerprints(self):
+        """Returns the cached password fingerprints of the users in the device"""
+        if self._password_fingerprints is None:
+            self._password_fingerprints = {}
+            host = self.get_password_cache_key()
+            if host:
+                cache = self.read_password_cache(self._module.params['password_fingerprint_cache'])
+                self._password_fingerprints = cache.get(host, {})
+        return self._password_fingerprints
+
+    def is_password_unchanged(self, name, password):
+        """Returns True if the password of the user matches the
+        password fingerprint cached by a previous run. The result is
+        computed once per user, as the fingerprint is costly to compute."""
+        if name not in self._unchanged_passwords:
+            self._unchanged_passwords[name] = self.match_password_fingerprint(name, password)
+        return self._unchanged_passwords[name]
+
+    def match_password_fingerprint(self, name, password):
+        """Returns True if the password matches the cached password
+        fingerprint of the user"""
+        cached = self.get_password_fingerprints().get(name)
+        if not cached or not isinstance(cached, dict):
+            return False
+        try:
+            fingerprint = self.get_password_fingerprint(password, cached['salt'])
+        except (KeyError, TypeError, ValueError):
+            return False
+        return fingerprint == cached.get('fingerprint')
+
+    def update_password_fingerprints(self):
+        """Updates the password fingerprint cache with the passwords
+        sent to and the users deleted from the device"""
+        if not self._pushed_passwords and not self._deleted_users:
+            return
+
+        host = self.get_password_cache_key()
+        if not host:
+            return
+
+        cache_path = os.path.expanduser(self._module.params['password_fingerprint_cache'])
+        cache_dir = os.path.dirname(os.path.abspath(cache_path))
+        try:
+            if not os.path.isdir(cache_dir):
+                os.makedirs(cache_dir)
+            with open(cache_path + '.lock', 'a') as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                cache = self.read_password_cache(cache_path)
+                fingerprints = cache.get(host)
+                if not isinstance(fingerprints, dict):
+                    fingerprints = {}
+                for name in self._deleted_users:
+                    fingerprints.pop(name, None)
+                for name, password in self._pushed_passwords.items():
+                    salt = to_text(binascii.hexlify(os.urandom(16)))
+                    fingerprints[name] = {'salt': salt, 'fingerprint': self.get_password_fingerprint(password, salt)}
+                cache[host] = fingerprints
+
+                fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+                with os.fdopen(fd, 'w') as tmp_file:
+                    json.dump(cache, tmp_file)
+                os.rename(tmp_path, cache_path)
+        except (IOError, OSError) as exc:
+            self._module.warn('Unable to update password fingerprint cache %s: %s' % (cache_path, exc))
+
+    @staticmethod
+    def read_password_cache(cache_path):
+        """Returns the contents of the password fingerprint cache file"""
+        try:
+            with open(os.path.expanduser(cache_path)) as cache_file:
+                cache = json.load(cache_file)
+        except (IOError, OSError, ValueError):
+            cache = {}
+        if not isinstance(cache, dict):
+            cache = {}
+        return cache
+
+    @staticmethod
+    def get_password_fingerprint(password, salt):
+        """Returns the salted PBKDF2 fingerprint of a password"""
+        digest = hashlib.pbkdf2_hmac('sha256', to_bytes(password), binascii.unhexlify(salt), PASSWORD_FINGERPRINT_ITERATIONS)
+        return to_text(binascii.hexlify(digest))
+
     def sort_lists_in_config(self, config):
         if config:
             config.sort(key=lambda x: x['name'])
@@ -290,6 +290,7 @@ class Vrfs(ConfigBase):
 
         # Create URL and payload
         method = DELETE
+        have_dict = dict((have_cfg['name'], have_cfg) for have_cfg in reversed(have))
         for conf in configs:
             name = conf['name']
             empty_flag = False
@@ -300,7 +301,7 @@ class Vrfs(ConfigBase):
                 empty_flag = True
             elif members is not None and interfaces is None:
                 empty_flag = True
-            matched = next((have_cfg for have_cfg in have if have_cfg['name'] == name), None)
+            matched = have_dict.get(name)
             if not matched:
                 continue
 
@@ -321,13 +322,21 @@ class Vrfs(ConfigBase):
                 if have_members:
                     have_intf = have_members.get('interfaces', None)
                     conf_intf = conf_members.get('interfaces', None)
-                    if conf_intf:
+                    if conf_intf and have_intf:
+                        have_intf_names = set(intf['name'] for intf in have_intf)
+                        del_intf_names = []
                         for del_mem in conf_intf:
-                            if del_mem in have_intf:
-                                url = 'data/openconfig-network-instance:network-instances/'
-                                url = url + 'network-instance={0}/interfaces/interface={1}'.format(name, del_mem['name'])
-                                request = {"path": url, "method": method}
-                                requests.append(request)
+                            if del_mem['name'] in have_intf_names and del_mem['name'] not in del_intf_names:
+                                del_intf_names.append(del_mem['name'])
+
+                        url = 'data/openconfig-network-instance:network-instances/network-instance={0}/interfaces/interface'.format(name)
+                        if del_intf_names and len(del_intf_names) == len(have_intf_names):
+                            # All the member interfaces of the VRF are removed
+                            # with a single request
+                            requests.append({"path": url, "method": method})
+                        else:
+                            for intf_name in del_intf_names:
+                                requests.append({"path": url + '={0}'.format(intf_name), "method": method})
 
         return requests
 
@@ -351,15 +360,21 @@ class Vrfs(ConfigBase):
             return requests
         # Create URL and payload
         method = PATCH
+        have_names = set(have_cfg['name'] for have_cfg in have)
+        network_instances = []
         for conf in configs:
             if conf.get("name", None):
                 name = conf["name"]
-                matched = next((have_cfg for have_cfg in have if have_cfg['name'] == name), None)
-                if not matched:
-                    url = 'data/openconfig-network-instance:network-instances'
-                    payload = self.build_create_vrf_payload(conf)
-                    request = {"path": url, "method": method, "data": payload}
-                    requests.append(request)
+                if name not in have_names:
+                    have_names.add(name)
+                    network_instances.append(self.build_create_vrf_network_instance(conf))
+
+        if network_instances:
+            # All the new VRFs are created with a single request
+            url = 'data/openconfig-network-instance:network-instances'
+            payload = {'openconfig-network-instance:network-instances': {'network-instance': network_instances}}
+            request = {"path": url, "method": method, "data": payload}
+            requests.append(request)
         return requests
 
     def get_create_vrf_interface_requests(self, configs, have):
@@ -380,16 +395,15 @@ class Vrfs(ConfigBase):
 
         return requests
 
-    def build_create_vrf_payload(self, conf):
+    def build_create_vrf_network_instance(self, conf):
         name = conf['name']
 
         netw_inst = dict({'name': name})
         netw_inst['config'] = dict({'name': name})
         netw_inst['config'].update({'enabled': True})
         netw_inst['config'].update({'type': 'L3VRF'})
-        netw_inst_arr = [netw_inst]
 
-        return dict({'openconfig-network-instance:network-instances': {'network-instance': netw_inst_arr}})
+        return netw_inst
 
     def build_create_vrf_interface_payload(self, conf):
         members = conf["members"].get("interfaces", None)
@@ -333,6 +333,8 @@ class Vxlans(ConfigBase):
         primary_ip_requests = []
         tunnel_requests = []
 
+        have_dict = self.get_vxlans_dict(have)
+
         # Need to delete in the reverse order of creation.
         # vrf_map needs to be cleared before vlan_map
         # vlan_map needs to be cleared before tunnel(source-ip)
@@ -347,7 +349,7 @@ class Vxlans(ConfigBase):
 
             have_vlan_map_count = 0
             have_vrf_map_count = 0
-            matched = next((each_vxlan for each_vxlan in have if each_vxlan['name'] == name), None)
+            matched = have_dict.get(name)
             if matched:
                 have_vlan_map = matched.get('vlan_map', [])
                 have_vrf_map = matched.get('vrf_map', [])
@@ -447,66 +449,62 @@ class Vxlans(ConfigBase):
     def get_create_vlan_map_request(self, configs, have):
         # Create URL and payload
         requests = []
+        have_dict = self.get_vxlans_dict(have)
+        vlan_map_list = []
         for conf in configs:
             new_vlan_map_list = conf.get('vlan_map', [])
             if new_vlan_map_list:
+                name = conf['name']
+                matched_vlan_map_dict = self.get_vni_dict(have_dict.get(name), 'vlan_map')
                 for each_vlan_map in new_vlan_map_list:
-                    name = conf['name']
                     vlan = each_vlan_map.get('vlan')
                     vni = each_vlan_map.get('vni')
-                    matched = next((each_vxlan for each_vxlan in have if each_vxlan['name'] == name), None)
 
                     is_change_needed = True
-                    if matched:
-                        matched_vlan_map_list = matched.get('vlan_map', [])
-                        if matched_vlan_map_list:
-                            matched_vlan_map = next((e_vlan_map for e_vlan_map in matched_vlan_map_list if e_vlan_map['vni'] == vni), None)
-                            if matched_vlan_map:
-                                if matched_vlan_map['vlan'] == vlan:
-                                    is_change_needed = False
+                    matched_vlan_map = matched_vlan_map_dict.get(vni)
+                    if matched_vlan_map:
+                        if matched_vlan_map['vlan'] == vlan:
+                            is_change_needed = False
 
                     if is_change_needed:
-                        map_name = "map_{0}_Vlan{1}".format(vni, vlan)
-                        payload = self.build_create_vlan_map_payload(conf, each_vlan_map)
-                        url = "data/sonic-vxlan:sonic-vxlan/VXLAN_TUNNEL_MAP"
-                        request = {"path": url, "method": PATCH, "data": payload}
-                        requests.append(request)
+                        vlan_map_list.append(self.build_create_vlan_map_dict(conf, each_vlan_map))
 
-        return requests
+        if vlan_map_list:
+            # All the VLAN-VNI maps are created with a single request
+            payload = {'sonic-vxlan:VXLAN_TUNNEL_MAP': {'VXLAN_TUNNEL_MAP_LIST': vlan_map_list}}
+            url = "data/sonic-vxlan:sonic-vxlan/VXLAN_TUNNEL_MAP"
+            request = {"path": url, "method": PATCH, "data": payload}
+            requests.append(request)
 
-    def build_create_vlan_map_payload(self, conf, vlan_map):
-        payload_url = dict()
+        return requests
 
+    def build_create_vlan_map_dict(self, conf, vlan_map):
         vlan_map_dict = dict()
         vlan_map_dict['name'] = conf['name']
         vlan_map_dict['mapname'] = "map_{vni}_Vlan{vlan}".format(vni=vlan_map['vni'], vlan=vlan_map['vlan'])
         vlan_map_dict['vlan'] = "Vlan{vlan}".format(vlan=vlan_map['vlan'])
         vlan_map_dict['vni'] = vlan_map['vni']
 
-        payload_url['sonic-vxlan:VXLAN_TUNNEL_MAP'] = {'VXLAN_TUNNEL_MAP_LIST': [vlan_map_dict]}
-
-        return payload_url
+        return vlan_map_dict
 
     def get_create_vrf_map_request(self, configs, have):
         # Create URL and payload
         requests = []
+        have_dict = self.get_vxlans_dict(have)
         for conf in configs:
             new_vrf_map_list = conf.get('vrf_map', [])
             if new_vrf_map_list:
+                name = conf['name']
+                matched_vrf_map_dict = self.get_vni_dict(have_dict.get(name), 'vrf_map')
                 for each_vrf_map in new_vrf_map_list:
-                    name = conf['name']
                     vrf = each_vrf_map.get('vrf')
                     vni = each_vrf_map.get('vni')
-                    matched = next((each_vxlan for each_vxlan in have if each_vxlan['name'] == name), None)
 
                     is_change_needed = True
-                    if matched:
-                        matched_vrf_map_list = matched.get('vrf_map', [])
-                        if matched_vrf_map_list:
-                            matched_vrf_map = next((e_vrf_map for e_vrf_map in matched_vrf_map_list if e_vrf_map['vni'] == vni), None)
-                            if matched_vrf_map:
-                                if matched_vrf_map['vrf'] == vrf:
-                                    is_change_needed = False
+                    matched_vrf_map = matched_vrf_map_dict.get(vni)
+                    if matched_vrf_map:
+                        if matched_vrf_map['vrf'] == vrf:
+                            is_change_needed = False
 
                     if is_change_needed:
                         payload = self.build_create_vrf_map_payload(conf, each_vrf_map)
@@ -587,19 +585,17 @@ class Vxlans(ConfigBase):
     def get_delete_vlan_map_request(self, conf, matched, name, del_vlan_map_list):
         # Create URL and payload
         requests = []
+        matched_vlan_map_dict = self.get_vni_dict(matched, 'vlan_map')
 
         for each_vlan_map in del_vlan_map_list:
             vlan = each_vlan_map.get('vlan')
             vni = each_vlan_map.get('vni')
 
             is_change_needed = False
-            if matched:
-                matched_vlan_map_list = matched.get('vlan_map', None)
-                if matched_vlan_map_list:
-                    matched_vlan_map = next((e_vlan_map for e_vlan_map in matched_vlan_map_list if e_vlan_map['vni'] == vni), None)
-                    if matched_vlan_map:
-                        if matched_vlan_map['vlan'] == vlan:
-                            is_change_needed = True
+            matched_vlan_map = matched_vlan_map_dict.get(vni)
+            if matched_vlan_map:
+                if matched_vlan_map['vlan'] == vlan:
+                    is_change_needed = True
 
             if is_change_needed:
                 map_name = "map_{0}_Vlan{1}".format(vni, vlan)
@@ -612,19 +608,17 @@ class Vxlans(ConfigBase):
     def get_delete_vrf_map_request(self, conf, matched, name, del_vrf_map_list):
         # Create URL and payload
         requests = []
+        matched_vrf_map_dict = self.get_vni_dict(matched, 'vrf_map')
 
         for each_vrf_map in del_vrf_map_list:
             vrf = each_vrf_map.get('vrf')
             vni = each_vrf_map.get('vni')
 
             is_change_needed = False
-            if matched:
-                matched_vrf_map_list = matched.get('vrf_map', None)
-                if matched_vrf_map_list:
-                    matched_vrf_map = next((e_vrf_map for e_vrf_map in matched_vrf_map_list if e_vrf_map['vni'] == vni), None)
-                    if matched_vrf_map:
-                        if matched_vrf_map['vrf'] == vrf:
-                            is_change_needed = True
+            matched_vrf_map = matched_vrf_map_dict.get(vni)
+            if matched_vrf_map:
+                if matched_vrf_map['vrf'] == vrf:
+                    is_change_needed = True
 
             if is_change_needed:
                 url = "data/sonic-vrf:sonic-vrf/VRF/VRF_LIST={vrf}/vni".format(vrf=vrf)
@@ -633,6 +627,23 @@ class Vxlans(ConfigBase):
 
         return requests
 
+    @staticmethod
+    def get_vxlans_dict(vxlans):
+        """Return a dict of the vxlans indexed by name"""
+        vxlans_dict = {}
+        for each_vxlan in vxlans:
+            vxlans_dict.setdefault(each_vxlan['name'], each_vxlan)
+        return vxlans_dict
+
+    @staticmethod
+    def get_vni_dict(vxlan, map_key):
+        """Return a dict of the 'map_key' maps of a vxlan indexed by VNI"""
+        vni_dict = {}
+        if vxlan:
+            for each_map in vxlan.get(map_key) or []:
+                vni_dict.setdefault(each_map['vni'], each_map)
+        return vni_dict
+
     def sort_lists_in_config(self, config):
         if config:
             config.sort(key=self.get_name)
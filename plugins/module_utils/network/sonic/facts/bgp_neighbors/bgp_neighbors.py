@@ -24,8 +24,9 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.argspec.bgp_neighbors.bgp_neighbors import Bgp_neighborsArgs
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.bgp_utils import (
     get_all_bgp_neighbors,
-    get_from_params_map,
+    get_bgp_nbr_pg_cfg,
     get_peergroups,
+    bgp_nbr_attr_map,
 )
 
 
@@ -33,43 +34,6 @@ class Bgp_neighborsFacts(object):
     """ The sonic bgp_neighbors fact class
     """
 
-    neighbor_params_map = {
-        'neighbor': 'neighbor-address',
-        'peer_as': 'peer-as',
-        'peer_type': 'peer-type',
-        'peer_group': 'peer-group',
-        'keepalive': 'keepalive-interval',
-        'holdtime': 'hold-time',
-        'connect_retry': 'connect-retry',
-        'advertisement_interval': 'minimum-advertisement-interval',
-        'bfd_enabled': ['enable-bfd', 'enabled'],
-        'check_failure': ['enable-bfd', 'check-control-plane-failure'],
-        'profile': ['enable-bfd', 'bfd-profile'],
-        'dynamic': 'capability-dynamic',
-        'extended_nexthop': 'capability-extended-nexthop',
-        'pwd': ['auth-password', 'password'],
-        'encrypted': ['auth-password', 'encrypted'],
-        'nbr_description': 'description',
-        'disable_connected_check': 'disable-ebgp-connected-route-check',
-        'dont_negotiate_capability': 'dont-negotiate-capability',
-        'enforce_first_as': 'enforce-first-as',
-        'enforce_multihop': 'enforce-multihop',
-        'local_address': ['transport', 'config', 'local-address'],
-        'as': 'local-as',
-        'no_prepend': 'local-as-no-prepend',
-        'replace_as': 'local-as-replace-as',
-        'override_capability': 'override-capability',
-        'port': 'peer-port',
-        'shutdown_msg': 'shutdown-message',
-        'solo': 'solo-peer',
-        'strict_capability_match': 'strict-capability-match',
-        'ttl_security': 'ttl-security-hops',
-        'enabled': ['ebgp-multihop', 'enabled'],
-        'multihop_ttl': ['ebgp-multihop', 'multihop-ttl'],
-        'v6only': 'openconfig-bgp-ext:v6only',
-        'passive': ['transport', 'config', 'passive-mode']
-    }
-
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
         self.argument_spec = Bgp_neighborsArgs.argument_spec
@@ -145,81 +109,7 @@ class Bgp_neighborsFacts(object):
             fil_neighbors = []
             if val:
                 for neighbor in val:
-                    fil_neighbor = get_from_params_map(self.neighbor_params_map, neighbor)
-                    capability = {}
-                    capability_dynamic = fil_neighbor.get('dynamic', None)
-                    if capability_dynamic is not None:
-                        capability['dynamic'] = capability_dynamic
-                        fil_neighbor.pop('dynamic')
-                    capability_extended_nexthop = fil_neighbor.get('extended_nexthop', None)
-                    if capability_extended_nexthop is not None:
-                        capability['extended_nexthop'] = capability_extended_nexthop
-                        fil_neighbor.pop('extended_nexthop')
-                    if capability:
-                        fil_neighbor['capability'] = capability
-                    remote = {}
-                    peer_as = fil_neighbor.get('peer_as', None)
-                    if peer_as is not None:
-                        remote['peer_as'] = peer_as
-                        fil_neighbor.pop('peer_as')
-                    peer_type = fil_neighbor.get('peer_type', None)
-                    if peer_type is not None:
-                        remote['peer_type'] = peer_type.lower()
-                        fil_neighbor.pop('peer_type')
-                    if remote:
-                        fil_neighbor['remote_as'] = remote
-                    auth_pwd = {}
-                    pwd = fil_neighbor.get('pwd', None)
-                    if pwd is not None:
-                        auth_pwd['pwd'] = pwd
-                        fil_neighbor.pop('pwd')
-                    encrypted = fil_neighbor.get('encrypted', None)
-                    if encrypted is not None:
-                        auth_pwd['encrypted'] = encrypted
-                        fil_neighbor.pop('encrypted')
-                    ebgp_multihop = {}
-                    enabled = fil_neighbor.get('enabled', None)
-                    if enabled is not None:
-                        ebgp_multihop['enabled'] = enabled
-                        fil_neighbor.pop('enabled')
-                    multihop_ttl = fil_neighbor.get('multihop_ttl', None)
-                    if multihop_ttl is not None:
-                        ebgp_multihop['multihop_ttl'] = multihop_ttl
-                        fil_neighbor.pop('multihop_ttl')
-                    local_as = {}
-                    asn = fil_neighbor.get('as', None)
-                    if asn is not None:
-                        local_as['as'] = asn
-                        fil_neighbor.pop('as')
-                    no_prepend = fil_neighbor.get('no_prepend', None)
-                    if no_prepend is not None:
-                        local_as['no_prepend'] = no_prepend
-                        fil_neighbor.pop('no_prepend')
-                    replace_as = fil_neighbor.get('replace_as', None)
-                    if replace_as is not None:
-                        local_as['replace_as'] = replace_as
-                        fil_neighbor.pop('replace_as')
-                    bfd = {}
-                    bfd_enabled = fil_neighbor.get('bfd_enabled', None)
-                    if bfd_enabled is not None:
-                        bfd['enabled'] = bfd_enabled
-                        fil_neighbor.pop('bfd_enabled')
-                    check_failure = fil_neighbor.get('check_failure', None)
-                    if check_failure is not None:
-                        bfd['check_failure'] = check_failure
-                        fil_neighbor.pop('check_failure')
-                    profile = fil_neighbor.get('profile', None)
-                    if profile is not None:
-                        bfd['profile'] = profile
-                        fil_neighbor.pop('profile')
-                    if auth_pwd:
-                        fil_neighbor['auth_pwd'] = auth_pwd
-                    if ebgp_multihop:
-                        fil_neighbor['ebgp_multihop'] = ebgp_multihop
-                    if local_as:
-                        fil_neighbor['local_as'] = local_as
-                    if bfd:
-                        fil_neighbor['bfd'] = bfd
+                    fil_neighbor = get_bgp_nbr_pg_cfg(bgp_nbr_attr_map, neighbor)
                     if fil_neighbor:
                         fil_neighbors.append(fil_neighbor)
             if fil_neighbors:
@@ -74,7 +74,10 @@ class Dhcp_snoopingFacts(object):
         config = {}
 
         config['top_level'] = self.get_dhcp_snooping_top_level()
-        config['binding'] = self.get_dhcp_snooping_binding()
+        # The binding table can hold tens of thousands of entries and is
+        # fetched only when the source bindings are needed.
+        if getattr(self._module, '_sonic_dhcp_snooping_binding', True):
+            config['binding'] = self.get_dhcp_snooping_binding()
 
         return config
 
@@ -67,8 +67,9 @@ class Lag_interfacesFacts(object):
             else:
                 portchannel_list = []
             if portchannel_list:
+                member_po_names = set(d["name"] for d in portchannel_members_list)
                 for i in portchannel_list:
-                    if not any(d["name"] == i["name"] for d in portchannel_members_list):
+                    if i["name"] not in member_po_names:
                         portchannel_members_list.append({'ifname': None, 'name': i['name']})
         if data:
             return portchannel_members_list
@@ -84,6 +85,7 @@ class Lag_interfacesFacts(object):
         :returns: facts
         """
         objs = []
+        objs_by_name = {}
         if not data:
             data = self.get_all_portchannels()
         # operate on a collection of resource x
@@ -92,7 +94,7 @@ class Lag_interfacesFacts(object):
                 obj = self.render_config(self.generated_spec, conf)
                 obj = self.transform_config(obj)
                 if obj:
-                    self.merge_portchannels(objs, obj)
+                    self.merge_portchannels(objs, obj, objs_by_name)
         facts = {}
         if objs:
             facts['lag_interfaces'] = []
@@ -116,19 +118,18 @@ class Lag_interfacesFacts(object):
             trans_cfg['members'] = {'interfaces': interfaces}
         return trans_cfg
 
-    def merge_portchannels(self, configs, conf):
-        if len(configs) == 0:
-            configs.append(conf)
+    def merge_portchannels(self, configs, conf, configs_by_name):
+        """Merge a port channel member entry into the port channel
+        configurations, using "configs_by_name" to look up the first
+        configuration with the same port channel name"""
+        new_interface = None
+        if conf.get('members') and conf['members'].get('interfaces'):
+            new_interface = conf['members']['interfaces'][0]
+
+        matched = configs_by_name.get(conf['name']) if new_interface else None
+        if matched and matched.get('members'):
+            ext_interfaces = matched.get('members').get('interfaces', [])
+            ext_interfaces.append(new_interface)
         else:
-            new_interface = None
-            if conf.get('members') and conf['members'].get('interfaces'):
-                new_interface = conf['members']['interfaces'][0]
-            else:
-                configs.append(conf)
-            if new_interface:
-                matched = next((cfg for cfg in configs if cfg['name'] == conf['name']), None)
-                if matched and matched.get('members'):
-                    ext_interfaces = matched.get('members').get('interfaces', [])
-                    ext_interfaces.append(new_interface)
-                else:
-                    configs.append(conf)
+            configs.append(conf)
+            configs_by_name.setdefault(conf['name'], conf)
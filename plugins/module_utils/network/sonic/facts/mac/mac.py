@@ -12,6 +12,7 @@ based on the configuration.
 from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
+import re
 from copy import deepcopy
 
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common import (
@@ -29,7 +30,11 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     get_all_vrfs,
 )
 
-NETWORK_INSTANCE_PATH = '/data/openconfig-network-instance:network-instances/network-instance'
+from ansible.module_utils.connection import ConnectionError
+
+NETWORK_INSTANCES_PATH = 'data/openconfig-network-instance:network-instances'
+MAC_NETWORK_INSTANCES_PATH = NETWORK_INSTANCES_PATH + '?fields=network-instance(name;fdb;openconfig-mac-dampening:mac-dampening)'
+MAC_CFG_NETWORK_INSTANCES_PATH = MAC_NETWORK_INSTANCES_PATH + '&content=config'
 
 
 class MacFacts(object):
@@ -38,6 +43,7 @@ class MacFacts(object):
 
     def __init__(self, module, subspec='config', options='options'):
         self._module = module
+        self._configured_entries_only = bool(module.params.get('configured_entries_only'))
         self.argument_spec = MacArgs.argument_spec
         spec = deepcopy(self.argument_spec)
         if subspec:
@@ -95,31 +101,18 @@ class MacFacts(object):
     def update_mac(self, module):
         mac_address_cfg_list = []
         vrfs = get_all_vrfs(module)
+        network_instances = self.get_network_instances(module) if vrfs else {}
         for vrf_name in vrfs:
-            aging_time = self.get_config(vrf_name, module, 'fdb/config/mac-aging-time', 'openconfig-network-instance:mac-aging-time')
-            dampening_cfg_dict = self.get_config(vrf_name, module, 'openconfig-mac-dampening:mac-dampening/config', 'openconfig-mac-dampening:config')
-            entries_dict = self.get_config(vrf_name, module, 'fdb/mac-table/entries', 'openconfig-network-instance:entries')
+            network_instance = network_instances.get(vrf_name, {})
+            fdb = network_instance.get('fdb', {})
+            aging_time = fdb.get('config', {}).get('mac-aging-time', None)
+            dampening_cfg_dict = network_instance.get('openconfig-mac-dampening:mac-dampening', {}).get('config', {})
+            entry_list = fdb.get('mac-table', {}).get('entries', {}).get('entry', [])
             cfg_dict = {}
             mac_dict = {}
-            mac_table_entries = []
             dampening_interval = dampening_cfg_dict.get('interval', None)
             dampening_threshold = dampening_cfg_dict.get('threshold', None)
-
-            if entries_dict:
-                entry_list = entries_dict.get('entry', [])
-                for entry in entry_list:
-                    entry_dict = {}
-                    mac_address = entry.get('mac-address', None)
-                    vlan_id = entry.get('vlan', None)
-                    interface = entry.get('interface', {}).get('interface-ref', {}).get('config', {}).get('interface', None)
-                    if mac_address:
-                        entry_dict['mac_address'] = mac_address
-                    if vlan_id:
-                        entry_dict['vlan_id'] = vlan_id
-                    if interface:
-                        entry_dict['interface'] = interface
-                    if entry_dict:
-                        mac_table_entries.append(entry_dict)
+            mac_table_entries = self.get_mac_table_entries(entry_list)
 
             if aging_time:
                 mac_dict['aging_time'] = aging_time
@@ -136,16 +129,68 @@ class MacFacts(object):
 
         return mac_address_cfg_list
 
-    def get_config(self, vrf_name, module, path, name):
-        cfg_dict = {}
-        get_path = '%s=%s/%s' % (NETWORK_INSTANCE_PATH, vrf_name, path)
-        request = {'path': get_path, 'method': 'get'}
-
+    def get_mac_table_entries(self, entry_list):
+        """Parse the MAC table entries, skipping the entries that are not
+        configured (dynamically learned) if only the configured entries
+        are requested"""
+        mac_table_entries = []
+        for entry in entry_list:
+            if self._configured_entries_only and not self.is_configured_entry(entry):
+                continue
+
+            entry_dict = {}
+            mac_address = entry.get('mac-address', None)
+            vlan_id = entry.get('vlan', None)
+            interface = entry.get('interface', {}).get('interface-ref', {}).get('config', {}).get('interface', None)
+            if mac_address:
+                entry_dict['mac_address'] = mac_address
+            if vlan_id:
+                entry_dict['vlan_id'] = vlan_id
+            if interface:
+                entry_dict['interface'] = interface
+            if entry_dict:
+                mac_table_entries.append(entry_dict)
+
+        return mac_table_entries
+
+    @staticmethod
+    def is_configured_entry(entry):
+        if entry.get('config'):
+            return True
+        entry_type = entry.get('state', {}).get('entry-type', '')
+        return entry_type.endswith('STATIC')
+
+    def get_network_instances(self, module):
+        """Get the MAC configuration of all the VRFs in a single request
+        and return it as a dict indexed by VRF name"""
+        # Only the name, FDB and MAC dampening subtrees of each network
+        # instance are requested, and only their configuration when the
+        # dynamically learned MAC table entries are not needed. The
+        # complete network instances tree is fetched from the devices
+        # that do not support the 'fields' and 'content' query parameters.
+        network_instances = {}
+        path = MAC_CFG_NETWORK_INSTANCES_PATH if self._configured_entries_only else MAC_NETWORK_INSTANCES_PATH
         try:
-            response = edit_config(module, to_request(module, request))
-            if name in response[0][1]:
-                cfg_dict = response[0][1].get(name, None)
-        except Exception as exc:
-            pass
-
-        return cfg_dict
+            response = self.send_get_request(module, path)
+        except ConnectionError:
+            try:
+                response = self.send_get_request(module, NETWORK_INSTANCES_PATH)
+            except ConnectionError as exc:
+                if re.search("code.*404", str(exc)):
+                    # 'code': 404, 'error-message': 'Resource not found'
+                    return network_instances
+                module.fail_json(msg=str(exc), code=exc.code)
+
+        if response and response[0] and 'openconfig-network-instance:network-instances' in response[0][1]:
+            all_network_instances = response[0][1]['openconfig-network-instance:network-instances']
+            for network_instance in all_network_instances.get('network-instance', []):
+                name = network_instance.get('name', None)
+                if name:
+                    network_instances[name] = network_instance
+
+        return network_instances
+
+    @staticmethod
+    def send_get_request(module, path):
+        request = {'path': path, 'method': 'get'}
+        return edit_config(module, to_request(module, request))
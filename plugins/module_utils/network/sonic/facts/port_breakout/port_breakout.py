@@ -22,7 +22,7 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
     edit_config
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import (
-    get_breakout_mode,
+    get_breakout_modes,
 )
 from ansible.module_utils.connection import ConnectionError
 
@@ -104,8 +104,11 @@ class Port_breakoutFacts(object):
             self._module.fail_json(msg=str(exc), code=exc.code)
 
         raw_port_breakout_list = []
+        breakout_modes = {}
         if "sonic-port-breakout:BREAKOUT_CFG_LIST" in response[0][1]:
             raw_port_breakout_list = response[0][1].get("sonic-port-breakout:BREAKOUT_CFG_LIST", [])
+            if raw_port_breakout_list:
+                breakout_modes = get_breakout_modes(self._module)
 
         for port_breakout in raw_port_breakout_list:
             name = port_breakout.get('port', None)
@@ -114,7 +117,7 @@ class Port_breakoutFacts(object):
                 if '[' in mode:
                     mode = mode[:mode.index('[')]
                 norm_port_breakout = {'name': name, 'mode': mode}
-                mode = get_breakout_mode(self._module, name)
+                mode = breakout_modes.get(name, None)
                 if mode:
                     norm_port_breakout['mode'] = mode
                 port_breakout_list.append(norm_port_breakout)
@@ -26,6 +26,8 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.s
 from ansible.module_utils.connection import ConnectionError
 
 GET = "get"
+NETWORK_INSTANCES_PATH = 'data/openconfig-network-instance:network-instances'
+VRF_INTERFACES_PATH = NETWORK_INSTANCES_PATH + '?fields=network-instance(name;interfaces)'
 
 
 class VrfsFacts(object):
@@ -91,17 +93,28 @@ class VrfsFacts(object):
         return conf
 
     def get_all_vrf_interfaces(self):
-        """Get all the interfaces available in chassis"""
-        all_network_instatnces = {}
-        request = [{"path": "data/openconfig-network-instance:network-instances", "method": GET}]
+        """Get the member interfaces of all the VRFs"""
+        # Only the name and the member interfaces of each network instance
+        # are requested, so that the protocol configuration in the network
+        # instances is not fetched. The complete network instances tree is
+        # fetched from the devices that do not support the 'fields' query
+        # parameter.
         try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-
+            response = self.get_network_instances(VRF_INTERFACES_PATH)
+        except ConnectionError:
+            try:
+                response = self.get_network_instances(NETWORK_INSTANCES_PATH)
+            except ConnectionError as exc:
+                self._module.fail_json(msg=str(exc), code=exc.code)
+
+        all_network_instances = {}
         if "openconfig-network-instance:network-instances" in response[0][1]:
-            all_network_instatnces = response[0][1].get("openconfig-network-instance:network-instances", {})
-        return self.get_vrf_interfaces_from_network_instances(all_network_instatnces['network-instance'])
+            all_network_instances = response[0][1].get("openconfig-network-instance:network-instances", {})
+        return self.get_vrf_interfaces_from_network_instances(all_network_instances.get('network-instance', []))
+
+    def get_network_instances(self, path):
+        request = [{"path": path, "method": GET}]
+        return edit_config(self._module, to_request(self._module, request))
 
     def get_vrf_interfaces_from_network_instances(self, network_instances):
         vrf_interfaces = []
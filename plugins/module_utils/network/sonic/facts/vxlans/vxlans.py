@@ -97,9 +97,9 @@ class VxlansFacts(object):
         vxlans = []
         vxlan_tunnels = []
         vxlan_vlan_map = []
+        vxlans_evpn_nvo_list = []
 
-        vxlans_tunnels_vlan_map = self.get_all_vxlans_tunnels_vlan_map()
-        vxlans_evpn_nvo_list = self.get_all_vxlans_evpn_nvo_list()
+        vxlans_tunnels_vlan_map, vxlan_vrf_list = self.get_all_vxlans_tunnels_vlan_map_vrf_list()
 
         if vxlans_tunnels_vlan_map.get('VXLAN_TUNNEL'):
             if vxlans_tunnels_vlan_map['VXLAN_TUNNEL'].get('VXLAN_TUNNEL_LIST'):
@@ -109,44 +109,21 @@ class VxlansFacts(object):
             if vxlans_tunnels_vlan_map['VXLAN_TUNNEL_MAP'].get('VXLAN_TUNNEL_MAP_LIST'):
                 vxlan_vlan_map.extend(vxlans_tunnels_vlan_map['VXLAN_TUNNEL_MAP']['VXLAN_TUNNEL_MAP_LIST'])
 
+        if vxlans_tunnels_vlan_map.get('EVPN_NVO'):
+            if vxlans_tunnels_vlan_map['EVPN_NVO'].get('EVPN_NVO_LIST'):
+                vxlans_evpn_nvo_list.extend(vxlans_tunnels_vlan_map['EVPN_NVO']['EVPN_NVO_LIST'])
+
         self.fill_tunnel_source_ip(vxlans, vxlan_tunnels, vxlans_evpn_nvo_list)
         self.fill_vlan_map(vxlans, vxlan_vlan_map)
-
-        vxlan_vrf_list = self.get_all_vxlans_vrf_list()
         self.fill_vrf_map(vxlans, vxlan_vrf_list)
 
         return vxlans
 
-    def get_all_vxlans_vrf_list(self):
-        """Get all the vxlan tunnels and vlan map available """
-        request = [{"path": "data/sonic-vrf:sonic-vrf/VRF/VRF_LIST", "method": GET}]
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-
-        if "sonic-vrf:VRF_LIST" in response[0][1]:
-            vxlan_vrf_list = response[0][1].get("sonic-vrf:VRF_LIST", {})
-
-        return vxlan_vrf_list
-
-    def get_all_vxlans_evpn_nvo_list(self):
-        """Get all the evpn nvo list available """
-        request = [{"path": "data/sonic-vxlan:sonic-vxlan/EVPN_NVO/EVPN_NVO_LIST", "method": GET}]
-        try:
-            response = edit_config(self._module, to_request(self._module, request))
-        except ConnectionError as exc:
-            self._module.fail_json(msg=str(exc), code=exc.code)
-
-        vxlans_evpn_nvo_list = []
-        if "sonic-vxlan:EVPN_NVO_LIST" in response[0][1]:
-            vxlans_evpn_nvo_list = response[0][1].get("sonic-vxlan:EVPN_NVO_LIST", [])
-
-        return vxlans_evpn_nvo_list
-
-    def get_all_vxlans_tunnels_vlan_map(self):
-        """Get all the vxlan tunnels and vlan map available """
-        request = [{"path": "data/sonic-vxlan:sonic-vxlan", "method": GET}]
+    def get_all_vxlans_tunnels_vlan_map_vrf_list(self):
+        """Get all the vxlan tunnels, evpn nvo list, vlan map and vrf list
+        available"""
+        request = [{"path": "data/sonic-vxlan:sonic-vxlan", "method": GET},
+                   {"path": "data/sonic-vrf:sonic-vrf/VRF/VRF_LIST", "method": GET}]
         try:
             response = edit_config(self._module, to_request(self._module, request))
         except ConnectionError as exc:
@@ -156,24 +133,36 @@ class VxlansFacts(object):
         if "sonic-vxlan:sonic-vxlan" in response[0][1]:
             vxlans_tunnels_vlan_map = response[0][1].get("sonic-vxlan:sonic-vxlan", {})
 
-        return vxlans_tunnels_vlan_map
+        vxlan_vrf_list = []
+        if "sonic-vrf:VRF_LIST" in response[1][1]:
+            vxlan_vrf_list = response[1][1].get("sonic-vrf:VRF_LIST", [])
+
+        return vxlans_tunnels_vlan_map, vxlan_vrf_list
 
     def fill_tunnel_source_ip(self, vxlans, vxlan_tunnels, vxlans_evpn_nvo_list):
+        evpn_nvo_dict = {}
+        for nvo_map in vxlans_evpn_nvo_list:
+            evpn_nvo_dict.setdefault(nvo_map.get('source_vtep'), nvo_map['name'])
+
         for each_tunnel in vxlan_tunnels:
             vxlan = dict()
             vxlan['name'] = each_tunnel['name']
             vxlan['source_ip'] = each_tunnel.get('src_ip', None)
             vxlan['primary_ip'] = each_tunnel.get('primary_ip', None)
             vxlan['evpn_nvo'] = None
-            evpn_nvo = next((nvo_map['name'] for nvo_map in vxlans_evpn_nvo_list if nvo_map['source_vtep'] == vxlan['name']), None)
+            evpn_nvo = evpn_nvo_dict.get(vxlan['name'])
             if evpn_nvo:
                 vxlan['evpn_nvo'] = evpn_nvo
             vxlans.append(vxlan)
 
     def fill_vlan_map(self, vxlans, vxlan_vlan_map):
+        vxlans_dict = {}
+        for each_vxlan in vxlans:
+            vxlans_dict.setdefault(each_vxlan['name'], each_vxlan)
+
         for each_vlan_map in vxlan_vlan_map:
             name = each_vlan_map['name']
-            matched_vtep = next((each_vxlan for each_vxlan in vxlans if each_vxlan['name'] == name), None)
+            matched_vtep = vxlans_dict.get(name)
             if matched_vtep:
                 vni = int(each_vlan_map['vni'])
                 vlan = int(each_vlan_map['vlan'][4:])
@@ -184,17 +173,18 @@ class VxlansFacts(object):
                     matched_vtep['vlan_map'] = [dict({'vni': vni, 'vlan': vlan})]
 
     def fill_vrf_map(self, vxlans, vxlan_vrf_list):
+        # The VNI of a VRF is mapped to the last VTEP with a matching VLAN VNI
+        vni_vxlans_dict = {}
+        for each_vxlan in vxlans:
+            for each_vlan in each_vxlan.get('vlan_map', []):
+                vni_vxlans_dict[each_vlan['vni']] = each_vxlan
+
         for each_vrf in vxlan_vrf_list:
             vni = each_vrf.get('vni', None)
             if vni is None:
                 continue
 
-            matched_vtep = None
-            for each_vxlan in vxlans:
-                for each_vlan in each_vxlan.get('vlan_map', []):
-                    if vni == each_vlan['vni']:
-                        matched_vtep = each_vxlan
-
+            matched_vtep = vni_vxlans_dict.get(vni)
             if matched_vtep:
                 vni = int(each_vrf['vni'])
                 vrf = each_vrf['vrf_name']
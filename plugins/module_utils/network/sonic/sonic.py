@@ -87,14 +87,31 @@ def get_config(module, flags=None):
         return cfg
 
 
+def get_config_section(module, parents, flags=None):
+    """Returns the block of the running configuration under 'parents',
+    looked up by the connection in its running configuration cache"""
+    connection = get_connection(module)
+    try:
+        out = connection.get_config_section(parents=parents, flags=to_list(flags))
+    except ConnectionError as exc:
+        module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
+    return to_text(out, errors="surrogate_then_replace")
+
+
 def get_sublevel_config(running_config, module):
+    running_config = NetworkConfig(contents=running_config, indent=1)
+    return get_sublevel_config_from_obj(running_config, module.params['parents'])
+
+
+def get_sublevel_config_from_obj(running_config, parents):
+    """Returns the block of the parsed running configuration under 'parents'.
+    The parsed configuration is not modified, so that it can be reused."""
     contents = list()
     current_config_contents = list()
-    running_config = NetworkConfig(contents=running_config, indent=1)
-    obj = running_config.get_object(module.params['parents'])
+    obj = running_config.get_object(parents)
     if obj:
-        contents = obj.children
-    parents = module.params['parents']
+        contents = list(obj.children)
+    parents = list(parents)
     if parents[2:]:
         temp = 1
         for count, item in enumerate(parents[2:], start=2):
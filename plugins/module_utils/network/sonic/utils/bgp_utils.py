@@ -28,10 +28,60 @@ afi_safi_types_map = {
     'openconfig-bgp-types:IPV6_UNICAST': 'ipv6_unicast',
     'openconfig-bgp-types:L2VPN_EVPN': 'l2vpn_evpn',
 }
+
+# Attributes common to BGP peer groups and neighbors, as pairs of the
+# argspec path (at most two levels deep) and the OpenConfig path of each attribute
+bgp_nbr_pg_common_attr_map = (
+    (('bfd', 'enabled'), ('enable-bfd', 'config', 'enabled')),
+    (('bfd', 'check_failure'), ('enable-bfd', 'config', 'check-control-plane-failure')),
+    (('bfd', 'profile'), ('enable-bfd', 'config', 'bfd-profile')),
+    (('auth_pwd', 'pwd'), ('auth-password', 'config', 'password')),
+    (('auth_pwd', 'encrypted'), ('auth-password', 'config', 'encrypted')),
+    (('ebgp_multihop', 'enabled'), ('ebgp-multihop', 'config', 'enabled')),
+    (('ebgp_multihop', 'multihop_ttl'), ('ebgp-multihop', 'config', 'multihop-ttl')),
+    (('timers', 'holdtime'), ('timers', 'config', 'hold-time')),
+    (('timers', 'keepalive'), ('timers', 'config', 'keepalive-interval')),
+    (('timers', 'connect_retry'), ('timers', 'config', 'connect-retry')),
+    (('advertisement_interval',), ('timers', 'config', 'minimum-advertisement-interval')),
+    (('capability', 'dynamic'), ('config', 'capability-dynamic')),
+    (('capability', 'extended_nexthop'), ('config', 'capability-extended-nexthop')),
+    (('disable_connected_check',), ('config', 'disable-ebgp-connected-route-check')),
+    (('dont_negotiate_capability',), ('config', 'dont-negotiate-capability')),
+    (('enforce_first_as',), ('config', 'enforce-first-as')),
+    (('enforce_multihop',), ('config', 'enforce-multihop')),
+    (('override_capability',), ('config', 'override-capability')),
+    (('shutdown_msg',), ('config', 'shutdown-message')),
+    (('solo',), ('config', 'solo-peer')),
+    (('strict_capability_match',), ('config', 'strict-capability-match')),
+    (('ttl_security',), ('config', 'ttl-security-hops')),
+    (('local_as', 'as'), ('config', 'local-as')),
+    (('local_as', 'no_prepend'), ('config', 'local-as-no-prepend')),
+    (('local_as', 'replace_as'), ('config', 'local-as-replace-as')),
+    (('local_address',), ('transport', 'config', 'local-address')),
+    (('passive',), ('transport', 'config', 'passive-mode')),
+)
+bgp_pg_attr_map = (
+    (('name',), ('peer-group-name',)),
+    (('name',), ('config', 'peer-group-name')),
+    (('pg_description',), ('config', 'description')),
+) + bgp_nbr_pg_common_attr_map
+bgp_nbr_attr_map = (
+    (('neighbor',), ('neighbor-address',)),
+    (('neighbor',), ('config', 'neighbor-address')),
+    (('peer_group',), ('config', 'peer-group')),
+    (('nbr_description',), ('config', 'description')),
+    (('port',), ('config', 'peer-port')),
+    (('v6only',), ('config', 'openconfig-bgp-ext:v6only')),
+) + bgp_nbr_pg_common_attr_map
+
 GET = "get"
 network_instance_path = '/data/openconfig-network-instance:network-instances/network-instance'
 protocol_bgp_path = 'protocols/protocol=BGP,bgp/bgp'
 
+# Compiled params maps and attribute maps, indexed by the id of the map
+compiled_params_maps = {}
+compiled_attr_maps = {}
+
 
 def get_all_vrfs(module):
     """Get all VRF configurations available in chassis"""
@@ -66,82 +116,7 @@ def get_peergroups(module, vrf_name):
         data = resp['openconfig-network-instance:peer-groups']
         if 'peer-group' in data:
             for peer_group in data['peer-group']:
-                pg = {}
-                if 'config' in peer_group:
-                    if 'peer-group-name' in peer_group['config']:
-                        pg.update({'name': peer_group['config']['peer-group-name']})
-                    if 'description' in peer_group['config']:
-                        pg.update({'pg_description': peer_group['config']['description']})
-                    if 'disable-ebgp-connected-route-check' in peer_group['config']:
-                        pg.update({'disable_connected_check': peer_group['config']['disable-ebgp-connected-route-check']})
-                    if 'dont-negotiate-capability' in peer_group['config']:
-                        pg.update({'dont_negotiate_capability': peer_group['config']['dont-negotiate-capability']})
-                    if 'enforce-first-as' in peer_group['config']:
-                        pg.update({'enforce_first_as': peer_group['config']['enforce-first-as']})
-                    if 'enforce-multihop' in peer_group['config']:
-                        pg.update({'enforce_multihop': peer_group['config']['enforce-multihop']})
-                    local_as = {}
-                    if 'local-as' in peer_group['config']:
-                        local_as.update({'as': peer_group['config']['local-as']})
-                    if 'local-as-no-prepend' in peer_group['config']:
-                        local_as.update({'no_prepend': peer_group['config']['local-as-no-prepend']})
-                    if 'local-as-replace-as' in peer_group['config']:
-                        local_as.update({'replace_as': peer_group['config']['local-as-replace-as']})
-                    if 'override-capability' in peer_group['config']:
-                        pg.update({'override_capability': peer_group['config']['override-capability']})
-                    if 'shutdown-message' in peer_group['config']:
-                        pg.update({'shutdown_msg': peer_group['config']['shutdown-message']})
-                    if 'solo-peer' in peer_group['config']:
-                        pg.update({'solo': peer_group['config']['solo-peer']})
-                    if 'strict-capability-match' in peer_group['config']:
-                        pg.update({'strict_capability_match': peer_group['config']['strict-capability-match']})
-                    if 'ttl-security-hops' in peer_group['config']:
-                        pg.update({'ttl_security': peer_group['config']['ttl-security-hops']})
-                auth_pwd = {}
-                if 'auth-password' in peer_group and 'config' in peer_group['auth-password']:
-                    if 'encrypted' in peer_group['auth-password']['config']:
-                        auth_pwd.update({'encrypted': peer_group['auth-password']['config']['encrypted']})
-                    if 'password' in peer_group['auth-password']['config']:
-                        auth_pwd.update({'pwd': peer_group['auth-password']['config']['password']})
-                bfd = {}
-                if 'enable-bfd' in peer_group and 'config' in peer_group['enable-bfd']:
-                    if 'enabled' in peer_group['enable-bfd']['config']:
-                        bfd.update({'enabled': peer_group['enable-bfd']['config']['enabled']})
-                    if 'check-control-plane-failure' in peer_group['enable-bfd']['config']:
-                        bfd.update({'check_failure': peer_group['enable-bfd']['config']['check-control-plane-failure']})
-                    if 'bfd-profile' in peer_group['enable-bfd']['config']:
-                        bfd.update({'profile': peer_group['enable-bfd']['config']['bfd-profile']})
-                ebgp_multihop = {}
-                if 'ebgp-multihop' in peer_group and 'config' in peer_group['ebgp-multihop']:
-                    if 'enabled' in peer_group['ebgp-multihop']['config']:
-                        ebgp_multihop.update({'enabled': peer_group['ebgp-multihop']['config']['enabled']})
-                    if 'multihop-ttl' in peer_group['ebgp-multihop']['config']:
-                        ebgp_multihop.update({'multihop_ttl': peer_group['ebgp-multihop']['config']['multihop-ttl']})
-                if 'transport' in peer_group and 'config' in peer_group['transport']:
-                    if 'local-address' in peer_group['transport']['config']:
-                        pg.update({'local_address': peer_group['transport']['config']['local-address']})
-                    if 'passive-mode' in peer_group['transport']['config']:
-                        pg.update({'passive': peer_group['transport']['config']['passive-mode']})
-                if 'timers' in peer_group and 'config' in peer_group['timers']:
-                    if 'minimum-advertisement-interval' in peer_group['timers']['config']:
-                        pg.update({'advertisement_interval': peer_group['timers']['config']['minimum-advertisement-interval']})
-                timers = {}
-                if 'hold-time' in peer_group['timers']['config']:
-                    timers.update({'holdtime': peer_group['timers']['config']['hold-time']})
-                if 'keepalive-interval' in peer_group['timers']['config']:
-                    timers.update({'keepalive': peer_group['timers']['config']['keepalive-interval']})
-                if 'connect-retry' in peer_group['timers']['config']:
-                    timers.update({'connect_retry': peer_group['timers']['config']['connect-retry']})
-                capability = {}
-                if 'config' in peer_group and 'capability-dynamic' in peer_group['config']:
-                    capability.update({'dynamic': peer_group['config']['capability-dynamic']})
-                if 'config' in peer_group and 'capability-extended-nexthop' in peer_group['config']:
-                    capability.update({'extended_nexthop': peer_group['config']['capability-extended-nexthop']})
-                remote_as = {}
-                if 'config' in peer_group and 'peer-as' in peer_group['config']:
-                    remote_as.update({'peer_as': peer_group['config']['peer-as']})
-                if 'config' in peer_group and 'peer-type' in peer_group['config']:
-                    remote_as.update({'peer_type': peer_group['config']['peer-type'].lower()})
+                pg = get_bgp_nbr_pg_cfg(bgp_pg_attr_map, peer_group)
                 afis = []
                 if 'afi-safis' in peer_group and 'afi-safi' in peer_group['afi-safis']:
                     for each in peer_group['afi-safis']['afi-safi']:
@@ -197,20 +172,6 @@ def get_peergroups(module, vrf_name):
                                 samp.update({'prefix_list_out': pfx_lst_conf['export-policy']})
                         if samp:
                             afis.append(samp)
-                if auth_pwd:
-                    pg.update({'auth_pwd': auth_pwd})
-                if bfd:
-                    pg.update({'bfd': bfd})
-                if ebgp_multihop:
-                    pg.update({'ebgp_multihop': ebgp_multihop})
-                if local_as:
-                    pg.update({'local_as': local_as})
-                if timers:
-                    pg.update({'timers': timers})
-                if capability:
-                    pg.update({'capability': capability})
-                if remote_as:
-                    pg.update({'remote_as': remote_as})
                 if afis and len(afis) > 0:
                     afis_dict = {}
                     afis_dict.update({'afis': afis})
@@ -220,6 +181,79 @@ def get_peergroups(module, vrf_name):
     return peer_groups
 
 
+def get_bgp_nbr_pg_cfg(attr_map, data):
+    """Return the argspec representation of the BGP peer group or neighbor
+    OpenConfig data, as specified by the attribute map"""
+    cfg = {}
+    for container_path, leaves in get_compiled_attr_map(attr_map):
+        container = data
+        for key in container_path:
+            if key == 'config' and key not in container:
+                key = 'state'
+            container = container.get(key)
+            if not isinstance(container, dict):
+                break
+        else:
+            for leaf, parent_attr, attr in leaves:
+                val = container.get(leaf)
+                if val is not None:
+                    if parent_attr:
+                        cfg.setdefault(parent_attr, {})[attr] = val
+                    else:
+                        cfg[attr] = val
+
+    nbr_pg_cfg = data.get('config', data.get('state'))
+    if nbr_pg_cfg:
+        remote_as = {}
+        if nbr_pg_cfg.get('peer-as') is not None:
+            remote_as['peer_as'] = nbr_pg_cfg['peer-as']
+        if nbr_pg_cfg.get('peer-type') is not None:
+            remote_as['peer_type'] = nbr_pg_cfg['peer-type'].lower()
+        if remote_as:
+            cfg['remote_as'] = remote_as
+
+    return cfg
+
+
+def get_bgp_nbr_pg_payload(attr_map, cfg):
+    """Return the OpenConfig payload for the BGP peer group or neighbor
+    configuration, as specified by the attribute map"""
+    payload = {}
+    for attr_path, oc_path in attr_map:
+        val = cfg
+        for attr in attr_path:
+            val = val.get(attr) if val else None
+        if val is not None:
+            container = payload
+            for key in oc_path[:-1]:
+                container = container.setdefault(key, {})
+            container[oc_path[-1]] = val
+
+    # The password and its encryption are configured together
+    auth_pwd_cfg = payload.get('auth-password', {}).get('config', {})
+    if auth_pwd_cfg and len(auth_pwd_cfg) != 2:
+        payload.pop('auth-password')
+
+    return payload
+
+
+def get_compiled_attr_map(attr_map):
+    """Return the attribute map grouped by the OpenConfig container of the
+    attributes, as a list of (container path, [(leaf, parent, attribute)])"""
+    cached = compiled_attr_maps.get(id(attr_map))
+    if cached and cached[0] is attr_map:
+        return cached[1]
+
+    containers = {}
+    for attr_path, oc_path in attr_map:
+        parent_attr = attr_path[0] if len(attr_path) > 1 else None
+        containers.setdefault(oc_path[:-1], []).append((oc_path[-1], parent_attr, attr_path[-1]))
+    compiled = list(containers.items())
+
+    compiled_attr_maps[id(attr_map)] = (attr_map, compiled)
+    return compiled
+
+
 def update_bgp_nbr_pg_ip_afi_dict(ip_afi_conf):
     ip_afi = {}
     if 'default-policy-name' in ip_afi_conf and ip_afi_conf['default-policy-name']:
@@ -368,79 +402,91 @@ def get_bgp_global_data(data, global_params_map):
 
 
 def get_from_params_map(params_map, data):
+    config_leaves, timers_leaves, key_sources = get_compiled_params_map(params_map)
     ret_data = {}
-    for want_key, config_key in params_map.items():
-        tmp_data = {}
-        for key, val in data.items():
-            if key == 'config':
-                for k, v in val.items():
-                    if k == config_key:
-                        val_data = val[config_key]
-                        ret_data.update({want_key: val_data})
-                        if config_key == 'afi-safi-name':
-                            ret_data.pop(want_key)
-                            for type_k, type_val in afi_safi_types_map.items():
-                                if type_k == val_data:
-                                    afi_safi = type_val.split('_')
-                                    val_data = afi_safi[0]
-                                    ret_data.update({'safi': afi_safi[1]})
-                                    ret_data.update({want_key: val_data})
-                                    break
-            else:
-                if key == 'timers' and ('config' in val or 'state' in val):
-                    tmp = {}
-                    if key in ret_data:
-                        tmp = ret_data[key]
-                    cfg = val['config'] if 'config' in val else val['state']
-                    for k, v in cfg.items():
-                        if k == config_key:
-                            if k != 'minimum-advertisement-interval':
-                                tmp.update({want_key: cfg[config_key]})
-                            else:
-                                ret_data.update({want_key: cfg[config_key]})
-                    if tmp:
-                        ret_data.update({key: tmp})
-
-                elif isinstance(config_key, list):
-                    i = 0
-                    if key == config_key[0]:
-                        if key == 'afi-safi':
-                            cfg_data = config_key[1]
-                            for itm in afi_safi_types_map:
-                                if cfg_data in itm:
-                                    afi_safi = itm[cfg_data].split('_')
-                                    cfg_data = afi_safi[0]
-                                    ret_data.update({'safi': afi_safi[1]})
-                                    ret_data.update({want_key: cfg_data})
-                                    break
-                        else:
-                            cfg_data = {key: val}
-                            for cfg_key in config_key:
-                                if cfg_key == 'config':
-                                    continue
-                                new_data = None
-
-                                if cfg_key in cfg_data:
-                                    new_data = cfg_data[cfg_key]
-                                elif isinstance(cfg_data, dict) and 'config' in cfg_data:
-                                    if cfg_key in cfg_data['config']:
-                                        new_data = cfg_data['config'][cfg_key]
-
-                                if new_data is not None:
-                                    cfg_data = new_data
-                                else:
-                                    break
-                            else:
-                                ret_data.update({want_key: cfg_data})
-                else:
-                    if key == config_key and val:
-                        if config_key != 'afi-safi-name' and config_key != 'timers':
-                            cfg_data = val
-                            ret_data.update({want_key: cfg_data})
+    for key, val in data.items():
+        if key == 'config':
+            for config_key, val_data in val.items():
+                for want_key in config_leaves.get(config_key, ()):
+                    ret_data.update({want_key: val_data})
+                    if config_key == 'afi-safi-name':
+                        ret_data.pop(want_key)
+                        try:
+                            afi_safi = afi_safi_types_map.get(val_data)
+                        except TypeError:
+                            afi_safi = None
+                        if afi_safi:
+                            afi_safi = afi_safi.split('_')
+                            ret_data.update({'safi': afi_safi[1]})
+                            ret_data.update({want_key: afi_safi[0]})
+            continue
+
+        if key == 'timers' and ('config' in val or 'state' in val):
+            tmp = ret_data.get(key, {})
+            cfg = val['config'] if 'config' in val else val['state']
+            for config_key, cfg_val in cfg.items():
+                for want_key in timers_leaves.get(config_key, ()):
+                    if config_key != 'minimum-advertisement-interval':
+                        tmp.update({want_key: cfg_val})
+                    else:
+                        ret_data.update({want_key: cfg_val})
+            if tmp:
+                ret_data.update({key: tmp})
+            continue
+
+        for want_key, steps in key_sources.get(key, ()):
+            if steps is None:
+                if val:
+                    ret_data.update({want_key: val})
+                continue
+
+            cfg_data = val
+            for cfg_key in steps:
+                if cfg_data is None:
+                    break
+                new_data = None
+                if cfg_key in cfg_data:
+                    new_data = cfg_data[cfg_key]
+                elif isinstance(cfg_data, dict) and 'config' in cfg_data:
+                    if cfg_key in cfg_data['config']:
+                        new_data = cfg_data['config'][cfg_key]
+                cfg_data = new_data
+            if cfg_data is not None:
+                ret_data.update({want_key: cfg_data})
 
     return ret_data
 
 
+def get_compiled_params_map(params_map):
+    """Return the compiled form of the params map. The compiled params map
+    indexes the argspec keys by the 'config' leaf, the 'timers' leaf and the
+    top level data key from which their values are taken, so that the data is
+    mapped with direct lookups."""
+    cached = compiled_params_maps.get(id(params_map))
+    if cached and cached[0] is params_map and cached[1] == len(params_map):
+        return cached[2]
+
+    config_leaves = {}
+    timers_leaves = {}
+    key_sources = {}
+    for want_key, config_key in params_map.items():
+        if isinstance(config_key, list):
+            # Path to the leaf from a top level data key. The 'config'
+            # containers along the path are looked into implicitly.
+            if config_key[0] not in ('config', 'afi-safi'):
+                steps = tuple(cfg_key for cfg_key in config_key[1:] if cfg_key != 'config')
+                key_sources.setdefault(config_key[0], []).append((want_key, steps))
+        else:
+            config_leaves.setdefault(config_key, []).append(want_key)
+            timers_leaves.setdefault(config_key, []).append(want_key)
+            if config_key not in ('config', 'timers', 'afi-safi-name'):
+                key_sources.setdefault(config_key, []).append((want_key, None))
+
+    compiled = (config_leaves, timers_leaves, key_sources)
+    compiled_params_maps[id(params_map)] = (params_map, len(params_map), compiled)
+    return compiled
+
+
 def get_bgp_data(module, global_params_map):
     vrf_list = get_all_vrfs(module)
     data = get_all_bgp_globals(module, vrf_list)
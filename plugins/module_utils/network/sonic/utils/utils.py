@@ -25,6 +25,7 @@ from ansible.module_utils.common.network import (
 )
 from ansible.module_utils.common.validation import check_required_arguments
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import (
+    get_connection,
     to_request,
     edit_config
 )
@@ -350,6 +351,13 @@ def remove_empties_from_list(config_list):
 
 
 def get_device_interface_naming_mode(module):
+    """Return the interface naming mode of the device. The naming mode cached
+    by the persistent connection is used when it is available."""
+    try:
+        return get_connection(module).get_intf_naming_mode()
+    except ConnectionError:
+        pass
+
     intf_naming_mode = ""
     request = {"path": "data/sonic-device-metadata:sonic-device-metadata/DEVICE_METADATA/DEVICE_METADATA_LIST=localhost", "method": GET}
     try:
@@ -370,11 +378,20 @@ NATIVE_ETH_REGEXP = r"[e|E]th*\d+$"
 NATIVE_MODE = "native"
 STANDARD_MODE = "standard"
 
+STANDARD_ETH_RE = re.compile(STANDARD_ETH_REGEXP)
+NATIVE_ETH_RE = re.compile(NATIVE_ETH_REGEXP)
+WHITESPACE_RE = re.compile(r"\s+", flags=re.UNICODE)
+DIGIT_RE = re.compile(r"\d")
+
+# Normalized interface names, indexed by the input interface name
+NORMALIZED_INTF_NAMES_MAX = 8192
+normalized_intf_names = {}
+
 
 def find_intf_naming_mode(intf_name):
     ret_intf_naming_mode = NATIVE_MODE
 
-    if re.search(STANDARD_ETH_REGEXP, intf_name):
+    if STANDARD_ETH_RE.search(intf_name):
         ret_intf_naming_mode = STANDARD_MODE
 
     return ret_intf_naming_mode
@@ -403,39 +420,67 @@ def normalize_interface_name(configs, module, namekey=None):
 
 
 def normalize_interface_name_list(configs, module):
-    norm_configs = []
-    if configs:
-        for conf in configs:
-            conf = get_normalize_interface_name(conf, module)
-            norm_configs.append(conf)
+    return normalize_interface_names(configs, module)
 
-    return norm_configs
+
+def normalize_interface_names(intf_names, module):
+    """Return the normalized names of the interfaces in the input list. Each
+    distinct name is normalized only once."""
+    norm_names = []
+    if intf_names:
+        norm_name_map = {}
+        for intf_name in intf_names:
+            norm_name = norm_name_map.get(intf_name)
+            if norm_name is None:
+                norm_name = get_normalize_interface_name(intf_name, module)
+                norm_name_map[intf_name] = norm_name
+            norm_names.append(norm_name)
+
+    return norm_names
 
 
 def get_normalize_interface_name(intf_name, module):
+    normalized = normalized_intf_names.get(intf_name)
+    if normalized is None:
+        normalized = derive_normalized_interface_name(intf_name)
+        if len(normalized_intf_names) >= NORMALIZED_INTF_NAMES_MAX:
+            normalized_intf_names.clear()
+        normalized_intf_names[intf_name] = normalized
+
+    ret_intf_name, is_eth = normalized
+    # Interface naming mode affects only ethernet ports
+    if is_eth:
+        validate_intf_naming_mode(intf_name, module)
+
+    return ret_intf_name
+
+
+def derive_normalized_interface_name(intf_name):
+    """Return a tuple of the normalized interface name and a flag indicating
+    whether the interface naming mode applies to the interface"""
     change_flag = False
+    is_eth = False
     # remove the space in the given string
-    ret_intf_name = re.sub(r"\s+", "", intf_name, flags=re.UNICODE)
+    ret_intf_name = WHITESPACE_RE.sub("", intf_name)
     ret_intf_name = ret_intf_name.capitalize()
 
     # serach the numeric charecter(digit)
-    match = re.search(r"\d", ret_intf_name)
+    match = DIGIT_RE.search(ret_intf_name)
     if match:
         change_flag = True
         start_pos = match.start()
         name = ret_intf_name[0:start_pos]
         intf_id = ret_intf_name[start_pos:]
 
-        # Interface naming mode affects only ethernet ports
         if name.startswith("Eth"):
-            validate_intf_naming_mode(intf_name, module)
+            is_eth = True
 
         if ret_intf_name.startswith("Management") or ret_intf_name.startswith("Mgmt"):
             name = "eth"
             intf_id = "0"
-        elif re.search(STANDARD_ETH_REGEXP, ret_intf_name):
+        elif STANDARD_ETH_RE.search(ret_intf_name):
             name = "Eth"
-        elif re.search(NATIVE_ETH_REGEXP, ret_intf_name):
+        elif NATIVE_ETH_RE.search(ret_intf_name):
             name = "Ethernet"
         elif name.startswith("Po"):
             name = "PortChannel"
@@ -451,7 +496,7 @@ def get_normalize_interface_name(intf_name, module):
     if not change_flag:
         ret_intf_name = intf_name
 
-    return ret_intf_name
+    return ret_intf_name, is_eth
 
 
 def get_speed_from_breakout_mode(breakout_mode):
@@ -459,12 +504,20 @@ def get_speed_from_breakout_mode(breakout_mode):
 
 
 def get_breakout_mode(module, name):
+    return get_breakout_modes(module).get(name, None)
+
+
+def get_breakout_modes(module):
+    """Return a dict mapping port names to their breakout modes. The breakout
+    modes of all ports are retrieved using a single request and cached in the
+    module for the rest of the module run."""
+    breakout_modes = getattr(module, '_sonic_breakout_modes', None)
+    if breakout_modes is not None:
+        return breakout_modes
+
     response = None
-    mode = None
-    component_name = name
-    if "/" in name:
-        component_name = name.replace("/", "%2f")
-    url = "data/openconfig-platform:components/component=%s" % (component_name)
+    breakout_modes = {}
+    url = "data/openconfig-platform:components"
     request = [{"path": url, "method": GET}]
     try:
         response = edit_config(module, to_request(module, request))
@@ -478,21 +531,39 @@ def get_breakout_mode(module, name):
         except Exception as err:
             module.fail_json(msg=str(exc), code=exc.code)
 
-    if response and "openconfig-platform:component" in response[0][1]:
-        raw_port_breakout = response[0][1]['openconfig-platform:component'][0]
-        port_name = raw_port_breakout.get('name', None)
-        port_data = raw_port_breakout.get('port', None)
-        if port_name and port_data and 'openconfig-platform-port:breakout-mode' in port_data:
-            if 'groups' in port_data['openconfig-platform-port:breakout-mode']:
-                group = port_data['openconfig-platform-port:breakout-mode']['groups']['group'][0]
-                if 'config' in group:
-                    cfg = group.get('config', None)
-                    breakout_speed = cfg.get('breakout-speed', None)
-                    num_breakouts = cfg.get('num-breakouts', None)
-                    if breakout_speed and num_breakouts:
-                        speed = breakout_speed.replace('openconfig-if-ethernet:SPEED_', '')
-                        speed = speed.replace('GB', 'G')
-                        mode = str(num_breakouts) + 'x' + speed
+    if response and response[0] and "openconfig-platform:components" in response[0][1]:
+        raw_components = response[0][1]['openconfig-platform:components'].get('component', [])
+        for raw_port_breakout in raw_components:
+            port_name = raw_port_breakout.get('name', None)
+            mode = get_breakout_mode_from_component(raw_port_breakout)
+            if port_name and mode:
+                breakout_modes[port_name] = mode
+
+    module._sonic_breakout_modes = breakout_modes
+    return breakout_modes
+
+
+def clear_breakout_modes_cache(module):
+    """Discard the breakout modes cached by get_breakout_modes, so that they
+    are retrieved again after the breakout configuration is modified"""
+    module._sonic_breakout_modes = None
+
+
+def get_breakout_mode_from_component(raw_port_breakout):
+    mode = None
+    port_name = raw_port_breakout.get('name', None)
+    port_data = raw_port_breakout.get('port', None)
+    if port_name and port_data and 'openconfig-platform-port:breakout-mode' in port_data:
+        if 'groups' in port_data['openconfig-platform-port:breakout-mode']:
+            group = port_data['openconfig-platform-port:breakout-mode']['groups']['group'][0]
+            if 'config' in group:
+                cfg = group.get('config', None)
+                breakout_speed = cfg.get('breakout-speed', None)
+                num_breakouts = cfg.get('num-breakouts', None)
+                if breakout_speed and num_breakouts:
+                    speed = breakout_speed.replace('openconfig-if-ethernet:SPEED_', '')
+                    speed = speed.replace('GB', 'G')
+                    mode = str(num_breakouts) + 'x' + speed
     return mode
 
 
@@ -74,8 +74,48 @@ options:
         of the command. If the command does not pass the specified
         conditions, the interval indicates how long to wait before
         trying the command again.
+      - With I(backoff), this is the interval before the first retry.
     type: int
     default: 1
+  backoff:
+    description:
+      - Specifies how the interval between retries grows.
+      - C(none) waits I(interval) seconds between all retries.
+      - C(exponential) doubles the interval after each retry, up to I(max_interval).
+      - C(jitter) waits a random time between half and the whole of the
+        C(exponential) interval, so that polls from many devices are spread out.
+    type: str
+    default: none
+    choices: [ 'none', 'exponential', 'jitter' ]
+    version_added: 2.3.0
+  max_interval:
+    description:
+      - Specifies the maximum interval in seconds between retries when I(backoff)
+        is C(exponential) or C(jitter).
+    type: int
+    default: 30
+    version_added: 2.3.0
+  wait_timeout:
+    description:
+      - Specifies the overall time in seconds to wait for the I(wait_for) conditions.
+        The task fails when the conditions are not satisfied within this time,
+        even if the number of I(retries) has not been reached.
+      - By default, only I(retries) limits the wait.
+    type: int
+    version_added: 2.3.0
+  rerun:
+    description:
+      - Specifies the commands that are run again on each retry.
+      - C(all) runs all the I(commands) again.
+      - C(pending) runs again only the commands whose output is used by the
+        I(wait_for) conditions that are not satisfied yet. The output of the
+        other commands is the one of their last run.
+      - All the commands are run again if the command used by a condition cannot be
+        determined from the condition.
+    type: str
+    default: all
+    choices: [ 'all', 'pending' ]
+    version_added: 2.3.0
 """
 
 EXAMPLES = """
@@ -103,6 +143,21 @@ EXAMPLES = """
         - result[0] contains Dell
         - result[1] contains Hostname
 
+  - name: Waits for BGP neighbors to be established, polling only the pending commands
+    dellemc.enterprise_sonic.sonic_command:
+      commands:
+        - 'show ip bgp summary'
+        - 'show bgp ipv6 summary'
+      wait_for:
+        - result[0] contains Established
+        - result[1] contains Established
+      rerun: pending
+      backoff: jitter
+      interval: 2
+      max_interval: 30
+      wait_timeout: 600
+      retries: 50
+
   - name: Runs commands that require answering a prompt
     dellemc.enterprise_sonic.sonic_command:
       commands:
@@ -133,6 +188,8 @@ warnings:
   type: list
   sample: ['...', '...']
 """
+import random
+import re
 import time
 
 from ansible.module_utils._text import to_text
@@ -171,6 +228,40 @@ def parse_commands(module, warnings):
     return commands
 
 
+def get_conditional_command_index(conditional):
+    """Returns the index of the command whose output is used by
+    'conditional', or None if it cannot be determined"""
+    match = re.match(r'^result\[(\d+)\]', conditional.key)
+    if match:
+        return int(match.group(1))
+    return None
+
+
+def get_pending_commands(commands, conditionals):
+    """Returns the indices of the commands whose output is used
+    by the conditionals not satisfied yet"""
+    pending = set()
+    for item in conditionals:
+        index = get_conditional_command_index(item)
+        if index is None or index >= len(commands):
+            return list(range(len(commands)))
+        pending.add(index)
+    return sorted(pending)
+
+
+def get_retry_interval(module, attempt):
+    """Returns the time to wait before retry number 'attempt' (from 0)"""
+    interval = module.params['interval']
+    backoff = module.params['backoff']
+    if backoff == 'none':
+        return interval
+
+    delay = min(interval * 2 ** min(attempt, 32), module.params['max_interval'])
+    if backoff == 'jitter':
+        delay = random.uniform(delay / 2.0, delay)
+    return delay
+
+
 def main():
     """main entry point for module execution
     """
@@ -182,7 +273,11 @@ def main():
         match=dict(default='all', choices=['all', 'any']),
 
         retries=dict(default=10, type='int'),
-        interval=dict(default=1, type='int')
+        interval=dict(default=1, type='int'),
+        backoff=dict(default='none', choices=['none', 'exponential', 'jitter']),
+        max_interval=dict(default=30, type='int'),
+        wait_timeout=dict(type='int'),
+        rerun=dict(default='all', choices=['all', 'pending'])
     )
 
     module = AnsibleModule(argument_spec=argument_spec,
@@ -200,11 +295,18 @@ def main():
     except AttributeError as exc:
         module.fail_json(msg=to_text(exc))
     retries = module.params['retries']
-    interval = module.params['interval']
     match = module.params['match']
+    rerun = module.params['rerun']
+    wait_timeout = module.params['wait_timeout']
+    deadline = time.time() + wait_timeout if wait_timeout is not None else None
 
+    responses = [None] * len(commands)
+    pending = list(range(len(commands)))
+    attempt = 0
     while retries > 0:
-        responses = run_commands(module, commands)
+        pending_responses = run_commands(module, [commands[idx] for idx in pending])
+        for idx, response in zip(pending, pending_responses):
+            responses[idx] = response
         for item in list(conditionals):
             if item(responses):
                 if match == 'any':
@@ -215,8 +317,17 @@ def main():
         if not conditionals:
             break
 
-        time.sleep(interval)
         retries -= 1
+        if retries == 0:
+            break
+
+        delay = get_retry_interval(module, attempt)
+        if deadline is not None and time.time() + delay > deadline:
+            break
+        time.sleep(delay)
+        attempt += 1
+        if rerun == 'pending':
+            pending = get_pending_commands(commands, conditionals)
 
     if conditionals:
         failed_conditions = [item.raw for item in conditionals]
@@ -15,6 +15,13 @@ version_added: 1.0.0
 notes:
 - Tested against Enterprise SONiC Distribution by Dell Technologies.
 - Supports C(check_mode).
+- When C(ansible_network_single_user_mode) is enabled, the running configuration and the
+  configuration blocks looked up with I(parents) are cached by the connection, and reused
+  by the following tasks until a configuration command is sent through the connection.
+- When I(parents) is set and the C(sonic_config_section_retrieval) option of the sonic
+  cliconf plugin is enabled, only the section of the running configuration containing the
+  I(parents) block is retrieved from the device if a section-filtered form of
+  C(show running-config) exists for it.
 author: Abirami N (@abirami-n)
 short_description: Manages configuration sections on devices running Enterprise SONiC
 description:
@@ -196,7 +203,7 @@ from ansible.module_utils.connection import ConnectionError
 
 from ansible.module_utils._text import to_text
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import get_config, get_sublevel_config
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import get_config, get_config_section, get_sublevel_config
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.sonic import edit_config, run_commands
 from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils import command_list_str_to_dict
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import NetworkConfig, dumps
@@ -273,12 +280,16 @@ def main():
     candidate = get_candidate(module)
     if any((module.params['lines'], module.params['src'])):
         if match != 'none':
-            config = get_running_config(module)
-            if parents:
-                contents = get_sublevel_config(config, module)
+            if parents and not module.params['config']:
+                contents = get_config_section(module, parents)
                 config = NetworkConfig(contents=contents, indent=1)
             else:
-                config = NetworkConfig(contents=config, indent=1)
+                config = get_running_config(module)
+                if parents:
+                    contents = get_sublevel_config(config, module)
+                    config = NetworkConfig(contents=contents, indent=1)
+                else:
+                    config = NetworkConfig(contents=config, indent=1)
             configobjs = candidate.difference(config, match=match, replace=replace)
         else:
 
@@ -35,6 +35,8 @@ module: sonic_dhcp_snooping
 version_added: 2.3.0
 notes:
   - "Tested against Enterprise SONiC Distribution by Dell Technologies."
+  - "The source bindings are read from the device, and reported in the before and after configuration,
+    only when the task specifies source bindings, deletes all the configuration of an address family or is run with overridden state."
 short_description: "Manage DHCP Snooping on SONiC"
 description: "This module provides configuration management of DHCP snooping for devices running SONiC."
 author: Simon Nathans (@simon-nathans), Xiao Han (@Xiao_Han2)
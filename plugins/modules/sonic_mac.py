@@ -95,6 +95,14 @@ options:
                 description:
                   - Specifies the interface for the MAC table entry.
                 type: str
+  configured_entries_only:
+    description:
+      - Specifies whether only the configured (static) MAC table entries are retrieved from the device.
+      - When C(false), the dynamically learned MAC table entries are also retrieved and are part of the
+        current configuration the I(config) is compared against.
+    type: bool
+    default: false
+    version_added: 2.3.0
   state:
     description:
       - The state of the configuration after module completion
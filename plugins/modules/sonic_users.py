@@ -75,6 +75,17 @@ options:
           - always
           - on_create
         default: always
+  password_fingerprint_cache:
+    description:
+      - Specifies the path of a file on the controller in which salted fingerprints of the passwords sent to the devices are kept.
+      - The file can be shared by all the devices of an inventory; the entries are keyed by the host of each device.
+      - When specified, the password of an existing user with I(update_password=always) is not sent again
+        if it matches the fingerprint stored by a previous run.
+      - A password changed on the device by other means is not detected while its fingerprint is cached.
+      - The fingerprints can be used to verify guessed passwords offline. The file is created readable
+        by its owner only and must be kept protected like the passwords themselves.
+    type: path
+    version_added: 2.3.0
   state:
     description:
       - Specifies the operation to be performed on the users configured on the device.
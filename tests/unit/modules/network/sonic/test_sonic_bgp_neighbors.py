@@ -13,6 +13,12 @@ from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils impor
 )
 from .sonic_module import TestSonicModule
 
+NETWORK_INSTANCE_URL = '/data/openconfig-network-instance:network-instances/network-instance={0}'
+BGP_URL = NETWORK_INSTANCE_URL + '/protocols/protocol=BGP,bgp/bgp'
+
+SCALE_VRF_COUNT = 3
+SCALE_NBR_COUNT = 50
+
 
 class TestSonicBgpModule(TestSonicModule):
     module = sonic_bgp_neighbors
@@ -73,3 +79,107 @@ class TestSonicBgpModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['deleted_02']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    def test_sonic_bgp_neighbors_deleted_03(self):
+        set_module_args(self.fixture_data['deleted_03']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_03']['existing_bgp_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_03']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    @staticmethod
+    def build_scale_neighbors_config(nbr_count):
+        """Build the REST representation of 'nbr_count' BGP neighbors.
+        The transport attributes of the odd numbered neighbors are only
+        reported in the 'state' container."""
+        neighbors = []
+        for nbr_idx in range(nbr_count):
+            nbr_addr = '10.{0}.{1}.1'.format(nbr_idx // 256, nbr_idx % 256)
+            transport_key = 'state' if nbr_idx % 2 else 'config'
+            neighbors.append({
+                'neighbor-address': nbr_addr,
+                'config': {
+                    'neighbor-address': nbr_addr,
+                    'description': 'nbr{0}'.format(nbr_idx),
+                    'peer-as': 65000 + nbr_idx,
+                    'enforce-first-as': True
+                },
+                'timers': {
+                    'config': {
+                        'hold-time': 90,
+                        'keepalive-interval': 30
+                    }
+                },
+                'transport': {
+                    transport_key: {
+                        'passive-mode': True
+                    }
+                }
+            })
+
+        return {'openconfig-network-instance:neighbors': {'neighbor': neighbors}}
+
+    def test_sonic_bgp_neighbors_merged_scale(self):
+        # Update the description of one neighbor of each VRF in a
+        # 3 VRF x 50 neighbor configuration.
+        vrfs = ['default'] + ['Vrf{0}'.format(vrf_idx) for vrf_idx in range(1, SCALE_VRF_COUNT)]
+        neighbors_config = self.build_scale_neighbors_config(SCALE_NBR_COUNT)
+        facts_requests = [{
+            'path': 'data/sonic-vrf:sonic-vrf/VRF/VRF_LIST',
+            'response': {
+                'code': 200,
+                'value': {'sonic-vrf:VRF_LIST': [{'vrf_name': vrf_name} for vrf_name in vrfs]}
+            }
+        }]
+        module_config = []
+        expected_requests = []
+        for vrf_name in vrfs:
+            bgp_url = BGP_URL.format(vrf_name)
+            facts_requests.append({
+                'path': bgp_url + '/global/config',
+                'response': {'code': 200, 'value': {'openconfig-network-instance:config': {'as': 51}}}
+            })
+            facts_requests.append({
+                'path': bgp_url + '/neighbors',
+                'response': {'code': 200, 'value': neighbors_config}
+            })
+            facts_requests.append({
+                'path': bgp_url + '/peer-groups',
+                'response': {'code': 200}
+            })
+            module_config.append({
+                'bgp_as': 51,
+                'vrf_name': vrf_name,
+                'neighbors': [{'neighbor': '10.0.1.1', 'nbr_description': 'updated'}]
+            })
+            # passive defaults to false in the module arguments
+            expected_requests.append({
+                'path': bgp_url + '/neighbors',
+                'method': 'patch',
+                'data': {
+                    'openconfig-network-instance:neighbors': {
+                        'neighbor': [{
+                            'neighbor-address': '10.0.1.1',
+                            'config': {'neighbor-address': '10.0.1.1', 'description': 'updated'},
+                            'transport': {'config': {'passive-mode': False}}
+                        }]
+                    }
+                }
+            })
+
+        set_module_args({'config': module_config, 'state': 'merged'})
+        self.initialize_facts_get_requests(facts_requests)
+        self.initialize_config_requests(expected_requests)
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+        # The attributes missing from the 'config' container are read
+        # from the 'state' container
+        before = dict((conf['vrf_name'], conf) for conf in result['before'])
+        self.assertEqual(sorted(before), sorted(vrfs))
+        neighbors = dict((nbr['neighbor'], nbr) for nbr in before[vrfs[-1]]['neighbors'])
+        self.assertEqual(len(neighbors), SCALE_NBR_COUNT)
+        for nbr_addr in ('10.0.2.1', '10.0.3.1'):
+            self.assertEqual(neighbors[nbr_addr]['passive'], True)
+            self.assertEqual(neighbors[nbr_addr]['timers'], {'holdtime': 90, 'keepalive': 30})
+            self.assertEqual(neighbors[nbr_addr]['remote_as'], {'peer_as': 65000 + int(nbr_addr.split('.')[2])})
@@ -2,6 +2,8 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+from copy import deepcopy
+
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
     patch,
 )
@@ -29,6 +31,13 @@ class TestSonicInterfacesModule(TestSonicModule):
 
         for cmd in commands:
             self.config_commands_sent.append(cmd['command'])
+        if self.command_responses:
+            # Successive responses of each command, the last one is repeated
+            responses = []
+            for cmd in commands:
+                cmd_responses = self.command_responses[cmd['command']]
+                responses.append(cmd_responses.pop(0) if len(cmd_responses) > 1 else cmd_responses[0])
+            return responses
         # Purpose of the Unit testing for sonic_command is to check whether the passed command goes to device.
         # Response from device is validated against the expected values.
         # Simulate a dummy return value for the "show version" command that is being unit tested.
@@ -45,6 +54,7 @@ class TestSonicInterfacesModule(TestSonicModule):
         super(TestSonicInterfacesModule, self).setUp()
         self.config_commands_sent = []
         self.config_commands_valid = []
+        self.command_responses = {}
         self.run_commands = self.mock_run_commands.start()
         self.run_commands.side_effect = self.run_commands_side_effect
 
@@ -57,3 +67,21 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.config_commands_valid = self.fixture_data['merged_01']['expected_command_requests']
         result = self.execute_module(changed=False)
         self.validate_config_commands()
+
+    def test_sonic_commands_rerun_pending_01(self):
+        set_module_args(self.fixture_data['rerun_pending_01']['module_args'])
+        self.command_responses = deepcopy(self.fixture_data['rerun_pending_01']['command_responses'])
+        self.config_commands_valid = self.fixture_data['rerun_pending_01']['expected_command_requests']
+        result = self.execute_module(changed=False)
+        self.validate_config_commands()
+        self.assertEqual(result['stdout'], self.fixture_data['rerun_pending_01']['expected_stdout'])
+
+    def test_sonic_commands_backoff_01(self):
+        set_module_args(self.fixture_data['backoff_01']['module_args'])
+        self.command_responses = deepcopy(self.fixture_data['backoff_01']['command_responses'])
+        self.config_commands_valid = self.fixture_data['backoff_01']['expected_command_requests']
+        self.execute_module(failed=True)
+        self.validate_config_commands()
+        # time.sleep is mocked by ModuleTestCase
+        intervals = [call[0][0] for call in sonic_command.time.sleep.call_args_list]
+        self.assertEqual(intervals, self.fixture_data['backoff_01']['expected_intervals'])
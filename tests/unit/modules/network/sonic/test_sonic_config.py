@@ -22,6 +22,9 @@ class TestSonicInterfacesModule(TestSonicModule):
         cls.mock_get_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.modules.sonic_config.get_config"
         )
+        cls.mock_get_config_section = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.modules.sonic_config.get_config_section"
+        )
         cls.mock_edit_config = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.modules.sonic_config.edit_config"
         )
@@ -54,6 +57,8 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.config_commands_valid = []
         self.get_config = self.mock_get_config.start()
         self.get_config.return_value = "show running-configuration\nip load-share hash ipv4 ipv4-dst-ip"
+        self.get_config_section = self.mock_get_config_section.start()
+        self.get_config_section.return_value = ""
         self.edit_config = self.mock_edit_config.start()
         self.edit_config.side_effect = self.edit_config_side_effect
         self.run_commands = self.mock_run_commands.start()
@@ -62,6 +67,7 @@ class TestSonicInterfacesModule(TestSonicModule):
     def tearDown(self):
         super(TestSonicInterfacesModule, self).tearDown()
         self.mock_get_config.stop()
+        self.mock_get_config_section.stop()
         self.mock_edit_config.stop()
         self.mock_run_commands.stop()
 
@@ -76,3 +82,12 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.config_commands_valid = self.fixture_data['merged_02']['expected_commands_to_device']
         result = self.execute_module(changed=True)
         self.validate_config_commands()
+
+    def test_sonic_config_merged_03(self):
+        set_module_args(self.fixture_data['merged_03']['module_args'])
+        self.get_config_section.return_value = self.fixture_data['merged_03']['existing_config_section']
+        self.config_commands_valid = self.fixture_data['merged_03']['expected_commands_to_device']
+        result = self.execute_module(changed=True)
+        self.validate_config_commands()
+        self.get_config_section.assert_called_once()
+        self.get_config.assert_not_called()
@@ -76,6 +76,19 @@ class TestSonicDhcpSnoopingModule(TestSonicModule):
         result = self.execute_module(changed=False)
         self.validate_config_requests()
 
+    def test_sonic_dhcp_snooping_merged_05(self):
+        # The binding table is not fetched when the source bindings are not
+        # configured by the task
+        test_name = "merged_05_trusted_only"
+        set_module_args(self.fixture_data[test_name]['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data[test_name]['existing_config'])
+        self.initialize_config_requests(self.fixture_data[test_name]['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        for call in self.facts_edit_config.call_args_list:
+            for command in call[0][1]:
+                self.assertNotIn('dhcp-snooping-binding', command['path'])
+
     def test_sonic_dhcp_snooping_deleted_01(self):
         test_name = "deleted_01"
         set_module_args(self.fixture_data[test_name]['module_args'])
@@ -80,6 +80,8 @@ class TestSonicPortBreakoutModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['replaced_01']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+        # Breakout modes are retrieved once before and once after the change
+        self.assertEqual(self.utils_edit_config.call_count, 2)
 
     def test_sonic_port_breakout_overridden_01(self):
         set_module_args(self.fixture_data['overridden_01']['module_args'])
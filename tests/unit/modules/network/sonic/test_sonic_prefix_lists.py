@@ -13,6 +13,9 @@ from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils impor
 )
 from .sonic_module import TestSonicModule
 
+PREFIX_SETS_URL = 'data/openconfig-routing-policy:routing-policy/defined-sets/prefix-sets'
+PREFIX_SET_URL = PREFIX_SETS_URL + '/prefix-set'
+
 
 class TestSonicInterfacesModule(TestSonicModule):
     module = sonic_prefix_lists
@@ -54,6 +57,15 @@ class TestSonicInterfacesModule(TestSonicModule):
         result = self.execute_module(changed=True)
         self.validate_config_requests()
 
+    def test_sonic_prefix_lists_merged_02(self):
+        # Prefixes without 'ge'/'le' and prefixes whose action is changed
+        set_module_args(self.fixture_data['merged_02']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_02']['existing_prefix_lists_config'])
+        self.initialize_config_requests(self.fixture_data['merged_02']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+        self.assertEqual(result['commands'], self.fixture_data['merged_02']['expected_commands'])
+
     def test_sonic_prefix_lists_deleted_01(self):
         set_module_args(self.fixture_data['deleted_01']['module_args'])
         self.initialize_facts_get_requests(self.fixture_data['deleted_01']['existing_prefix_lists_config'])
@@ -67,3 +79,83 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['deleted_02']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    @staticmethod
+    def build_scale_prefixes(start, stop):
+        """Build the module and REST representations of the IPv4 prefixes
+        with sequence numbers in the range 'start' to 'stop' - 1"""
+        prefixes = []
+        prefix_payloads = []
+        for sequence in range(start, stop):
+            prefix = '10.{0}.{1}.0/24'.format(sequence // 256, sequence % 256)
+            prefixes.append({'sequence': sequence, 'prefix': prefix, 'action': 'permit'})
+            prefix_payloads.append({
+                'ip-prefix': prefix,
+                'sequence-number': sequence,
+                'masklength-range': 'exact',
+                'config': {
+                    'sequence-number': sequence,
+                    'ip-prefix': prefix,
+                    'masklength-range': 'exact',
+                    'openconfig-routing-policy-ext:action': 'PERMIT'
+                }
+            })
+
+        return prefixes, prefix_payloads
+
+    def test_sonic_prefix_lists_merged_chunked(self):
+        # Merge 400 prefixes, 150 of which are already configured, into a
+        # prefix set. The 250 new prefixes are split across three requests.
+        existing_prefixes, existing_payloads = self.build_scale_prefixes(1, 151)
+        new_prefixes, new_payloads = self.build_scale_prefixes(151, 401)
+        for prefix_payload in existing_payloads:
+            prefix_payload['config']['action'] = prefix_payload['config'].pop('openconfig-routing-policy-ext:action')
+        prefix_set_config = {'name': 'pfx_scale', 'mode': 'IPV4'}
+
+        set_module_args({
+            'config': [{
+                'name': 'pfx_scale',
+                'afi': 'ipv4',
+                'prefixes': existing_prefixes + new_prefixes
+            }],
+            'state': 'merged'
+        })
+        self.initialize_facts_get_requests([{
+            'path': PREFIX_SETS_URL,
+            'response': {
+                'code': 200,
+                'value': {
+                    'openconfig-routing-policy:prefix-sets': {
+                        'prefix-set': [{
+                            'name': 'pfx_scale',
+                            'config': prefix_set_config,
+                            'openconfig-routing-policy-ext:extended-prefixes': {
+                                'extended-prefix': existing_payloads
+                            }
+                        }]
+                    }
+                }
+            }
+        }])
+        self.initialize_config_requests([
+            {
+                'path': PREFIX_SET_URL,
+                'method': 'patch',
+                'data': {
+                    'openconfig-routing-policy:prefix-set': [{
+                        'name': 'pfx_scale',
+                        'config': prefix_set_config,
+                        'openconfig-routing-policy-ext:extended-prefixes': {
+                            'extended-prefix': new_payloads[chunk_start:chunk_start + 100]
+                        }
+                    }]
+                }
+            }
+            for chunk_start in (0, 100, 200)
+        ])
+        with patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.prefix_lists.prefix_lists.PREFIX_CHUNK_SIZE",
+            100
+        ):
+            result = self.execute_module(changed=True)
+        self.validate_config_requests()
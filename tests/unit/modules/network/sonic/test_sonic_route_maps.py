@@ -0,0 +1,199 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
+    patch,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.modules import (
+    sonic_route_maps,
+)
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils import (
+    set_module_args,
+)
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.route_maps.route_maps import (
+    Route_maps,
+)
+from .sonic_module import TestSonicModule
+
+ROUTE_MAPS_URL = 'data/openconfig-routing-policy:routing-policy/policy-definitions'
+ROUTE_MAP_STMT_URL = ROUTE_MAPS_URL + '/policy-definition={0}/statements/statement={1}'
+
+SCALE_MAP_COUNT = 10
+SCALE_STMT_COUNT = 10
+
+
+class TestSonicRouteMapsModule(TestSonicModule):
+    module = sonic_route_maps
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mock_facts_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.facts.route_maps.route_maps.edit_config"
+        )
+        cls.mock_config_edit_config = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.route_maps.route_maps.edit_config"
+        )
+        cls.mock_get_interface_naming_mode = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils.get_device_interface_naming_mode"
+        )
+        cls.fixture_data = cls.load_fixtures('sonic_route_maps.yaml')
+
+    def setUp(self):
+        super(TestSonicRouteMapsModule, self).setUp()
+        self.facts_edit_config = self.mock_facts_edit_config.start()
+        self.config_edit_config = self.mock_config_edit_config.start()
+        self.facts_edit_config.side_effect = self.facts_side_effect
+        self.config_edit_config.side_effect = self.config_side_effect
+        self.get_interface_naming_mode = self.mock_get_interface_naming_mode.start()
+        self.get_interface_naming_mode.return_value = 'native'
+
+    def tearDown(self):
+        super(TestSonicRouteMapsModule, self).tearDown()
+        self.mock_facts_edit_config.stop()
+        self.mock_config_edit_config.stop()
+        self.mock_get_interface_naming_mode.stop()
+
+    def test_sonic_route_maps_merged_01(self):
+        set_module_args(self.fixture_data['merged_01']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['merged_01']['existing_route_maps_config'])
+        self.initialize_config_requests(self.fixture_data['merged_01']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_route_maps_replaced_01(self):
+        set_module_args(self.fixture_data['replaced_01']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['replaced_01']['existing_route_maps_config'])
+        self.initialize_config_requests(self.fixture_data['replaced_01']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_route_maps_replaced_02(self):
+        set_module_args(self.fixture_data['replaced_02']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['replaced_02']['existing_route_maps_config'])
+        self.initialize_config_requests(self.fixture_data['replaced_02']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_route_maps_replaced_03(self):
+        set_module_args(self.fixture_data['replaced_03']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['replaced_03']['existing_route_maps_config'])
+        self.initialize_config_requests(self.fixture_data['replaced_03']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    def test_sonic_route_maps_deleted_01(self):
+        set_module_args(self.fixture_data['deleted_01']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_01']['existing_route_maps_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_01']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+    @staticmethod
+    def build_scale_route_maps_config(map_count, stmt_count):
+        """Build the REST representation of 'map_count' route maps with
+        'stmt_count' statements each"""
+        policy_definitions = []
+        for map_idx in range(map_count):
+            map_name = 'rmap{0}'.format(map_idx)
+            statements = []
+            for seq_num in range(1, stmt_count + 1):
+                statements.append({
+                    'name': str(seq_num),
+                    'config': {'name': str(seq_num)},
+                    'actions': {
+                        'config': {'policy-result': 'ACCEPT_ROUTE'},
+                        'metric-action': {
+                            'config': {
+                                'action': 'openconfig-routing-policy:METRIC_SET_VALUE',
+                                'metric': seq_num
+                            }
+                        }
+                    }
+                })
+            policy_definitions.append({
+                'name': map_name,
+                'config': {'name': map_name},
+                'statements': {'statement': statements}
+            })
+
+        return {
+            'openconfig-routing-policy:policy-definitions': {
+                'policy-definition': policy_definitions
+            }
+        }
+
+    def test_sonic_route_maps_deleted_scale(self):
+        # Delete the 'set' attributes of every other statement, every
+        # remaining statement of the even numbered maps and all of the
+        # odd numbered maps in a 10 route map x 10 statement configuration,
+        # and check that each list of statements is indexed only once.
+        # The functional delete cases are covered by the deleted_01 fixture.
+        module_config = []
+        expected_requests = []
+        for map_idx in range(SCALE_MAP_COUNT):
+            map_name = 'rmap{0}'.format(map_idx)
+            if map_idx % 2:
+                module_config.append({'map_name': map_name})
+                expected_requests.append({
+                    'path': ROUTE_MAPS_URL + '/policy-definition={0}'.format(map_name),
+                    'method': 'delete'
+                })
+                continue
+
+            for seq_num in range(1, SCALE_STMT_COUNT + 1):
+                stmt_url = ROUTE_MAP_STMT_URL.format(map_name, seq_num)
+                if seq_num % 2:
+                    module_config.append({
+                        'map_name': map_name,
+                        'sequence_num': seq_num,
+                        'action': 'permit',
+                        'set': {'metric': {'value': seq_num}}
+                    })
+                    expected_requests.append({
+                        'path': stmt_url + '/actions/metric-action/config',
+                        'method': 'delete'
+                    })
+                    expected_requests.append({
+                        'path': stmt_url + '/actions/openconfig-bgp-policy:bgp-actions/config/set-med',
+                        'method': 'delete'
+                    })
+                else:
+                    module_config.append({
+                        'map_name': map_name,
+                        'sequence_num': seq_num
+                    })
+                    expected_requests.append({'path': stmt_url, 'method': 'delete'})
+
+        # A statement not present in the current configuration
+        module_config.append({'map_name': 'rmap0', 'sequence_num': SCALE_STMT_COUNT + 1})
+
+        set_module_args({'config': module_config, 'state': 'deleted'})
+        self.initialize_facts_get_requests([{
+            'path': ROUTE_MAPS_URL,
+            'response': {
+                'code': 200,
+                'value': self.build_scale_route_maps_config(SCALE_MAP_COUNT, SCALE_STMT_COUNT)
+            }
+        }])
+        self.initialize_config_requests(expected_requests)
+
+        get_route_map_index = Route_maps.get_route_map_index
+        index_lookups = {}
+        index_builds = {}
+
+        def count_index_builds(rmaps_obj, input_list):
+            list_id = id(input_list)
+            index_entry = rmaps_obj._route_map_indexes.get(list_id)
+            if index_entry is None or index_entry['list'] is not input_list or index_entry['size'] != len(input_list):
+                index_builds[list_id] = index_builds.get(list_id, 0) + 1
+            index_lookups[list_id] = index_lookups.get(list_id, 0) + 1
+            return get_route_map_index(rmaps_obj, input_list)
+
+        with patch.object(Route_maps, 'get_route_map_index', autospec=True, side_effect=count_index_builds):
+            self.execute_module(changed=True)
+        self.validate_config_requests()
+
+        self.assertTrue(index_builds)
+        self.assertEqual(set(index_builds.values()), {1})
+        self.assertGreater(sum(index_lookups.values()), len(index_builds))
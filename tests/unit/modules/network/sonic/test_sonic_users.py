@@ -2,12 +2,22 @@ from __future__ import absolute_import, division, print_function
 
 __metaclass__ = type
 
+import json
+import os
+import shutil
+import tempfile
+
+from ansible.module_utils.common.warnings import get_warning_messages
+from ansible.module_utils.connection import ConnectionError
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat.mock import (
     patch,
 )
 from ansible_collections.dellemc.enterprise_sonic.plugins.modules import (
     sonic_users,
 )
+from ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.users.users import (
+    Users,
+)
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils import (
     set_module_args,
 )
@@ -31,6 +41,9 @@ class TestSonicInterfacesModule(TestSonicModule):
         cls.mock_get_interface_naming_mode = patch(
             "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.utils.utils.get_device_interface_naming_mode"
         )
+        cls.mock_get_connection = patch(
+            "ansible_collections.dellemc.enterprise_sonic.plugins.module_utils.network.sonic.config.users.users.get_connection"
+        )
         cls.fixture_data = cls.load_fixtures('sonic_users.yaml')
 
     def setUp(self):
@@ -43,6 +56,8 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.get_interface_naming_mode.return_value = 'standard'
         self.utils_edit_config = self.mock_utils_edit_config.start()
         self.utils_edit_config.side_effect = self.facts_side_effect
+        self.get_connection = self.mock_get_connection.start()
+        self.get_connection.return_value.get_option.return_value = 'sonic1'
 
     def tearDown(self):
         super(TestSonicInterfacesModule, self).tearDown()
@@ -50,6 +65,7 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.mock_config_edit_config.stop()
         self.mock_get_interface_naming_mode.stop()
         self.mock_utils_edit_config.stop()
+        self.mock_get_connection.stop()
 
     def test_sonic_users_merged_01(self):
         set_module_args(self.fixture_data['merged_01']['module_args'])
@@ -71,3 +87,75 @@ class TestSonicInterfacesModule(TestSonicModule):
         self.initialize_config_requests(self.fixture_data['deleted_02']['expected_config_requests'])
         result = self.execute_module(changed=True)
         self.validate_config_requests()
+
+    def test_sonic_users_merged_02(self):
+        # Existing users whose password matches the controller side
+        # fingerprint cache are not sent the password again
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache_path = os.path.join(cache_dir, 'passwords.json')
+        fingerprints = {}
+        for name, password in self.fixture_data['merged_02']['cached_passwords'].items():
+            fingerprints[name] = {'salt': '00' * 16, 'fingerprint': Users.get_password_fingerprint(password, '00' * 16)}
+        with open(cache_path, 'w') as cache_file:
+            json.dump({'sonic1': fingerprints, 'sonic2': {}}, cache_file)
+
+        module_args = dict(self.fixture_data['merged_02']['module_args'])
+        module_args['password_fingerprint_cache'] = cache_path
+        set_module_args(module_args)
+        self.initialize_facts_get_requests(self.fixture_data['merged_02']['existing_users_config'])
+        self.initialize_config_requests(self.fixture_data['merged_02']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
+        with open(cache_path) as cache_file:
+            cache = json.load(cache_file)
+        self.assertEqual(sorted(cache), ['sonic1', 'sonic2'])
+        self.assertEqual(sorted(cache['sonic1']), ['sysadmin', 'sysoperator', 'sysuser'])
+        sysuser = cache['sonic1']['sysuser']
+        self.assertEqual(sysuser['fingerprint'], Users.get_password_fingerprint('user', sysuser['salt']))
+
+    def test_sonic_users_merged_03(self):
+        # The fingerprint cache is not used, with a warning, when the
+        # host of the device cannot be retrieved
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache_path = os.path.join(cache_dir, 'passwords.json')
+        self.get_connection.return_value.get_option.side_effect = ConnectionError('socket path not found')
+
+        module_args = dict(self.fixture_data['merged_01']['module_args'])
+        module_args['password_fingerprint_cache'] = cache_path
+        set_module_args(module_args)
+        self.initialize_facts_get_requests(self.fixture_data['merged_01']['existing_users_config'])
+        self.initialize_config_requests(self.fixture_data['merged_01']['expected_config_requests'])
+        self.execute_module(changed=True)
+        self.validate_config_requests()
+        self.assertTrue(any('Password fingerprint cache not used' in warning for warning in get_warning_messages()))
+        self.assertFalse(os.path.exists(cache_path))
+
+    def test_sonic_users_merged_04(self):
+        # The password of an existing user that does not match the cached
+        # fingerprint is checked once and fingerprinted once more for the cache
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache_path = os.path.join(cache_dir, 'passwords.json')
+        fingerprints = {}
+        for name, password in self.fixture_data['merged_04']['cached_passwords'].items():
+            fingerprints[name] = {'salt': '00' * 16, 'fingerprint': Users.get_password_fingerprint(password, '00' * 16)}
+        with open(cache_path, 'w') as cache_file:
+            json.dump({'sonic1': fingerprints}, cache_file)
+
+        module_args = dict(self.fixture_data['merged_04']['module_args'])
+        module_args['password_fingerprint_cache'] = cache_path
+        set_module_args(module_args)
+        self.initialize_facts_get_requests(self.fixture_data['merged_04']['existing_users_config'])
+        self.initialize_config_requests(self.fixture_data['merged_04']['expected_config_requests'])
+        with patch.object(Users, 'get_password_fingerprint', side_effect=Users.get_password_fingerprint) as get_fingerprint:
+            self.execute_module(changed=True)
+        self.validate_config_requests()
+        self.assertEqual(get_fingerprint.call_count, 2)
+
+        with open(cache_path) as cache_file:
+            cache = json.load(cache_file)
+        sysadmin = cache['sonic1']['sysadmin']
+        self.assertEqual(sysadmin['fingerprint'], Users.get_password_fingerprint('admin', sysadmin['salt']))
@@ -11,6 +11,7 @@ from ansible_collections.dellemc.enterprise_sonic.plugins.modules import (
 from ansible_collections.dellemc.enterprise_sonic.tests.unit.modules.utils import (
     set_module_args,
 )
+from ansible.module_utils.connection import ConnectionError
 from .sonic_module import TestSonicModule
 
 
@@ -72,6 +73,20 @@ class TestSonicInterfacesModule(TestSonicModule):
         result = self.execute_module(changed=True)
         self.validate_config_requests()
 
+    def test_sonic_vrfs_deleted_03(self):
+        # The device does not support the 'fields' query parameter
+        def facts_side_effect(module, commands):
+            if any('?fields=' in command['path'] for command in commands):
+                raise ConnectionError('Invalid query parameter', code=400)
+            return self.facts_side_effect(module, commands)
+
+        self.facts_edit_config.side_effect = facts_side_effect
+        set_module_args(self.fixture_data['deleted_03']['module_args'])
+        self.initialize_facts_get_requests(self.fixture_data['deleted_03']['existing_vrfs_config'])
+        self.initialize_config_requests(self.fixture_data['deleted_03']['expected_config_requests'])
+        result = self.execute_module(changed=True)
+        self.validate_config_requests()
+
     def test_sonic_vrfs_replaced_01(self):
         set_module_args(self.fixture_data['replaced_01']['module_args'])
         self.initialize_facts_get_requests(self.fixture_data['replaced_01']['existing_vrfs_config'])
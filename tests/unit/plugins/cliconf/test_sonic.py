@@ -0,0 +1,201 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible.errors import AnsibleConnectionFailure
+from ansible.plugins.loader import cliconf_loader
+from ansible_collections.dellemc.enterprise_sonic.tests.unit.compat import unittest
+from ansible_collections.dellemc.enterprise_sonic.plugins.cliconf.sonic import Cliconf
+
+RUNNING_CONFIG = """interface Ethernet0
+ mtu 9100
+!
+router bgp 65000
+ router-id 1.1.1.1
+ address-family ipv4 unicast
+  maximum-paths 4
+!
+"""
+
+BGP_RUNNING_CONFIG = """!
+router bgp 65000
+ router-id 1.1.1.1
+ address-family ipv4 unicast
+  maximum-paths 4
+!
+"""
+
+BATCH = [b'interface Ethernet0', b'mtu 9100', b'description uplink']
+
+# Device output for BATCH, one chunk per receive; each receive ends at a prompt
+BATCH_OUTPUT = [
+    b'interface Ethernet0\r\nsonic(conf-if-Ethernet0)# ',
+    b'mtu 9100\r\nsonic(conf-if-Ethernet0)# ',
+    b'description uplink\r\nsonic(conf-if-Ethernet0)# ',
+]
+
+
+class FakeConnection(object):
+    """Replays canned device output, one chunk per receive"""
+
+    def __init__(self, chunks=None, responses=None):
+        self.chunks = list(chunks or [])
+        self.responses = responses or {}
+        self.sent = []
+        self.options = {'terminal_stderr_re': None, 'single_user_mode': False}
+
+    def get_option(self, option):
+        return self.options[option]
+
+    def set_option(self, option, value):
+        self.options[option] = value
+
+    def get_prompt(self):
+        return b'sonic#'
+
+    def send(self, command, sendonly=False, **kwargs):
+        self.sent.append(command)
+        if sendonly:
+            return None
+        response = self.responses.get(command, b'')
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+    def receive(self, strip_prompt=True, **kwargs):
+        if not self.chunks:
+            raise AnsibleConnectionFailure('command timeout triggered')
+        return self.chunks.pop(0)
+
+
+class TestSonicCliconf(unittest.TestCase):
+
+    def send_config_batch(self, chunks, commands=None):
+        connection = FakeConnection(chunks)
+        cliconf = Cliconf(connection)
+        commands = commands or BATCH
+        try:
+            return cliconf.send_config_batch(commands)
+        finally:
+            self.assertEqual(connection.sent, [b'\r'.join(commands)])
+            self.assertIsNone(connection.options['terminal_stderr_re'])
+
+    def test_split_batch_output(self):
+        outputs = Cliconf.split_batch_output(b'\n' + b''.join(BATCH_OUTPUT), BATCH)
+        self.assertEqual([out.strip() for out in outputs], [b'', b'', b''])
+
+    def test_split_batch_output_incomplete(self):
+        self.assertIsNone(Cliconf.split_batch_output(b'\n' + b''.join(BATCH_OUTPUT[:2]), BATCH))
+        self.assertEqual(len(Cliconf.find_batch_echoes(b'\n' + b''.join(BATCH_OUTPUT[:2]), BATCH)), 2)
+
+    def test_split_batch_output_with_command_output(self):
+        output = (b'\nshow clock\r\n2024-01-01 10:00:00\r\nsonic# '
+                  b'show users\r\nadmin  pts/0\r\nguest  pts/1\r\nsonic# ')
+        outputs = Cliconf.split_batch_output(output, [b'show clock', b'show users'])
+        self.assertEqual([out.strip() for out in outputs], [b'2024-01-01 10:00:00', b'admin  pts/0\nguest  pts/1'])
+
+    def test_send_config_batch(self):
+        self.assertEqual(self.send_config_batch(BATCH_OUTPUT), ['', '', ''])
+
+    def test_send_config_batch_joined_receives(self):
+        # Two commands processed in the time of a single receive
+        chunks = [BATCH_OUTPUT[0] + BATCH_OUTPUT[1], BATCH_OUTPUT[2]]
+        self.assertEqual(self.send_config_batch(chunks), ['', '', ''])
+
+    def test_send_config_batch_error_in_middle(self):
+        chunks = [
+            BATCH_OUTPUT[0],
+            b'mtu 9100\r\n%Error: Invalid MTU\r\nsonic(conf-if-Ethernet0)# ',
+            BATCH_OUTPUT[2],
+        ]
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.send_config_batch(chunks)
+        self.assertIn("command 'mtu 9100' (line 2 of batch) failed: %Error: Invalid MTU", str(exc.exception))
+
+    def test_send_config_batch_error_on_last_line(self):
+        chunks = [
+            BATCH_OUTPUT[0],
+            BATCH_OUTPUT[1],
+            b'description uplink\r\n% Error: Description too long\r\nsonic(conf-if-Ethernet0)# ',
+        ]
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.send_config_batch(chunks)
+        self.assertIn("command 'description uplink' (line 3 of batch) failed", str(exc.exception))
+
+    def test_send_config_batch_echo_not_found(self):
+        # The device rewrote the echo of the second command
+        chunks = [
+            BATCH_OUTPUT[0],
+            b'mtu   9100\r\nsonic(conf-if-Ethernet0)# ',
+            BATCH_OUTPUT[2],
+            b'unexpected\r\nsonic(conf-if-Ethernet0)# ',
+        ]
+        with self.assertRaises(AnsibleConnectionFailure) as exc:
+            self.send_config_batch(chunks)
+        self.assertIn("echo of command 'mtu 9100' (line 2 of batch) not found", str(exc.exception))
+
+    def get_config_section(self, parents, responses, **options):
+        connection = FakeConnection(responses=responses)
+        cliconf = cliconf_loader.get('dellemc.enterprise_sonic.sonic', connection)
+        cliconf.set_options(direct=options)
+        return cliconf.get_config_section(parents), connection.sent
+
+    def test_get_config_section_flags(self):
+        for parents, section in (
+            (['router bgp 65000 vrf Vrf1', 'address-family ipv4 unicast'], 'bgp'),
+            (['interface Ethernet0'], 'interface'),
+            (['interface Eth1/1'], 'interface'),
+            (['interface Vlan100'], 'interface'),
+            (['interface PortChannel1'], None),
+            (['interface Loopback0'], None),
+            (['route-map rm1 permit 10'], 'route-map rm1'),
+            (['ip access-list acl1'], 'ip access-list'),
+            (['ipv6 access-list acl1'], 'ipv6 access-list'),
+            (['mac access-list acl1'], 'mac access-list'),
+            (['vlan 10'], None),
+            ([], None),
+        ):
+            self.assertEqual(Cliconf.get_config_section_flags(parents), section, parents)
+
+    def test_get_config_section(self):
+        parents = ['router bgp 65000', 'address-family ipv4 unicast']
+        section, sent = self.get_config_section(parents, {
+            b'show running-config': RUNNING_CONFIG,
+            b'show running-config bgp': BGP_RUNNING_CONFIG,
+        }, sonic_config_section_retrieval=True)
+        self.assertEqual(section, 'router bgp 65000\n address-family ipv4 unicast\n  maximum-paths 4')
+        self.assertEqual(sent, [b'show running-config bgp'])
+
+    def test_get_config_section_disabled(self):
+        parents = ['router bgp 65000', 'address-family ipv4 unicast']
+        section, sent = self.get_config_section(parents, {
+            b'show running-config': RUNNING_CONFIG,
+            b'show running-config bgp': BGP_RUNNING_CONFIG,
+        })
+        self.assertEqual(section, 'router bgp 65000\n address-family ipv4 unicast\n  maximum-paths 4')
+        self.assertEqual(sent, [b'show running-config'])
+
+    def test_get_config_section_fallback(self):
+        # The device rejects the section-filtered form
+        parents = ['router bgp 65000', 'address-family ipv4 unicast']
+        section, sent = self.get_config_section(parents, {
+            b'show running-config': RUNNING_CONFIG,
+            b'show running-config bgp': AnsibleConnectionFailure('% Error: Invalid input detected'),
+        }, sonic_config_section_retrieval=True)
+        self.assertEqual(section, 'router bgp 65000\n address-family ipv4 unicast\n  maximum-paths 4')
+        self.assertEqual(sent, [b'show running-config bgp', b'show running-config'])
+
+    def test_get_config_section_cache(self):
+        # In single user mode the parsed running configuration is reused
+        # until a command that may modify the configuration is sent
+        connection = FakeConnection(responses={b'show running-config': RUNNING_CONFIG})
+        connection.options['single_user_mode'] = True
+        cliconf = cliconf_loader.get('dellemc.enterprise_sonic.sonic', connection)
+        self.assertEqual(cliconf.get_config_section(['interface Ethernet0']), 'interface Ethernet0\n mtu 9100')
+        self.assertEqual(cliconf.get_config_section(['router bgp 65000']), 'router bgp 65000\n router-id 1.1.1.1\n address-family ipv4 unicast')
+        cliconf.run_commands(['show version'])
+        cliconf.get_config_section(['interface Ethernet0'])
+        self.assertEqual(connection.sent, [b'show running-config', b'show version'])
+        cliconf.run_commands(['write memory'])
+        cliconf.get_config_section(['interface Ethernet0'])
+        self.assertEqual(connection.sent, [b'show running-config', b'show version', b'write memory', b'show running-config'])